@@ -0,0 +1,200 @@
+"""Two-tier response cache for AI requests.
+
+The same prompt is often sent more than once: the demo scenario, a report
+button clicked twice, or a repeated chat question. Responses are cached under
+a hash of (mode, model list, full prompt). A bounded in-process LRU answers
+repeat requests in the same process; a SQLite file keeps answers across
+restarts and is shared by every process that points at the same path. Both
+tiers honour the same TTL. Only successful responses are stored.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from contextlib import closing
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any
+
+
+def ai_cache_key(mode: str, models: Iterable[str], prompt: str) -> str:
+    """Return a stable hash of the inputs that determine an AI response."""
+    payload = json.dumps([str(mode), list(models), str(prompt)], separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AIResponseCache:
+    """Thread-safe LRU memory tier in front of an optional SQLite tier.
+
+    ``path=None`` keeps the cache in memory only. ``ttl_seconds`` applies to
+    both tiers; ``max_entries`` bounds the memory tier and
+    ``max_disk_entries`` the SQLite table, evicting least recently used
+    entries first.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        ttl_seconds: float = 24 * 3600,
+        max_entries: int = 256,
+        max_disk_entries: int = 5000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_entries < 1 or max_disk_entries < 1:
+            raise ValueError("Cache size limits must be at least 1.")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be greater than 0.")
+        self.path = path
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_entries = int(max_entries)
+        self.max_disk_entries = int(max_disk_entries)
+        self._clock = clock
+        self._entries: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if path:
+            with closing(self._connect()) as connection, connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS ai_responses ("
+                    "key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+                    "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+                )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5.0)
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return now - created_at >= self.ttl_seconds
+
+    def _remember(self, key: str, created_at: float, response: str) -> None:
+        self._entries[key] = (created_at, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key: str) -> str | None:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self._expired(entry[0], now):
+                    self._entries.move_to_end(key)
+                    self.memory_hits += 1
+                    return entry[1]
+                del self._entries[key]
+            if not self.path:
+                self.misses += 1
+                return None
+
+        # SQLite is read outside the lock so one slow disk lookup does not
+        # stall memory hits in other sessions.
+        try:
+            with closing(self._connect()) as connection, connection:
+                row = connection.execute(
+                    "SELECT response, created_at FROM ai_responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None and self._expired(row[1], now):
+                    connection.execute("DELETE FROM ai_responses WHERE key = ?", (key,))
+                    row = None
+                if row is not None:
+                    connection.execute(
+                        "UPDATE ai_responses SET accessed_at = ? WHERE key = ?",
+                        (now, key),
+                    )
+        except sqlite3.Error:
+            row = None
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self._remember(key, row[1], row[0])
+            self.disk_hits += 1
+            return row[0]
+
+    def put(self, key: str, response: str, persist: bool = True) -> None:
+        """Store ``response``; ``persist=False`` keeps it out of the disk tier."""
+        now = self._clock()
+        with self._lock:
+            self._remember(key, now, response)
+        if not self.path or not persist:
+            return
+        try:
+            with closing(self._connect()) as connection, connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO ai_responses VALUES (?, ?, ?, ?)",
+                    (key, response, now, now),
+                )
+                connection.execute(
+                    "DELETE FROM ai_responses WHERE created_at <= ?",
+                    (now - self.ttl_seconds,),
+                )
+                deleted = connection.execute(
+                    "DELETE FROM ai_responses WHERE key IN ("
+                    "SELECT key FROM ai_responses ORDER BY accessed_at DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (self.max_disk_entries,),
+                ).rowcount
+        except sqlite3.Error:
+            # The disk tier is an optimization; the memory tier still holds the answer.
+            return
+        with self._lock:
+            self.evictions += max(0, deleted)
+
+    def get_or_request(
+        self,
+        mode: str,
+        models: Iterable[str],
+        prompt: str,
+        request: Callable[[], str],
+        persist: bool = True,
+    ) -> str:
+        """Return a cached response or call ``request`` and cache its result.
+
+        ``persist`` is passed to :meth:`put`.
+        """
+        models = list(models)
+        key = ai_cache_key(mode, models, prompt)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        response = request()
+        self.put(key, response, persist=persist)
+        return response
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hit_rate": hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.memory_hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+            self.evictions = 0
+            if self.path:
+                try:
+                    with closing(self._connect()) as connection, connection:
+                        connection.execute("DELETE FROM ai_responses")
+                except sqlite3.Error:
+                    pass
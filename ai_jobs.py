@@ -0,0 +1,180 @@
+"""Background execution for slow AI report requests.
+
+Report generation used to block the whole Streamlit session. A report is now
+submitted as a job on a process-wide thread pool: the script gets a job ID
+back at once, keeps rendering, and reads the job's status, partial text or
+result on later reruns. The pool size caps how many provider calls one
+process makes at a time.
+
+Job functions run outside the Streamlit script thread, so they must not touch
+``st.session_state``; everything they need is captured when they are
+submitted.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+import threading
+import time
+import uuid
+from typing import Any
+
+from ai_reliability import AIServiceUnavailable
+
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+FINISHED_STATES = (JOB_DONE, JOB_FAILED, JOB_CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Raised inside a job function when its job has been cancelled."""
+
+
+@dataclass
+class AIJob:
+    """One submitted request; job functions receive it to report progress."""
+
+    job_id: str
+    kind: str
+    status: str = JOB_QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    result: str | None = None
+    error_code: str = ""
+    error_message: str = ""
+    partial_text: str = ""
+    cancel_requested: bool = False
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancellation was requested; long jobs check it between steps."""
+        with self._lock:
+            return self.cancel_requested
+
+    def append_partial(self, text: str) -> None:
+        """Record streamed text; stops the job if cancellation was requested."""
+        with self._lock:
+            if self.cancel_requested:
+                raise JobCancelled(self.job_id)
+            self.partial_text += text
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "job_id": self.job_id,
+                "kind": self.kind,
+                "status": self.status,
+                "created_at": self.created_at,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "result": self.result,
+                "error_code": self.error_code,
+                "error_message": self.error_message,
+                "partial_text": self.partial_text,
+            }
+
+
+class AIJobQueue:
+    """Thread-pool job queue with IDs, status, cancellation and stored results.
+
+    ``max_workers`` bounds concurrent jobs (and so provider calls) in the
+    process. At most ``max_jobs`` jobs are kept; the oldest finished jobs are
+    dropped first.
+    """
+
+    def __init__(self, max_workers: int = 4, max_jobs: int = 200) -> None:
+        if max_workers < 1 or max_jobs < 1:
+            raise ValueError("max_workers and max_jobs must be at least 1.")
+        self.max_workers = int(max_workers)
+        self.max_jobs = int(max_jobs)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ai-job")
+        self._jobs: "OrderedDict[str, AIJob]" = OrderedDict()
+        self._futures: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, fn: Callable[[AIJob], str]) -> str:
+        """Queue ``fn(job)`` and return the new job ID."""
+        job = AIJob(job_id=uuid.uuid4().hex, kind=kind)
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._prune()
+            self._futures[job.job_id] = self._executor.submit(self._run, job, fn)
+        return job.job_id
+
+    def _run(self, job: AIJob, fn: Callable[[AIJob], str]) -> None:
+        with job._lock:
+            if job.cancel_requested:
+                job.status = JOB_CANCELLED
+                job.finished_at = time.time()
+                return
+            job.status = JOB_RUNNING
+            job.started_at = time.time()
+
+        status, result, error_code, error_message = JOB_DONE, None, "", ""
+        try:
+            result = fn(job)
+        except JobCancelled:
+            status = JOB_CANCELLED
+        except AIServiceUnavailable as error:
+            status, error_code, error_message = JOB_FAILED, error.code, error.user_message
+        except Exception:  # job functions wrap provider and formatting code
+            status, error_code = JOB_FAILED, "JOB_FAILED"
+            error_message = "The request could not be completed. Please retry in a moment."
+
+        with job._lock:
+            if job.cancel_requested:
+                status, result = JOB_CANCELLED, None
+            job.status = status
+            job.result = result
+            job.error_code = error_code
+            job.error_message = error_message
+            job.finished_at = time.time()
+        with self._lock:
+            self._futures.pop(job.job_id, None)
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        return job.snapshot() if job is not None else None
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued job, or ask a running one to stop and drop its result."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            future = self._futures.get(job_id)
+        if job is None:
+            return False
+        with job._lock:
+            if job.status in FINISHED_STATES:
+                return False
+            job.cancel_requested = True
+            if future is not None and future.cancel():
+                job.status = JOB_CANCELLED
+                job.finished_at = time.time()
+        return True
+
+    def _prune(self) -> None:
+        excess = len(self._jobs) - self.max_jobs
+        if excess <= 0:
+            return
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.status in FINISHED_STATES][:excess]:
+            del self._jobs[job_id]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            counts = {state: 0 for state in (JOB_QUEUED, JOB_RUNNING, *FINISHED_STATES)}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+        return {**counts, "max_workers": self.max_workers, "stored": sum(counts.values())}
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
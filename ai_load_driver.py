@@ -0,0 +1,94 @@
+"""Concurrent load driver for the AI request path.
+
+``run_load_test`` fires ``requests`` calls through
+:func:`ai_reliability.request_ai_text` from ``concurrency`` threads and
+reports throughput, tail latency and outcomes. Pointed at a
+:class:`fake_ai_provider.FakeAIClient` it validates hedging, caching and
+concurrency changes offline, e.g.::
+
+    client = FakeAIClient({"gemini-2.5-pro": FakeModelProfile(
+        latency=lognormal_latency(2.0, 0.8), timeout_rate=0.05, timeout_seconds=10)})
+    run_load_test(client.models.generate_content, ["gemini-2.5-pro", "gemini-2.5-flash"],
+                  requests=200, concurrency=16, hedge=HedgePolicy())
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import Any, Dict
+
+from ai_cache import AIResponseCache
+from ai_reliability import AIServiceUnavailable, HedgePolicy, ModelHealthRegistry, request_ai_text
+from ai_telemetry import PERCENTILES, latency_percentile
+
+
+def run_load_test(
+    generate_content: Callable[..., Any],
+    models: Sequence[str],
+    prompts: Sequence[str] | str = "Generate the operations report.",
+    requests: int = 100,
+    concurrency: int = 10,
+    config: Any = None,
+    max_attempts: int = 2,
+    hedge: HedgePolicy | None = None,
+    health: ModelHealthRegistry | None = None,
+    cache: AIResponseCache | None = None,
+) -> Dict[str, Any]:
+    """Run ``requests`` AI calls with at most ``concurrency`` in flight.
+
+    Requests cycle through ``prompts``, so repeated prompts exercise
+    ``cache`` when one is given. Latencies are measured per request from
+    the moment it starts running.
+    """
+    if requests < 1 or concurrency < 1:
+        raise ValueError("requests and concurrency must be at least 1.")
+    if isinstance(prompts, str):
+        prompts = [prompts]
+    models = list(models)
+
+    def one_request(index: int) -> tuple[float, str]:
+        prompt = prompts[index % len(prompts)]
+
+        def request() -> str:
+            return request_ai_text(
+                generate_content, models, prompt, config,
+                max_attempts=max_attempts, hedge=hedge, health=health,
+            )
+
+        began = time.perf_counter()
+        try:
+            if cache is not None:
+                cache.get_or_request("load_test", models, prompt, request)
+            else:
+                request()
+            outcome = "OK"
+        except AIServiceUnavailable as error:
+            outcome = error.code
+        return time.perf_counter() - began, outcome
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="ai-load") as pool:
+        results = list(pool.map(one_request, range(requests)))
+    wall_seconds = time.perf_counter() - started
+
+    latencies = sorted(latency for latency, _ in results)
+    outcomes = Counter(outcome for _, outcome in results)
+    report = {
+        "requests": requests,
+        "concurrency": concurrency,
+        "succeeded": outcomes["OK"],
+        "failed": requests - outcomes["OK"],
+        "outcomes": dict(outcomes),
+        "wall_seconds": wall_seconds,
+        "throughput_rps": requests / wall_seconds if wall_seconds > 0 else float("inf"),
+        "mean_latency_seconds": sum(latencies) / len(latencies),
+        "max_latency_seconds": latencies[-1],
+    }
+    for percentile in PERCENTILES:
+        report[f"p{round(percentile * 100)}_latency_seconds"] = latency_percentile(latencies, percentile)
+    if cache is not None:
+        report["cache"] = cache.stats()
+    return report
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+import queue
+import threading
+import time
 from typing import Any
 
 
@@ -27,39 +33,458 @@ def _looks_like_timeout(message: str) -> bool:
     )
 
 
+class HedgePolicy:
+    """Decide when a slow model request should be hedged with the next model.
+
+    The delay is the configured percentile of recent successful latencies,
+    clamped to ``[min_delay, max_delay]``. Until ``min_samples`` latencies
+    have been observed the ``default_delay`` is used. Safe to share between
+    threads and sessions.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        default_delay: float = 8.0,
+        min_delay: float = 0.5,
+        max_delay: float = 30.0,
+        window: int = 200,
+        min_samples: int = 10,
+    ) -> None:
+        if not 0 < percentile <= 1:
+            raise ValueError("percentile must be in (0, 1].")
+        self.percentile = percentile
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency_seconds: float) -> None:
+        with self._lock:
+            self._latencies.append(float(latency_seconds))
+
+    def delay(self) -> float:
+        with self._lock:
+            samples = sorted(self._latencies)
+        if len(samples) < self.min_samples:
+            value = self.default_delay
+        else:
+            value = samples[min(len(samples) - 1, int(self.percentile * len(samples)))]
+        return min(self.max_delay, max(self.min_delay, value))
+
+
+class ModelHealthRegistry:
+    """Process-wide per-model health with a simple circuit breaker.
+
+    Each model tracks successes, failures, a latency EWMA and its consecutive
+    failures. ``failure_threshold`` consecutive failures open the circuit for
+    ``cooldown_seconds``; an open model is moved to the end of the candidate
+    order rather than removed, so a request still has somewhere to go when
+    every model is open. After the cool-down the circuit is half-open: the
+    first request to order it gets the single trial, and others keep
+    treating the model as open until that trial reports or
+    ``probe_timeout_seconds`` passes. Success closes the circuit and another
+    failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 60.0,
+        ewma_alpha: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+        probe_timeout_seconds: float | None = None,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1.")
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        # A trial that is never attempted (e.g. an earlier model answered)
+        # must not block the model forever.
+        self.probe_timeout_seconds = cooldown_seconds if probe_timeout_seconds is None else probe_timeout_seconds
+        self.ewma_alpha = ewma_alpha
+        self._clock = clock
+        self._models: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, model_name: str) -> dict[str, Any]:
+        return self._models.setdefault(model_name, {
+            "successes": 0,
+            "failures": 0,
+            "consecutive_failures": 0,
+            "latency_ewma": None,
+            "last_error_code": "",
+            "open_until": 0.0,
+            "probe_until": 0.0,
+        })
+
+    def _observe_latency(self, entry: dict[str, Any], latency_seconds: float) -> None:
+        previous = entry["latency_ewma"]
+        entry["latency_ewma"] = (
+            latency_seconds
+            if previous is None
+            else self.ewma_alpha * latency_seconds + (1 - self.ewma_alpha) * previous
+        )
+
+    def record_success(self, model_name: str, latency_seconds: float) -> None:
+        with self._lock:
+            entry = self._entry(model_name)
+            entry["successes"] += 1
+            entry["consecutive_failures"] = 0
+            entry["open_until"] = 0.0
+            entry["probe_until"] = 0.0
+            self._observe_latency(entry, latency_seconds)
+
+    def record_failure(self, model_name: str, code: str, latency_seconds: float) -> None:
+        with self._lock:
+            entry = self._entry(model_name)
+            entry["failures"] += 1
+            entry["consecutive_failures"] += 1
+            entry["last_error_code"] = code
+            entry["probe_until"] = 0.0
+            self._observe_latency(entry, latency_seconds)
+            if entry["consecutive_failures"] >= self.failure_threshold:
+                entry["open_until"] = self._clock() + self.cooldown_seconds
+
+    def is_open(self, model_name: str) -> bool:
+        with self._lock:
+            entry = self._models.get(model_name)
+            return entry is not None and self._clock() < entry["open_until"]
+
+    def order(self, models: Iterable[str]) -> list[str]:
+        """Return ``models`` with open circuits demoted, otherwise in order.
+
+        A half-open model stays in place for the one caller that takes its
+        trial and is demoted for everyone else while the trial is out.
+        """
+        closed, demoted = [], []
+        with self._lock:
+            now = self._clock()
+            for model_name in models:
+                entry = self._models.get(model_name)
+                if entry is None or entry["consecutive_failures"] < self.failure_threshold:
+                    closed.append(model_name)
+                elif now < entry["open_until"] or now < entry["probe_until"]:
+                    demoted.append(model_name)
+                else:
+                    entry["probe_until"] = now + self.probe_timeout_seconds
+                    closed.append(model_name)
+        return closed + demoted
+
+    def diagnostics(self) -> dict[str, dict[str, Any]]:
+        now = self._clock()
+        with self._lock:
+            report = {}
+            for model_name, entry in self._models.items():
+                calls = entry["successes"] + entry["failures"]
+                if now < entry["open_until"]:
+                    state = "open"
+                elif entry["consecutive_failures"] >= self.failure_threshold:
+                    state = "half_open"
+                else:
+                    state = "closed"
+                report[model_name] = {
+                    "state": state,
+                    "successes": entry["successes"],
+                    "failures": entry["failures"],
+                    "success_rate": entry["successes"] / calls if calls else None,
+                    "latency_ewma_seconds": entry["latency_ewma"],
+                    "consecutive_failures": entry["consecutive_failures"],
+                    "last_error_code": entry["last_error_code"],
+                    "cooldown_remaining_seconds": max(0.0, entry["open_until"] - now),
+                    "probe_in_flight": state == "half_open" and now < entry["probe_until"],
+                }
+            return report
+
+    def reset(self) -> None:
+        with self._lock:
+            self._models.clear()
+
+
+_SLOT_POLL_SECONDS = 0.05
+
+
+class ProviderCallLimit:
+    """Process-wide cap on provider calls that are in flight at once.
+
+    Pass it as ``limit`` to :func:`request_ai_text` and
+    :func:`stream_ai_text`; every attempt then holds one of ``max_calls``
+    slots, whether it comes from chat, a report job, a report section or a
+    hedge. Latency is measured from when the slot is held, and a hedge still
+    queued for a slot when its request finishes gives up without calling the
+    provider. A streamed call holds its slot until the stream is exhausted or
+    closed. :meth:`wrap` and :meth:`wrap_stream` gate other callers.
+    """
+
+    def __init__(self, max_calls: int) -> None:
+        if max_calls < 1:
+            raise ValueError("max_calls must be at least 1.")
+        self.max_calls = int(max_calls)
+        self._slots = threading.BoundedSemaphore(self.max_calls)
+        self._lock = threading.Lock()
+        self._active = 0
+        self._waiting = 0
+
+    def acquire(self, stop: threading.Event | None = None) -> bool:
+        """Wait for a slot; False, holding nothing, if ``stop`` is set first."""
+        with self._lock:
+            self._waiting += 1
+        try:
+            while not self._slots.acquire(timeout=None if stop is None else _SLOT_POLL_SECONDS):
+                if stop.is_set():
+                    return False
+        finally:
+            with self._lock:
+                self._waiting -= 1
+        if stop is not None and stop.is_set():
+            self._slots.release()
+            return False
+        with self._lock:
+            self._active += 1
+        return True
+
+    def release(self) -> None:
+        with self._lock:
+            self._active -= 1
+        self._slots.release()
+
+    def wrap(self, generate_content: Callable[..., Any]) -> Callable[..., Any]:
+        def call(*args: Any, **kwargs: Any) -> Any:
+            self.acquire()
+            try:
+                return generate_content(*args, **kwargs)
+            finally:
+                self.release()
+        return call
+
+    def wrap_stream(self, generate_content_stream: Callable[..., Iterable[Any]]) -> Callable[..., Iterator[Any]]:
+        def call(*args: Any, **kwargs: Any) -> Iterator[Any]:
+            self.acquire()
+            try:
+                yield from generate_content_stream(*args, **kwargs)
+            finally:
+                self.release()
+        return call
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"max_calls": self.max_calls, "active": self._active, "waiting": self._waiting}
+
+
+@contextmanager
+def _slot(limit: ProviderCallLimit | None, stop: threading.Event | None = None) -> Iterator[bool]:
+    """Hold a ``limit`` slot for the block; yields False if ``stop`` won the wait."""
+    if limit is None:
+        yield True
+        return
+    if not limit.acquire(stop):
+        yield False
+        return
+    try:
+        yield True
+    finally:
+        limit.release()
+
+
+def _hedge_timeout(hedge: HedgePolicy, began: float | None) -> float:
+    """Seconds until the newest attempt is due a hedge; polls while it waits for a slot."""
+    if began is None:
+        return _SLOT_POLL_SECONDS
+    return max(0.0, hedge.delay() - (time.monotonic() - began))
+
+
+def _hedge_due(hedge: HedgePolicy, began: float | None) -> bool:
+    return began is not None and time.monotonic() - began >= hedge.delay()
+
+
+def _failure_code(exc: Exception) -> str:
+    return "AI_TIMEOUT" if _looks_like_timeout(str(exc)) else "AI_UNAVAILABLE"
+
+
+def _record(
+    health: ModelHealthRegistry | None,
+    model_name: str,
+    began: float,
+    failure_code: str = "",
+    attempts: list[dict[str, Any]] | None = None,
+) -> None:
+    latency = time.monotonic() - began
+    if attempts is not None:
+        attempts.append({
+            "model": model_name,
+            "latency_seconds": latency,
+            "outcome": failure_code or "OK",
+        })
+    if health is None:
+        return
+    if failure_code:
+        health.record_failure(model_name, failure_code, latency)
+    else:
+        health.record_success(model_name, latency)
+
+
 def request_ai_text(
     generate_content: Callable[..., Any],
     models: Iterable[str],
     prompt: str,
     config: Any,
     max_attempts: int = 3,
+    hedge: HedgePolicy | None = None,
+    health: ModelHealthRegistry | None = None,
+    attempts: list[dict[str, Any]] | None = None,
+    limit: ProviderCallLimit | None = None,
 ) -> str:
-    """Try a bounded number of models and return the first non-empty response."""
+    """Try a bounded number of models and return the first non-empty response.
+
+    With a ``hedge`` policy, a request still running after ``hedge.delay()``
+    seconds starts the next candidate on a worker thread instead of waiting
+    for the timeout; the first non-empty answer wins and the others are
+    ignored. Hedged requests count toward ``max_attempts``.
 
-    attempts = 0
+    With a ``health`` registry, models with an open circuit are tried last
+    and every attempt's outcome and latency is recorded.
+
+    With an ``attempts`` list, one ``{"model", "latency_seconds", "outcome"}``
+    dict is appended per attempt for telemetry.
+
+    With a ``limit``, each attempt holds one of its slots; see
+    :class:`ProviderCallLimit`.
+    """
+
+    if health is not None:
+        models = health.order(models)
+    if hedge is not None:
+        return _request_ai_text_hedged(
+            generate_content, models, prompt, config, max_attempts, hedge, health, attempts, limit
+        )
+
+    attempt_count = 0
     last_error = ""
     saw_timeout = False
 
     for model_name in models:
-        if attempts >= max_attempts:
+        if attempt_count >= max_attempts:
             break
-        attempts += 1
+        attempt_count += 1
+        began = time.monotonic()
         try:
-            response = generate_content(
-                model=model_name,
-                contents=prompt,
-                config=config,
-            )
+            with _slot(limit):
+                began = time.monotonic()
+                response = generate_content(
+                    model=model_name,
+                    contents=prompt,
+                    config=config,
+                )
             response_text = getattr(response, "text", None)
             if response_text and str(response_text).strip():
+                _record(health, model_name, began, attempts=attempts)
                 return str(response_text)
             last_error = f"Empty response from {model_name}"
+            _record(health, model_name, began, "AI_EMPTY_RESPONSE", attempts)
         except Exception as exc:  # provider exceptions vary by transport/version
             last_error = f"{model_name}: {exc}"
             saw_timeout = saw_timeout or _looks_like_timeout(str(exc))
+            _record(health, model_name, began, _failure_code(exc), attempts)
 
+    raise _unavailable(saw_timeout, last_error)
+
+
+def _request_ai_text_hedged(
+    generate_content: Callable[..., Any],
+    models: Iterable[str],
+    prompt: str,
+    config: Any,
+    max_attempts: int,
+    hedge: HedgePolicy,
+    health: ModelHealthRegistry | None,
+    attempts: list[dict[str, Any]] | None,
+    limit: ProviderCallLimit | None,
+) -> str:
+    candidates = iter(models)
+    # Each attempt's start time is set once it holds a slot, so queueing for
+    # one neither triggers a hedge nor counts as provider latency.
+    pending: dict[Future, tuple[str, dict[str, float | None]]] = {}
+    newest: dict[str, float | None] = {"began": None}
+    finished = threading.Event()
+    attempt_count = 0
+    last_error = ""
+    saw_timeout = False
+    executor = ThreadPoolExecutor(max_workers=max(1, max_attempts), thread_name_prefix="ai-hedge")
+
+    def attempt(model_name: str, timing: dict[str, float | None]) -> Any:
+        with _slot(limit, finished) as held:
+            if not held:
+                return None
+            timing["began"] = time.monotonic()
+            response = generate_content(model=model_name, contents=prompt, config=config)
+            if str(getattr(response, "text", None) or "").strip():
+                # Set before the slot is released, so a hedge queued behind
+                # this answer cannot take the slot and call the provider.
+                finished.set()
+            return response
+
+    def launch() -> bool:
+        nonlocal attempt_count, newest
+        if attempt_count >= max_attempts:
+            return False
+        model_name = next(candidates, None)
+        if model_name is None:
+            return False
+        attempt_count += 1
+        newest = {"began": None}
+        pending[executor.submit(attempt, model_name, newest)] = (model_name, newest)
+        return True
+
+    try:
+        can_launch = launch()
+        while pending:
+            done, _ = wait(
+                pending,
+                timeout=_hedge_timeout(hedge, newest["began"]) if can_launch else None,
+                return_when=FIRST_COMPLETED,
+            )
+            if not done:
+                if _hedge_due(hedge, newest["began"]):
+                    can_launch = launch()
+                continue
+            for future in done:
+                model_name, timing = pending.pop(future)
+                began = timing["began"]
+                if began is None:
+                    continue  # gave up waiting for a slot: another attempt answered
+                try:
+                    response = future.result()
+                except Exception as exc:  # provider exceptions vary by transport/version
+                    last_error = f"{model_name}: {exc}"
+                    saw_timeout = saw_timeout or _looks_like_timeout(str(exc))
+                    _record(health, model_name, began, _failure_code(exc), attempts)
+                    can_launch = launch()
+                    continue
+                response_text = getattr(response, "text", None)
+                if response_text and str(response_text).strip():
+                    hedge.record(time.monotonic() - began)
+                    _record(health, model_name, began, attempts=attempts)
+                    return str(response_text)
+                last_error = f"Empty response from {model_name}"
+                _record(health, model_name, began, "AI_EMPTY_RESPONSE", attempts)
+                can_launch = launch()
+    finally:
+        # Attempts still queued for a slot give up; running provider calls
+        # cannot be interrupted and their results are ignored.
+        finished.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+        if attempts is not None:
+            for model_name, timing in pending.values():
+                _record(None, model_name, timing["began"] or time.monotonic(), "HEDGE_ABANDONED", attempts)
+
+    raise _unavailable(saw_timeout, last_error)
+
+
+def _unavailable(saw_timeout: bool, last_error: str) -> AIServiceUnavailable:
     if saw_timeout:
-        raise AIServiceUnavailable(
+        return AIServiceUnavailable(
             code="AI_TIMEOUT",
             user_message=(
                 "The AI service did not respond in time. Your inputs are still saved; "
@@ -68,7 +493,7 @@ def request_ai_text(
             last_error=last_error,
         )
 
-    raise AIServiceUnavailable(
+    return AIServiceUnavailable(
         code="AI_UNAVAILABLE",
         user_message=(
             "The AI service is temporarily unavailable. Your inputs are still saved; "
@@ -76,3 +501,220 @@ def request_ai_text(
         ),
         last_error=last_error,
     )
+
+
+def stream_ai_text(
+    generate_content_stream: Callable[..., Iterable[Any]],
+    models: Iterable[str],
+    prompt: str,
+    config: Any,
+    max_attempts: int = 3,
+    health: ModelHealthRegistry | None = None,
+    attempts: list[dict[str, Any]] | None = None,
+    hedge: HedgePolicy | None = None,
+    limit: ProviderCallLimit | None = None,
+) -> Iterator[str]:
+    """Yield text chunks from the first model that streams a non-empty response.
+
+    Models are tried within the same bounded window as :func:`request_ai_text`.
+    A model that fails or streams nothing before its first text chunk falls
+    back to the next candidate. Once text has been yielded the answer cannot
+    be restarted, so a failure mid-stream raises ``AI_STREAM_INTERRUPTED`` and
+    the caller keeps the partial text it already rendered. ``attempts``
+    collects per-attempt telemetry as in :func:`request_ai_text`.
+
+    With a ``hedge`` policy, the time to the first text chunk is hedged: a
+    stream with no text after ``hedge.delay()`` seconds starts the next
+    candidate, the first stream to produce text is the one yielded, and the
+    others are closed. The policy records time-to-first-chunk, so it should
+    not be shared with :func:`request_ai_text`, which records full latency.
+    A ``limit`` slot is held by each stream as in :func:`request_ai_text`.
+    """
+
+    if health is not None:
+        models = health.order(models)
+    if hedge is not None:
+        yield from _stream_ai_text_hedged(
+            generate_content_stream, models, prompt, config, max_attempts, hedge, health, attempts, limit
+        )
+        return
+    attempt_count = 0
+    last_error = ""
+    saw_timeout = False
+
+    for model_name in models:
+        if attempt_count >= max_attempts:
+            break
+        attempt_count += 1
+        began = time.monotonic()
+        started = False
+        try:
+            with _slot(limit):
+                began = time.monotonic()
+                for chunk in generate_content_stream(
+                    model=model_name,
+                    contents=prompt,
+                    config=config,
+                ):
+                    chunk_text = getattr(chunk, "text", None)
+                    if not chunk_text:
+                        continue
+                    if not started and not str(chunk_text).strip():
+                        continue
+                    started = True
+                    yield str(chunk_text)
+            if started:
+                _record(health, model_name, began, attempts=attempts)
+                return
+            last_error = f"Empty response from {model_name}"
+            _record(health, model_name, began, "AI_EMPTY_RESPONSE", attempts)
+        except Exception as exc:  # provider exceptions vary by transport/version
+            last_error = f"{model_name}: {exc}"
+            if started:
+                _record(health, model_name, began, "AI_STREAM_INTERRUPTED", attempts)
+                raise AIServiceUnavailable(
+                    code="AI_STREAM_INTERRUPTED",
+                    user_message=(
+                        "The AI response was interrupted before it finished. "
+                        "The partial answer is shown; please retry for the full response."
+                    ),
+                    last_error=last_error,
+                ) from exc
+            saw_timeout = saw_timeout or _looks_like_timeout(str(exc))
+            _record(health, model_name, began, _failure_code(exc), attempts)
+
+    raise _unavailable(saw_timeout, last_error)
+
+
+def _stream_ai_text_hedged(
+    generate_content_stream: Callable[..., Iterable[Any]],
+    models: Iterable[str],
+    prompt: str,
+    config: Any,
+    max_attempts: int,
+    hedge: HedgePolicy,
+    health: ModelHealthRegistry | None,
+    attempts: list[dict[str, Any]] | None,
+    limit: ProviderCallLimit | None,
+) -> Iterator[str]:
+    candidates = iter(models)
+    # Each stream is read on a worker thread into one queue of
+    # (stream id, kind, payload) events; ``pending`` maps live stream ids
+    # to (model, timing, stop event), where timing["began"] is set once the
+    # stream holds a slot.
+    events: queue.Queue = queue.Queue()
+    pending: dict[int, tuple[str, dict[str, float | None], threading.Event]] = {}
+    answered = threading.Event()
+    newest: dict[str, float | None] = {"began": None}
+    attempt_count = 0
+    winner: int | None = None
+    last_error = ""
+    saw_timeout = False
+    executor = ThreadPoolExecutor(max_workers=max(1, max_attempts), thread_name_prefix="ai-hedge-stream")
+
+    def pump(stream_id: int, model_name: str, timing: dict[str, float | None], stop: threading.Event) -> None:
+        with _slot(limit, stop) as held:
+            if not held or answered.is_set():
+                return
+            timing["began"] = time.monotonic()
+            stream = None
+            try:
+                stream = iter(generate_content_stream(model=model_name, contents=prompt, config=config))
+                for chunk in stream:
+                    if stop.is_set():
+                        return
+                    chunk_text = getattr(chunk, "text", None)
+                    if chunk_text:
+                        if str(chunk_text).strip():
+                            # A winner now exists; streams queued for a slot give up.
+                            answered.set()
+                        events.put((stream_id, "chunk", str(chunk_text)))
+                events.put((stream_id, "done", None))
+            except Exception as exc:  # provider exceptions vary by transport/version
+                events.put((stream_id, "error", exc))
+            finally:
+                # Closing releases the provider connection before the slot.
+                close = getattr(stream, "close", None)
+                if close is not None:
+                    close()
+
+    def launch() -> bool:
+        nonlocal attempt_count, newest
+        if attempt_count >= max_attempts:
+            return False
+        model_name = next(candidates, None)
+        if model_name is None:
+            return False
+        attempt_count += 1
+        stop = threading.Event()
+        newest = {"began": None}
+        pending[attempt_count] = (model_name, newest, stop)
+        executor.submit(pump, attempt_count, model_name, newest, stop)
+        return True
+
+    try:
+        can_launch = launch()
+        while pending:
+            try:
+                stream_id, kind, payload = events.get(
+                    timeout=_hedge_timeout(hedge, newest["began"]) if winner is None and can_launch else None
+                )
+            except queue.Empty:
+                if _hedge_due(hedge, newest["began"]):
+                    can_launch = launch()
+                continue
+            if stream_id not in pending:
+                continue
+            model_name, timing, _ = pending[stream_id]
+            began = timing["began"]
+            if kind == "chunk":
+                if winner is None:
+                    if not payload.strip():
+                        continue
+                    winner = stream_id
+                    hedge.record(time.monotonic() - began)
+                    for other_id, (other_model, other_timing, stop) in list(pending.items()):
+                        if other_id != winner:
+                            stop.set()
+                            del pending[other_id]
+                            if attempts is not None:
+                                _record(
+                                    None, other_model, other_timing["began"] or time.monotonic(),
+                                    "HEDGE_ABANDONED", attempts,
+                                )
+                yield payload
+            elif kind == "done":
+                del pending[stream_id]
+                if stream_id == winner:
+                    _record(health, model_name, began, attempts=attempts)
+                    return
+                last_error = f"Empty response from {model_name}"
+                _record(health, model_name, began, "AI_EMPTY_RESPONSE", attempts)
+                can_launch = launch()
+            else:
+                del pending[stream_id]
+                last_error = f"{model_name}: {payload}"
+                if stream_id == winner:
+                    _record(health, model_name, began, "AI_STREAM_INTERRUPTED", attempts)
+                    raise AIServiceUnavailable(
+                        code="AI_STREAM_INTERRUPTED",
+                        user_message=(
+                            "The AI response was interrupted before it finished. "
+                            "The partial answer is shown; please retry for the full response."
+                        ),
+                        last_error=last_error,
+                    ) from payload
+                saw_timeout = saw_timeout or _looks_like_timeout(str(payload))
+                _record(health, model_name, began, _failure_code(payload), attempts)
+                can_launch = launch()
+    finally:
+        # Streams still open (the caller stopped reading, or they lost the
+        # race) stop at their next chunk, and streams still queued for a slot
+        # give up; a blocked read cannot be interrupted.
+        executor.shutdown(wait=False, cancel_futures=True)
+        for stream_id, (model_name, timing, stop) in pending.items():
+            stop.set()
+            if attempts is not None and stream_id != winner:
+                _record(None, model_name, timing["began"] or time.monotonic(), "HEDGE_ABANDONED", attempts)
+
+    raise _unavailable(saw_timeout, last_error)
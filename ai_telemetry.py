@@ -0,0 +1,229 @@
+"""Per-call telemetry for AI requests.
+
+Each call records its mode, every model attempt with its latency and outcome,
+total latency, prompt size (characters and estimated tokens), response size
+and final outcome code. Records are kept in a bounded in-memory ring buffer
+for the admin panel and can also be written to a file: ``jsonl`` appends one
+JSON object per call, ``prometheus`` rewrites a text-format metrics file that
+a node-exporter textfile collector can scrape, at most once per
+``write_interval_seconds`` and outside the lock that recording and the admin
+panel use. A call that lands inside the interval arms a one-shot timer, so
+the file catches up after a burst even if no further calls arrive.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, deque
+from collections.abc import Callable, Iterable
+import json
+import os
+import threading
+import time
+from typing import Any
+
+from prompt_tokens import estimate_tokens
+
+
+TELEMETRY_FORMATS = ("jsonl", "prometheus")
+PERCENTILES = (0.5, 0.95, 0.99)
+
+
+def latency_percentile(sorted_latencies: list[float], percentile: float) -> float:
+    """Nearest-rank percentile of an ascending list (the same rule as HedgePolicy)."""
+    return sorted_latencies[min(len(sorted_latencies) - 1, int(percentile * len(sorted_latencies)))]
+
+
+def _label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class AITelemetry:
+    """Thread-safe ring buffer of AI call records with an optional file sink.
+
+    ``capacity`` bounds the records kept in memory; percentiles are computed
+    over that window. Totals per mode and outcome, and per-model attempt
+    latency sums and counts, cover every call since start. File errors never
+    fail a request. In ``prometheus`` format the metrics file is rewritten at
+    most every ``write_interval_seconds``, with a trailing rewrite for calls
+    that were skipped; :meth:`flush` writes it immediately.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1000,
+        path: str | None = None,
+        file_format: str = "jsonl",
+        clock: Callable[[], float] = time.time,
+        write_interval_seconds: float = 15.0,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        if file_format not in TELEMETRY_FORMATS:
+            raise ValueError(f"file_format must be one of {TELEMETRY_FORMATS}.")
+        self.capacity = int(capacity)
+        self.path = path
+        self.file_format = file_format
+        self._clock = clock
+        self._records: deque[dict[str, Any]] = deque(maxlen=self.capacity)
+        self._totals: Counter[tuple[str, str]] = Counter()
+        self._latency_sums: Counter[str] = Counter()
+        self._latency_counts: Counter[str] = Counter()
+        self.write_interval_seconds = max(0.0, float(write_interval_seconds))
+        self._last_write = float("-inf")
+        self._flush_timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def record(
+        self,
+        mode: str,
+        attempts: Iterable[dict[str, Any]],
+        latency_seconds: float,
+        prompt: str,
+        response_text: str,
+        outcome: str,
+        streamed: bool = False,
+        cached: bool = False,
+    ) -> dict[str, Any]:
+        """Store one call; ``attempts`` is the list filled in by request_ai_text."""
+        entry = {
+            "timestamp": self._clock(),
+            "mode": mode,
+            "attempts": [dict(attempt) for attempt in attempts],
+            "latency_seconds": float(latency_seconds),
+            "prompt_chars": len(prompt),
+            "prompt_tokens_estimate": estimate_tokens(prompt),
+            "response_chars": len(response_text or ""),
+            "outcome": outcome,
+            "streamed": bool(streamed),
+            "cached": bool(cached),
+        }
+        with self._lock:
+            self._records.append(entry)
+            self._totals[(mode, outcome)] += 1
+            for model_attempt in entry["attempts"]:
+                if model_attempt["outcome"] != "HEDGE_ABANDONED":
+                    self._latency_sums[model_attempt["model"]] += model_attempt["latency_seconds"]
+                    self._latency_counts[model_attempt["model"]] += 1
+            since_write = entry["timestamp"] - self._last_write
+            rewrite_due = self.file_format == "prometheus" and since_write >= self.write_interval_seconds
+            if rewrite_due:
+                self._last_write = entry["timestamp"]
+                self._cancel_flush_timer()
+            elif self.path and self.file_format == "prometheus" and self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.write_interval_seconds - since_write, self._trailing_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        if self.path and (self.file_format == "jsonl" or rewrite_due):
+            try:
+                self._write(entry)
+            except OSError:
+                pass
+        return entry
+
+    def _write(self, entry: dict[str, Any]) -> None:
+        with self._write_lock:
+            if self.file_format == "jsonl":
+                with open(self.path, "a", encoding="utf-8") as handle:
+                    handle.write(json.dumps(entry, separators=(",", ":")) + "\n")
+                return
+            text = self.prometheus_text()
+            temporary = f"{self.path}.tmp"
+            with open(temporary, "w", encoding="utf-8") as handle:
+                handle.write(text)
+            os.replace(temporary, self.path)
+
+    def _cancel_flush_timer(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _trailing_flush(self) -> None:
+        with self._lock:
+            self._flush_timer = None
+        try:
+            self.flush()
+        except OSError:
+            pass
+
+    def flush(self) -> None:
+        """Rewrite the prometheus metrics file now; a no-op for jsonl."""
+        if self.path and self.file_format == "prometheus":
+            with self._lock:
+                self._last_write = self._clock()
+                self._cancel_flush_timer()
+            self._write({})
+
+    def records(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """Return stored records, newest first."""
+        with self._lock:
+            records = list(self._records)
+        records.reverse()
+        return records[:limit] if limit is not None else records
+
+    def _model_latencies(self) -> dict[str, dict[str, Any]]:
+        models: dict[str, dict[str, Any]] = {}
+        for entry in self._records:
+            for attempt in entry["attempts"]:
+                if attempt["outcome"] == "HEDGE_ABANDONED":
+                    continue
+                stats = models.setdefault(attempt["model"], {"latencies": [], "failures": 0})
+                stats["latencies"].append(attempt["latency_seconds"])
+                stats["failures"] += attempt["outcome"] != "OK"
+        return models
+
+    def model_latency_percentiles(self) -> dict[str, dict[str, Any]]:
+        """p50/p95/p99 attempt latency, attempt count and failure rate per model."""
+        with self._lock:
+            models = self._model_latencies()
+        report = {}
+        for model_name, stats in sorted(models.items()):
+            latencies = sorted(stats["latencies"])
+            report[model_name] = {
+                "attempts": len(latencies),
+                "failure_rate": stats["failures"] / len(latencies),
+                **{
+                    f"p{round(percentile * 100)}_seconds": latency_percentile(latencies, percentile)
+                    for percentile in PERCENTILES
+                },
+            }
+        return report
+
+    def _prometheus_text(self) -> str:
+        lines = [
+            "# HELP ai_attempt_latency_seconds AI model attempt latency; quantiles cover the recent window.",
+            "# TYPE ai_attempt_latency_seconds summary",
+        ]
+        for model_name, stats in sorted(self._model_latencies().items()):
+            latencies = sorted(stats["latencies"])
+            model = _label(model_name)
+            for percentile in PERCENTILES:
+                lines.append(
+                    f'ai_attempt_latency_seconds{{model="{model}",quantile="{percentile}"}} '
+                    f"{latency_percentile(latencies, percentile):.6f}"
+                )
+        # Sum and count are cumulative, as Prometheus expects of a summary;
+        # only the quantiles are limited to the recent window.
+        for model_name in sorted(self._latency_counts):
+            model = _label(model_name)
+            lines.append(f'ai_attempt_latency_seconds_sum{{model="{model}"}} {self._latency_sums[model_name]:.6f}')
+            lines.append(f'ai_attempt_latency_seconds_count{{model="{model}"}} {self._latency_counts[model_name]}')
+        lines += [
+            "# HELP ai_calls_total AI calls since start by mode and outcome.",
+            "# TYPE ai_calls_total counter",
+        ]
+        for (mode, outcome), count in sorted(self._totals.items()):
+            lines.append(f'ai_calls_total{{mode="{_label(mode)}",outcome="{_label(outcome)}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def prometheus_text(self) -> str:
+        """Current metrics in the Prometheus text exposition format."""
+        with self._lock:
+            return self._prometheus_text()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+            self._totals.clear()
+            self._latency_sums.clear()
+            self._latency_counts.clear()
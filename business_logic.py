@@ -6,9 +6,19 @@ and prevents the UI and AI report from using different financial logic.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Mapping, Sequence
 import math
 
+import numpy as np
+
+
+SCORE_WEIGHTS = {
+    "site": 0.35,
+    "cash": 0.35,
+    "margin": 0.20,
+    "competition": 0.10,
+}
+
 
 def _as_float(value: Any, default: float = 0.0) -> float:
     try:
@@ -111,13 +121,142 @@ def validate_pricing(pricing: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def calculate_open_store_feasibility(
-    profile: Dict[str, Any],
-    site: Dict[str, Any],
-    launch: Dict[str, Any],
-    pricing: Dict[str, Any],
-) -> Dict[str, Any]:
-    """Calculate the single source of truth for scores and launch decisions."""
+CATALOG_COLUMN_ALIASES = {
+    "sku": ("sku", "item", "product", "name"),
+    "cost": ("cost", "unit_cost"),
+    "price": ("price", "planned_price", "selling_price"),
+    "competitor_price": ("competitor_price", "competitor"),
+    "units": ("monthly_units", "units", "sales_mix", "mix", "monthly_sales"),
+}
+
+
+def _catalog_column(columns: Mapping[str, Any], field: str) -> Any:
+    by_name = {str(name).strip().lower().replace(" ", "_"): name for name in columns}
+    for alias in CATALOG_COLUMN_ALIASES[field]:
+        if alias in by_name:
+            return by_name[alias]
+    return None
+
+
+def validate_pricing_catalog(catalog: Mapping[str, Any]) -> Dict[str, Any]:
+    """Validate a whole product table with the same rules as validate_pricing.
+
+    ``catalog`` is a DataFrame or mapping of columns. Cost and price columns
+    are required; SKU, competitor price and monthly units (the sales mix) are
+    optional, and missing units weight every SKU equally. The roll-up
+    ``mix_weighted_margin`` is gross profit over revenue across valid SKUs and
+    can be passed in the pricing dict to replace the single implied margin.
+    """
+    names = {field: _catalog_column(catalog, field) for field in CATALOG_COLUMN_ALIASES}
+    missing = [field for field in ("cost", "price") if names[field] is None]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+    columns = {field: catalog[name] for field, name in names.items() if name is not None}
+    size = max(1, int(np.size(columns["cost"])))
+    cost = _as_float_array(columns, "cost", size)
+    price = _as_float_array(columns, "price", size)
+    competitor_price = _as_float_array(columns, "competitor_price", size)
+    units = np.maximum(0.0, _as_float_array(columns, "units", size, 1.0))
+    sku = (
+        _as_str_array(columns, "sku", size, "")
+        if "sku" in columns
+        else np.array([f"Row {index + 1}" for index in range(size)], dtype=object)
+    )
+
+    cost_error = cost <= 0
+    price_error = price <= 0
+    below_cost_error = (cost > 0) & (price > 0) & (price <= cost)
+    valid = ~(cost_error | price_error | below_cost_error)
+    margin = _safe_divide(price - cost, price, 0.0)
+    markup = _safe_divide(price - cost, cost, 0.0)
+    competitor_ratio = _safe_divide(price, competitor_price, math.nan)
+    low_margin_warning = valid & (margin < 0.10)
+    ratio_warning = (
+        (competitor_price > 0)
+        & (price > 0)
+        & ((competitor_ratio < 0.50) | (competitor_ratio > 1.50))
+    )
+
+    errors: List[str] = []
+    warnings: List[str] = []
+    for index in np.flatnonzero(~valid | low_margin_warning | ratio_warning):
+        label = sku[index]
+        if cost_error[index]:
+            errors.append(f"{label}: Unit cost must be greater than USD 0.")
+        if price_error[index]:
+            errors.append(f"{label}: Planned price must be greater than USD 0.")
+        if below_cost_error[index]:
+            errors.append(
+                f"{label}: Planned price (USD {price[index]:,.2f}) must be higher than "
+                f"unit cost (USD {cost[index]:,.2f})."
+            )
+        if low_margin_warning[index]:
+            warnings.append(f"{label}: Product margin is only {margin[index]:.1%}.")
+        if ratio_warning[index]:
+            warnings.append(f"{label}: Planned price differs from the competitor price by more than 50%.")
+
+    revenue = np.where(valid, units * price, 0.0)
+    gross_profit = np.where(valid, units * (price - cost), 0.0)
+    total_revenue = float(revenue.sum())
+    mix_weighted_margin = float(gross_profit.sum() / total_revenue) if total_revenue > 0 else math.nan
+
+    return {
+        "valid": not errors,
+        "errors": errors,
+        "warnings": warnings,
+        "sku": sku,
+        "cost": cost,
+        "price": price,
+        "competitor_price": competitor_price,
+        "units": units,
+        "margin": margin,
+        "markup": markup,
+        "competitor_ratio": competitor_ratio,
+        "sku_valid": valid,
+        "sku_count": size,
+        "valid_sku_count": int(valid.sum()),
+        "mix_weighted_margin": mix_weighted_margin,
+    }
+
+
+def feasibility_pricing_node(pricing: Dict[str, Any]) -> Dict[str, Any]:
+    """Pricing check plus the product margin the decision should use."""
+    pricing_check = validate_pricing(pricing)
+    product_margin = pricing_check["implied_margin"]
+    catalog_margin = _as_float(pricing.get("mix_weighted_margin"), math.nan)
+    margin_source = "representative product"
+    if math.isfinite(catalog_margin):
+        product_margin = catalog_margin
+        margin_source = "catalog sales-mix"
+
+    competitor_price = pricing_check["competitor_price"]
+    planned_price = pricing_check["planned_price"]
+    price_vs_competitor = (
+        (planned_price - competitor_price) / competitor_price
+        if competitor_price > 0
+        else 0.0
+    )
+    return {
+        "pricing_check": pricing_check,
+        "product_margin": product_margin,
+        "margin_source": margin_source,
+        "price_vs_competitor": price_vs_competitor,
+    }
+
+
+def feasibility_site_node(site: Dict[str, Any]) -> Dict[str, Any]:
+    site_score = score_from_inputs_site(
+        int(_as_float(site.get("traffic"))),
+        int(_as_float(site.get("competitors"))),
+        str(site.get("rent_level", "Medium")),
+        str(site.get("parking", "Medium")),
+    )
+    return {"site_score": site_score, "rent_is_high": site.get("rent_level") == "High"}
+
+
+def feasibility_cash_node(profile: Dict[str, Any], launch: Dict[str, Any]) -> Dict[str, Any]:
+    """Launch budget inputs, cash runway, break-even and the cash score."""
     budget = _as_float(profile.get("budget"))
     funding_available = _as_float(launch.get("funding_available"), budget)
     startup_cost = _as_float(launch.get("startup_cost_estimate"))
@@ -127,7 +266,6 @@ def calculate_open_store_feasibility(
     target_months = max(1.0, _as_float(launch.get("cash_target_months"), 3.0))
 
     input_errors: List[str] = []
-    input_warnings: List[str] = []
     if funding_available <= 0:
         input_errors.append("Available launch funding must be greater than USD 0.")
     if startup_cost < 0:
@@ -139,10 +277,6 @@ def calculate_open_store_feasibility(
     if not 0 < expected_gm < 1:
         input_errors.append("Expected gross margin must be between 0% and 100%.")
 
-    pricing_check = validate_pricing(pricing)
-    input_errors.extend(pricing_check["errors"])
-    input_warnings.extend(pricing_check["warnings"])
-
     remaining_cash = funding_available - startup_cost
     runway_months = (
         remaining_cash / monthly_fixed_cost
@@ -159,13 +293,6 @@ def calculate_open_store_feasibility(
         else math.inf
     )
 
-    site_score = score_from_inputs_site(
-        int(_as_float(site.get("traffic"))),
-        int(_as_float(site.get("competitors"))),
-        str(site.get("rent_level", "Medium")),
-        str(site.get("parking", "Medium")),
-    )
-
     cash_score = 100
     if runway_months < 1:
         cash_score = 20
@@ -178,28 +305,53 @@ def calculate_open_store_feasibility(
     if funding_gap > 0:
         cash_score = max(15, cash_score - 20)
 
-    product_margin = pricing_check["implied_margin"]
+    return {
+        "input_errors": input_errors,
+        "startup_cost": startup_cost,
+        "monthly_fixed_cost": monthly_fixed_cost,
+        "expected_revenue": expected_revenue,
+        "expected_gm": expected_gm,
+        "target_months": target_months,
+        "remaining_cash": remaining_cash,
+        "runway_months": runway_months,
+        "target_cash_need": target_cash_need,
+        "funding_gap": funding_gap,
+        "contribution_profit": contribution_profit,
+        "monthly_profit_after_fixed": monthly_profit_after_fixed,
+        "breakeven_revenue": breakeven_revenue,
+        "cash_score": cash_score,
+    }
+
+
+def feasibility_margin_node(pricing_node: Dict[str, Any], cash_node: Dict[str, Any]) -> Dict[str, Any]:
+    expected_gm = cash_node["expected_gm"]
+    product_margin = pricing_node["product_margin"]
     margin_gap = abs(expected_gm - product_margin)
-    if not pricing_check["valid"]:
+    warnings: List[str] = []
+    if not pricing_node["pricing_check"]["valid"]:
         margin_score = 0
     else:
         conservative_margin = min(expected_gm, product_margin)
-        if monthly_profit_after_fixed > 0 and conservative_margin >= 0.55:
+        profitable = cash_node["monthly_profit_after_fixed"] > 0
+        if profitable and conservative_margin >= 0.55:
             margin_score = 85
-        elif monthly_profit_after_fixed > 0 and conservative_margin >= 0.35:
+        elif profitable and conservative_margin >= 0.35:
             margin_score = 70
-        elif monthly_profit_after_fixed > 0 and conservative_margin >= 0.20:
+        elif profitable and conservative_margin >= 0.20:
             margin_score = 55
         else:
             margin_score = 35
 
         if margin_gap > 0.15:
             margin_score = min(margin_score, 55)
-            input_warnings.append(
-                "Expected business gross margin and representative product margin "
+            warnings.append(
+                f"Expected business gross margin and {pricing_node['margin_source']} margin "
                 f"differ by {margin_gap:.1%}; reconcile the assumptions."
             )
+    return {"margin_score": margin_score, "margin_gap": margin_gap, "warnings": warnings}
 
+
+def feasibility_competition_node(site: Dict[str, Any]) -> Dict[str, Any]:
     competitors = int(_as_float(site.get("competitors")))
     competition_score = 80
     if competitors > 20:
@@ -208,63 +360,352 @@ def calculate_open_store_feasibility(
         competition_score = 55
     elif competitors > 6:
         competition_score = 70
+    return {"competitors": competitors, "competition_score": competition_score}
+
+
+def feasibility_aggregate_node(
+    site_node: Dict[str, Any],
+    cash_node: Dict[str, Any],
+    margin_node: Dict[str, Any],
+    competition_node: Dict[str, Any],
+    pricing_node: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Weighted overall score, blocking inputs and the launch decision."""
+    pricing_check = pricing_node["pricing_check"]
+    input_errors = cash_node["input_errors"] + pricing_check["errors"]
+    input_warnings = pricing_check["warnings"] + margin_node["warnings"]
 
-    score_weights = {
-        "site": 0.35,
-        "cash": 0.35,
-        "margin": 0.20,
-        "competition": 0.10,
-    }
     overall_score = int(round(
-        site_score * score_weights["site"]
-        + cash_score * score_weights["cash"]
-        + margin_score * score_weights["margin"]
-        + competition_score * score_weights["competition"]
+        site_node["site_score"] * SCORE_WEIGHTS["site"]
+        + cash_node["cash_score"] * SCORE_WEIGHTS["cash"]
+        + margin_node["margin_score"] * SCORE_WEIGHTS["margin"]
+        + competition_node["competition_score"] * SCORE_WEIGHTS["competition"]
     ))
 
     decision_ready = not input_errors
     if not decision_ready:
         decision = "REVIEW INPUTS"
-    elif overall_score >= 75 and funding_gap <= 0 and monthly_profit_after_fixed >= 0:
+    elif (
+        overall_score >= 75
+        and cash_node["funding_gap"] <= 0
+        and cash_node["monthly_profit_after_fixed"] >= 0
+    ):
         decision = "GO"
     elif overall_score >= 55:
         decision = "CAUTION"
     else:
         decision = "NO-GO"
 
+    return {
+        "input_errors": input_errors,
+        "input_warnings": input_warnings,
+        "overall_score": overall_score,
+        "decision": decision,
+        "decision_ready": decision_ready,
+    }
+
+
+def feasibility_risks_node(
+    aggregate_node: Dict[str, Any],
+    cash_node: Dict[str, Any],
+    site_node: Dict[str, Any],
+    competition_node: Dict[str, Any],
+    pricing_node: Dict[str, Any],
+) -> Dict[str, Any]:
     risks: List[str] = []
-    risks.extend(f"Input error: {message}" for message in input_errors)
-    risks.extend(f"Assumption warning: {message}" for message in input_warnings)
+    risks.extend(f"Input error: {message}" for message in aggregate_node["input_errors"])
+    risks.extend(f"Assumption warning: {message}" for message in aggregate_node["input_warnings"])
+    funding_gap = cash_node["funding_gap"]
     if funding_gap > 0:
         risks.append(f"Funding gap of USD {funding_gap:,.0f} against target cash runway")
-    if runway_months < target_months:
+    if cash_node["runway_months"] < cash_node["target_months"]:
         risks.append(
-            f"Cash runway is {runway_months:.1f} months, below the target of "
-            f"{target_months:g} months"
+            f"Cash runway is {cash_node['runway_months']:.1f} months, below the target of "
+            f"{cash_node['target_months']:g} months"
         )
+    monthly_profit_after_fixed = cash_node["monthly_profit_after_fixed"]
     if monthly_profit_after_fixed < 0:
         risks.append(
             "Expected monthly gross profit does not cover fixed costs; "
             f"estimated shortfall is USD {abs(monthly_profit_after_fixed):,.0f}/month"
         )
-    if site.get("rent_level") == "High":
+    if site_node["rent_is_high"]:
         risks.append("Rent level is marked High, increasing break-even pressure")
+    competitors = competition_node["competitors"]
     if competitors > 12:
         risks.append(
             f"Competitive density is high with {competitors} competitors in the selected radius"
         )
-
-    competitor_price = pricing_check["competitor_price"]
-    planned_price = pricing_check["planned_price"]
-    price_vs_competitor = (
-        (planned_price - competitor_price) / competitor_price
-        if competitor_price > 0
-        else 0.0
-    )
+    price_vs_competitor = pricing_node["price_vs_competitor"]
     if price_vs_competitor > 0.10:
         risks.append(
             f"Planned price is {price_vs_competitor:.1%} above competitor price"
         )
+    return {"risks": risks}
+
+
+def assemble_feasibility_result(nodes: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Flatten node outputs into the result dict the UI and reports consume."""
+    pricing_node = nodes["pricing"]
+    pricing_check = pricing_node["pricing_check"]
+    cash = nodes["cash"]
+    aggregate = nodes["aggregate"]
+    return {
+        "startup_cost": cash["startup_cost"],
+        "monthly_fixed_cost": cash["monthly_fixed_cost"],
+        "remaining_cash": cash["remaining_cash"],
+        "runway_months": cash["runway_months"],
+        "target_cash_need": cash["target_cash_need"],
+        "funding_gap": cash["funding_gap"],
+        "expected_revenue": cash["expected_revenue"],
+        "expected_gross_margin_pct": cash["expected_gm"] * 100,
+        "contribution_profit": cash["contribution_profit"],
+        "monthly_profit_after_fixed": cash["monthly_profit_after_fixed"],
+        "breakeven_revenue": cash["breakeven_revenue"],
+        "site_score": nodes["site"]["site_score"],
+        "cash_score": cash["cash_score"],
+        "margin_score": nodes["margin"]["margin_score"],
+        "competition_score": nodes["competition"]["competition_score"],
+        "overall_score": aggregate["overall_score"],
+        "decision": aggregate["decision"],
+        "decision_ready": aggregate["decision_ready"],
+        "recommended_price": pricing_check["planned_price"],
+        "unit_cost": pricing_check["cost"],
+        "competitor_price": pricing_check["competitor_price"],
+        "implied_margin_pct": pricing_node["product_margin"] * 100,
+        "product_margin_source": pricing_node["margin_source"],
+        "implied_markup_pct": pricing_check["implied_markup"] * 100,
+        "price_vs_competitor_pct": pricing_node["price_vs_competitor"] * 100,
+        "margin_assumption_gap_pct": nodes["margin"]["margin_gap"] * 100,
+        "input_errors": list(aggregate["input_errors"]),
+        "input_warnings": list(aggregate["input_warnings"]),
+        "pricing_valid": pricing_check["valid"],
+        "score_weights": dict(SCORE_WEIGHTS),
+        "risks": list(nodes["risks"]["risks"]),
+    }
+
+
+def calculate_open_store_feasibility(
+    profile: Dict[str, Any],
+    site: Dict[str, Any],
+    launch: Dict[str, Any],
+    pricing: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Calculate the single source of truth for scores and launch decisions."""
+    nodes: Dict[str, Dict[str, Any]] = {
+        "pricing": feasibility_pricing_node(pricing),
+        "site": feasibility_site_node(site),
+        "cash": feasibility_cash_node(profile, launch),
+        "competition": feasibility_competition_node(site),
+    }
+    nodes["margin"] = feasibility_margin_node(nodes["pricing"], nodes["cash"])
+    nodes["aggregate"] = feasibility_aggregate_node(
+        nodes["site"], nodes["cash"], nodes["margin"], nodes["competition"], nodes["pricing"]
+    )
+    nodes["risks"] = feasibility_risks_node(
+        nodes["aggregate"], nodes["cash"], nodes["site"], nodes["competition"], nodes["pricing"]
+    )
+    return assemble_feasibility_result(nodes)
+
+
+BATCH_INPUT_FIELDS = (
+    "budget",
+    "funding_available",
+    "startup_cost_estimate",
+    "monthly_fixed_cost_estimate",
+    "expected_monthly_revenue",
+    "expected_gross_margin",
+    "cash_target_months",
+    "traffic",
+    "competitors",
+    "rent_level",
+    "parking",
+    "cost",
+    "planned_price",
+    "competitor_price",
+    "mix_weighted_margin",
+)
+
+
+def _batch_size(columns: Mapping[str, Any], fields: Sequence[str] = BATCH_INPUT_FIELDS) -> int:
+    sizes = [
+        np.size(columns[name])
+        for name in fields
+        if name in columns and np.ndim(columns[name]) > 0
+    ]
+    return max(sizes) if sizes else 1
+
+
+def _as_float_array(
+    columns: Mapping[str, Any],
+    name: str,
+    size: int,
+    default: Any = 0.0,
+) -> np.ndarray:
+    """Vectorized `_as_float`: bad or non-finite cells fall back to `default`."""
+    fallback = np.broadcast_to(np.asarray(default, dtype=float), (size,))
+    if name not in columns:
+        return fallback.copy()
+    values = columns[name]
+    try:
+        numbers = np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        cells = np.asarray(values, dtype=object).ravel()
+        numbers = np.array([_as_float(cell, math.nan) for cell in cells], dtype=float)
+    numbers = np.broadcast_to(numbers.reshape(-1) if numbers.ndim else numbers, (size,)).copy()
+    bad = ~np.isfinite(numbers)
+    numbers[bad] = fallback[bad]
+    return numbers
+
+
+def _as_str_array(
+    columns: Mapping[str, Any],
+    name: str,
+    size: int,
+    default: str,
+) -> np.ndarray:
+    if name not in columns:
+        return np.full(size, default, dtype=object)
+    if np.ndim(columns[name]) == 0:
+        return np.full(size, str(columns[name]), dtype=object)
+    values = np.asarray(columns[name], dtype=object)
+    values = np.broadcast_to(values.reshape(-1) if values.ndim else values, (size,))
+    return np.array([str(value) for value in values], dtype=object)
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray, fill: float) -> np.ndarray:
+    out = np.full(np.shape(denominator), fill, dtype=float)
+    return np.divide(numerator, denominator, out=out, where=denominator > 0)
+
+
+def calculate_open_store_feasibility_batch(
+    columns: Mapping[str, Any],
+) -> Dict[str, np.ndarray]:
+    """Score many launch scenarios at once with the same rules as the scalar path.
+
+    ``columns`` is a DataFrame or a mapping of column name to array-like (or
+    scalar, broadcast to every row). Column names are the flat keys of the
+    profile/site/launch/pricing dicts, for example ``budget``, ``traffic``,
+    ``expected_monthly_revenue`` and ``planned_price``. Missing columns take
+    the same defaults as :func:`calculate_open_store_feasibility`.
+
+    Returns a dict of equal-length NumPy arrays holding every numeric result
+    key of the scalar function plus ``input_error_count`` and
+    ``input_warning_count`` in place of the message lists.
+    """
+    size = _batch_size(columns)
+
+    budget = _as_float_array(columns, "budget", size)
+    funding_available = _as_float_array(columns, "funding_available", size, budget)
+    startup_cost = _as_float_array(columns, "startup_cost_estimate", size)
+    monthly_fixed_cost = _as_float_array(columns, "monthly_fixed_cost_estimate", size)
+    expected_revenue = _as_float_array(columns, "expected_monthly_revenue", size)
+    expected_gm = _as_float_array(columns, "expected_gross_margin", size) / 100.0
+    target_months = np.maximum(1.0, _as_float_array(columns, "cash_target_months", size, 3.0))
+
+    cost = _as_float_array(columns, "cost", size)
+    planned_price = _as_float_array(columns, "planned_price", size)
+    competitor_price = _as_float_array(columns, "competitor_price", size)
+
+    traffic = np.trunc(_as_float_array(columns, "traffic", size))
+    competitors = np.trunc(_as_float_array(columns, "competitors", size))
+    rent_level = _as_str_array(columns, "rent_level", size, "Medium")
+    parking = _as_str_array(columns, "parking", size, "Medium")
+
+    # Pricing check, mirroring validate_pricing.
+    pricing_errors = (
+        (cost <= 0).astype(int)
+        + (planned_price <= 0)
+        + ((cost > 0) & (planned_price > 0) & (planned_price <= cost))
+    )
+    pricing_valid = pricing_errors == 0
+    product_margin = _safe_divide(planned_price - cost, planned_price, 0.0)
+    implied_markup = _safe_divide(planned_price - cost, cost, 0.0)
+    price_ratio = _safe_divide(planned_price, competitor_price, 1.0)
+    ratio_warning = (
+        (competitor_price > 0)
+        & (planned_price > 0)
+        & ((price_ratio < 0.50) | (price_ratio > 1.50))
+    )
+    input_warning_count = (pricing_valid & (product_margin < 0.10)).astype(int) + ratio_warning
+
+    input_error_count = (
+        (funding_available <= 0).astype(int)
+        + (startup_cost < 0)
+        + (monthly_fixed_cost <= 0)
+        + (expected_revenue <= 0)
+        + ~((0 < expected_gm) & (expected_gm < 1))
+        + pricing_errors
+    )
+
+    remaining_cash = funding_available - startup_cost
+    runway_months = _safe_divide(remaining_cash, monthly_fixed_cost, math.inf)
+    target_cash_need = monthly_fixed_cost * target_months
+    funding_gap = np.maximum(0.0, startup_cost + target_cash_need - funding_available)
+    contribution_profit = expected_revenue * expected_gm
+    monthly_profit_after_fixed = contribution_profit - monthly_fixed_cost
+    breakeven_revenue = _safe_divide(monthly_fixed_cost, expected_gm, math.inf)
+
+    site_score = (
+        55.0
+        + np.select([traffic >= 40000, traffic >= 25000], [10, 6], 2)
+        + np.select([competitors <= 6, competitors <= 12], [12, 6], -6)
+        + np.select([rent_level == "Low", rent_level == "Medium"], [8, 3], -6)
+        + np.select([parking == "High", parking == "Medium"], [6, 2], -4)
+    )
+    site_score = np.clip(site_score, 0, 100).astype(int)
+
+    cash_score = np.select(
+        [runway_months < 1, runway_months < 2, runway_months < target_months],
+        [20, 45, 65],
+        85,
+    )
+    cash_score = np.where(funding_gap > 0, np.maximum(15, cash_score - 20), cash_score)
+
+    catalog_margin = _as_float_array(columns, "mix_weighted_margin", size, math.nan)
+    product_margin = np.where(np.isfinite(catalog_margin), catalog_margin, product_margin)
+    margin_gap = np.abs(expected_gm - product_margin)
+    conservative_margin = np.minimum(expected_gm, product_margin)
+    profitable = monthly_profit_after_fixed > 0
+    margin_score = np.select(
+        [
+            profitable & (conservative_margin >= 0.55),
+            profitable & (conservative_margin >= 0.35),
+            profitable & (conservative_margin >= 0.20),
+        ],
+        [85, 70, 55],
+        35,
+    )
+    margin_mismatch = pricing_valid & (margin_gap > 0.15)
+    margin_score = np.where(margin_mismatch, np.minimum(margin_score, 55), margin_score)
+    margin_score = np.where(pricing_valid, margin_score, 0)
+    input_warning_count = input_warning_count + margin_mismatch
+
+    competition_score = np.select(
+        [competitors > 20, competitors > 12, competitors > 6],
+        [35, 55, 70],
+        80,
+    )
+
+    overall_score = np.round(
+        site_score * SCORE_WEIGHTS["site"]
+        + cash_score * SCORE_WEIGHTS["cash"]
+        + margin_score * SCORE_WEIGHTS["margin"]
+        + competition_score * SCORE_WEIGHTS["competition"]
+    ).astype(int)
+
+    decision_ready = input_error_count == 0
+    decision = np.select(
+        [
+            ~decision_ready,
+            (overall_score >= 75) & (funding_gap <= 0) & (monthly_profit_after_fixed >= 0),
+            overall_score >= 55,
+        ],
+        ["REVIEW INPUTS", "GO", "CAUTION"],
+        "NO-GO",
+    ).astype(object)
+
+    price_vs_competitor = _safe_divide(planned_price - competitor_price, competitor_price, 0.0)
 
     return {
         "startup_cost": startup_cost,
@@ -279,22 +720,20 @@ def calculate_open_store_feasibility(
         "monthly_profit_after_fixed": monthly_profit_after_fixed,
         "breakeven_revenue": breakeven_revenue,
         "site_score": site_score,
-        "cash_score": cash_score,
-        "margin_score": margin_score,
-        "competition_score": competition_score,
+        "cash_score": cash_score.astype(int),
+        "margin_score": margin_score.astype(int),
+        "competition_score": competition_score.astype(int),
         "overall_score": overall_score,
         "decision": decision,
         "decision_ready": decision_ready,
         "recommended_price": planned_price,
-        "unit_cost": pricing_check["cost"],
+        "unit_cost": cost,
         "competitor_price": competitor_price,
         "implied_margin_pct": product_margin * 100,
-        "implied_markup_pct": pricing_check["implied_markup"] * 100,
+        "implied_markup_pct": implied_markup * 100,
         "price_vs_competitor_pct": price_vs_competitor * 100,
         "margin_assumption_gap_pct": margin_gap * 100,
-        "input_errors": input_errors,
-        "input_warnings": input_warnings,
-        "pricing_valid": pricing_check["valid"],
-        "score_weights": score_weights,
-        "risks": risks,
+        "pricing_valid": pricing_valid,
+        "input_error_count": input_error_count.astype(int),
+        "input_warning_count": input_warning_count.astype(int),
     }
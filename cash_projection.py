@@ -0,0 +1,167 @@
+"""Month-by-month launch cash projection.
+
+``runway_months`` in ``business_logic`` divides remaining cash by fixed cost
+and assumes full revenue from day one. This module projects the cash balance
+month by month with a revenue ramp, optional seasonality and a startup-cost
+phase-in, for many scenarios at once using (scenario x month) arrays.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+import numpy as np
+
+from business_logic import BATCH_INPUT_FIELDS, _as_float_array, _batch_size
+
+
+DEFAULT_PROJECTION_MONTHS = 36
+DEFAULT_RAMP_MONTHS = 6
+DEFAULT_RAMP_START = 0.60
+DEFAULT_BUILDOUT_MONTHS = 2
+
+# Legacy detail fields that shape when the startup estimate is spent. The
+# buildout is spread over the first months; the rest is paid before opening.
+PHASE_IN_FIELDS = (
+    "buildout_cost",
+    "licenses_deposits",
+    "equipment_cost",
+    "initial_inventory_budget",
+    "launch_marketing_budget",
+)
+
+
+def revenue_ramp(months: int, ramp_months: int, ramp_start: float) -> np.ndarray:
+    """Linear share of steady-state revenue reached in each month."""
+    ramp_months = max(1, int(ramp_months))
+    ramp_start = min(1.0, max(0.0, float(ramp_start)))
+    if ramp_months == 1:
+        return np.ones(months)
+    steps = np.arange(months, dtype=float)
+    return np.minimum(1.0, ramp_start + (1.0 - ramp_start) * steps / (ramp_months - 1))
+
+
+def _seasonality_curve(months: int, seasonality: Optional[Sequence[float]], start_month: int) -> np.ndarray:
+    if seasonality is None:
+        return np.ones(months)
+    factors = np.asarray(seasonality, dtype=float)
+    if factors.shape != (12,) or not np.all(np.isfinite(factors)) or np.any(factors < 0):
+        raise ValueError("Seasonality needs 12 non-negative monthly multipliers.")
+    calendar = (np.arange(months) + int(start_month) - 1) % 12
+    return factors[calendar]
+
+
+def _startup_schedule(columns: Mapping[str, Any], size: int, months: int, buildout_months: int) -> np.ndarray:
+    startup = np.maximum(0.0, _as_float_array(columns, "startup_cost_estimate", size))
+    parts = {name: np.maximum(0.0, _as_float_array(columns, name, size)) for name in PHASE_IN_FIELDS}
+    detail_total = sum(parts.values())
+    has_detail = detail_total > 0
+    scale = np.divide(startup, detail_total, out=np.zeros(size), where=has_detail)
+
+    schedule = np.zeros((size, months))
+    spread = max(1, min(int(buildout_months), months))
+    schedule[:, :spread] += (parts["buildout_cost"] * scale / spread)[:, None]
+    upfront = sum(parts[name] for name in PHASE_IN_FIELDS if name != "buildout_cost") * scale
+    schedule[:, 0] += np.where(has_detail, upfront, startup)
+    return schedule
+
+
+def project_cash_flow_batch(
+    columns: Mapping[str, Any],
+    months: int = DEFAULT_PROJECTION_MONTHS,
+    ramp_months: int = DEFAULT_RAMP_MONTHS,
+    ramp_start: float = DEFAULT_RAMP_START,
+    seasonality: Optional[Sequence[float]] = None,
+    start_month: int = 1,
+    buildout_months: int = DEFAULT_BUILDOUT_MONTHS,
+) -> Dict[str, np.ndarray]:
+    """Project monthly cash for every scenario in ``columns``.
+
+    ``columns`` uses the flat layout of
+    :func:`business_logic.calculate_open_store_feasibility_batch`, plus the
+    optional legacy phase-in fields. Monthly arrays have shape
+    ``(scenarios, months)``. ``cash_out_month`` is the first 1-based month
+    with a negative balance, or 0 when cash stays positive over the horizon.
+    """
+    months = int(months)
+    if not 1 <= months <= 120:
+        raise ValueError("Projection horizon must be between 1 and 120 months.")
+    size = _batch_size(columns, BATCH_INPUT_FIELDS + PHASE_IN_FIELDS)
+
+    budget = _as_float_array(columns, "budget", size)
+    funding = _as_float_array(columns, "funding_available", size, budget)
+    steady_revenue = np.maximum(0.0, _as_float_array(columns, "expected_monthly_revenue", size))
+    gross_margin = _as_float_array(columns, "expected_gross_margin", size) / 100.0
+    fixed_cost = np.maximum(0.0, _as_float_array(columns, "monthly_fixed_cost_estimate", size))
+
+    curve = revenue_ramp(months, ramp_months, ramp_start) * _seasonality_curve(months, seasonality, start_month)
+    revenue = steady_revenue[:, None] * curve[None, :]
+    gross_profit = revenue * gross_margin[:, None]
+    operating_cash_flow = gross_profit - fixed_cost[:, None]
+    startup_outflow = _startup_schedule(columns, size, months, buildout_months)
+    net_cash_flow = operating_cash_flow - startup_outflow
+    cash_balance = funding[:, None] + np.cumsum(net_cash_flow, axis=1)
+
+    negative = cash_balance < 0
+    cash_out_month = np.where(negative.any(axis=1), negative.argmax(axis=1) + 1, 0)
+    profitable = operating_cash_flow >= 0
+    first_profitable_month = np.where(profitable.any(axis=1), profitable.argmax(axis=1) + 1, 0)
+    min_index = cash_balance.argmin(axis=1)
+
+    return {
+        "month": np.arange(1, months + 1),
+        "revenue": revenue,
+        "gross_profit": gross_profit,
+        "startup_outflow": startup_outflow,
+        "net_cash_flow": net_cash_flow,
+        "cash_balance": cash_balance,
+        "cash_out_month": cash_out_month,
+        "first_profitable_month": first_profitable_month,
+        "min_cash": cash_balance[np.arange(size), min_index],
+        "min_cash_month": min_index + 1,
+        "ending_cash": cash_balance[:, -1],
+    }
+
+
+def project_open_store_cash(
+    profile: Dict[str, Any],
+    launch: Dict[str, Any],
+    months: int = DEFAULT_PROJECTION_MONTHS,
+    **options: Any,
+) -> Dict[str, Any]:
+    """Project one scenario and return plain lists and numbers for the UI."""
+    batch = project_cash_flow_batch({**profile, **launch}, months=months, **options)
+    return {
+        "months": months,
+        "ramp_months": options.get("ramp_months", DEFAULT_RAMP_MONTHS),
+        "ramp_start": options.get("ramp_start", DEFAULT_RAMP_START),
+        "month": batch["month"].tolist(),
+        "revenue": batch["revenue"][0].tolist(),
+        "net_cash_flow": batch["net_cash_flow"][0].tolist(),
+        "cash_balance": batch["cash_balance"][0].tolist(),
+        "cash_out_month": int(batch["cash_out_month"][0]),
+        "first_profitable_month": int(batch["first_profitable_month"][0]),
+        "min_cash": float(batch["min_cash"][0]),
+        "min_cash_month": int(batch["min_cash_month"][0]),
+        "ending_cash": float(batch["ending_cash"][0]),
+    }
+
+
+def summarize_cash_projection(projection: Dict[str, Any]) -> str:
+    """Compact text summary of a single projection for AI prompts."""
+    cash_out = (
+        f"cash runs out in month {projection['cash_out_month']}"
+        if projection["cash_out_month"]
+        else f"cash stays positive through month {projection['months']}"
+    )
+    profitable = (
+        f"first month covering fixed costs: {projection['first_profitable_month']}"
+        if projection["first_profitable_month"]
+        else "no month covers fixed costs within the horizon"
+    )
+    return (
+        f"{projection['months']}-month projection with revenue ramping from "
+        f"{projection['ramp_start']:.0%} to 100% over {projection['ramp_months']} months: "
+        f"{cash_out}; {profitable}; lowest cash USD {projection['min_cash']:,.0f} "
+        f"in month {projection['min_cash_month']}; ending cash USD {projection['ending_cash']:,.0f}."
+    )
@@ -0,0 +1,142 @@
+"""Offline stand-in for the Gemini client used by the AI helpers.
+
+``FakeAIClient().models`` has the same ``generate_content`` and
+``generate_content_stream`` surface that :func:`ai_reliability.request_ai_text`
+and :func:`ai_reliability.stream_ai_text` call, so the AI request path can
+be benchmarked and load-tested without the real provider. Each model gets a
+:class:`FakeModelProfile` with a latency distribution plus failure, timeout
+and empty-response rates; draws come from one seeded generator so runs are
+repeatable.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+import random
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+
+LatencyDistribution = Callable[[random.Random], float]
+
+
+def constant_latency(seconds: float) -> LatencyDistribution:
+    return lambda rng: seconds
+
+
+def uniform_latency(low: float, high: float) -> LatencyDistribution:
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal_latency(median: float, sigma: float = 0.5, cap: float | None = None) -> LatencyDistribution:
+    """Right-skewed latency around ``median`` seconds, the usual shape for LLM calls."""
+    def draw(rng: random.Random) -> float:
+        value = rng.lognormvariate(0.0, sigma) * median
+        return min(value, cap) if cap is not None else value
+    return draw
+
+
+@dataclass(frozen=True)
+class FakeModelProfile:
+    """Behaviour of one fake model.
+
+    ``timeout_rate`` requests sleep ``timeout_seconds`` and then raise a
+    timeout error, like a request that hits the client deadline.
+    """
+
+    latency: LatencyDistribution = constant_latency(0.0)
+    failure_rate: float = 0.0
+    timeout_rate: float = 0.0
+    empty_rate: float = 0.0
+    timeout_seconds: float = 30.0
+    response_chars: int = 800
+    stream_chunks: int = 8
+
+
+class FakeModels:
+    """The ``client.models`` object: per-model profiles and call counts."""
+
+    def __init__(
+        self,
+        profiles: Mapping[str, FakeModelProfile],
+        default: FakeModelProfile,
+        seed: int | None,
+        sleep: Callable[[float], None],
+    ) -> None:
+        self.profiles = dict(profiles)
+        self.default = default
+        self._rng = random.Random(seed)
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.calls: Counter[str] = Counter()
+
+    def _plan(self, model: str) -> tuple[FakeModelProfile, str, float]:
+        profile = self.profiles.get(model, self.default)
+        with self._lock:
+            self.calls[model] += 1
+            roll = self._rng.random()
+            latency = max(0.0, profile.latency(self._rng))
+        if roll < profile.timeout_rate:
+            return profile, "timeout", profile.timeout_seconds
+        roll -= profile.timeout_rate
+        if roll < profile.failure_rate:
+            return profile, "failure", latency
+        roll -= profile.failure_rate
+        if roll < profile.empty_rate:
+            return profile, "empty", latency
+        return profile, "ok", latency
+
+    @staticmethod
+    def _text(model: str, contents: Any, profile: FakeModelProfile) -> str:
+        header = f"## Fake answer from {model}\nPrompt length: {len(str(contents))} characters.\n"
+        filler = "Inventory, cash and margin look stable this week. "
+        body = (filler * (profile.response_chars // len(filler) + 1))[:max(0, profile.response_chars - len(header))]
+        return header + body
+
+    def generate_content(self, model: str, contents: Any, config: Any = None) -> SimpleNamespace:
+        profile, outcome, latency = self._plan(model)
+        self._sleep(latency)
+        if outcome == "timeout":
+            raise TimeoutError(f"{model}: request timed out")
+        if outcome == "failure":
+            raise RuntimeError(f"{model}: 503 service unavailable")
+        return SimpleNamespace(text="" if outcome == "empty" else self._text(model, contents, profile))
+
+    def generate_content_stream(self, model: str, contents: Any, config: Any = None) -> Iterator[SimpleNamespace]:
+        profile, outcome, latency = self._plan(model)
+        if outcome == "timeout":
+            self._sleep(latency)
+            raise TimeoutError(f"{model}: request timed out")
+        if outcome == "failure":
+            self._sleep(latency)
+            raise RuntimeError(f"{model}: 503 service unavailable")
+        if outcome == "empty":
+            self._sleep(latency)
+            return
+        text = self._text(model, contents, profile)
+        chunks = max(1, profile.stream_chunks)
+        size = -(-len(text) // chunks)
+        for start in range(0, len(text), size):
+            self._sleep(latency / chunks)
+            yield SimpleNamespace(text=text[start:start + size])
+
+
+class FakeAIClient:
+    """Drop-in for ``genai.Client`` in the AI request helpers.
+
+    ``profiles`` maps model names to behaviour; other models use
+    ``default``. ``sleep`` can be replaced to run without real delays.
+    """
+
+    def __init__(
+        self,
+        profiles: Mapping[str, FakeModelProfile] | None = None,
+        default: FakeModelProfile | None = None,
+        seed: int | None = 0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.models = FakeModels(profiles or {}, default or FakeModelProfile(), seed, sleep)
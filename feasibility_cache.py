@@ -0,0 +1,155 @@
+"""Process-wide memoization for Open a Store feasibility results.
+
+Streamlit reruns the script on every widget change and the decision page asks
+for the same metrics several times per rerun. Results are cached under a
+fingerprint of only the inputs the calculation reads, normalized the same way
+the calculation normalizes them, so notes, addresses and other unrelated
+fields never cause a miss. The module-level cache is shared by every session
+in the process, so sessions on the same demo inputs reuse each other's work.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import json
+import math
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from business_logic import _as_float, calculate_open_store_feasibility
+
+
+FINGERPRINT_FIELDS = {
+    "profile": ("budget",),
+    "site": ("traffic", "competitors", "rent_level", "parking"),
+    "launch": (
+        "funding_available",
+        "startup_cost_estimate",
+        "monthly_fixed_cost_estimate",
+        "expected_monthly_revenue",
+        "expected_gross_margin",
+        "cash_target_months",
+    ),
+    "pricing": ("cost", "planned_price", "competitor_price", "mix_weighted_margin"),
+}
+_TEXT_FIELDS = {"rent_level", "parking"}
+
+
+def normalized_input(field: str, section: Dict[str, Any]) -> Any:
+    """Return ``section[field]`` as the calculation reads it, or None when unusable."""
+    if field not in section:
+        return None
+    value = section[field]
+    if field in _TEXT_FIELDS:
+        return str(value)
+    number = _as_float(value, math.nan)
+    return number if math.isfinite(number) else None
+
+
+def feasibility_fingerprint(
+    profile: Dict[str, Any],
+    site: Dict[str, Any],
+    launch: Dict[str, Any],
+    pricing: Dict[str, Any],
+) -> str:
+    """Return a stable hash of the inputs that affect the feasibility result."""
+    sections = {"profile": profile, "site": site, "launch": launch, "pricing": pricing}
+    canonical = {
+        name: [normalized_input(field, sections[name] or {}) for field in fields]
+        for name, fields in FINGERPRINT_FIELDS.items()
+    }
+    payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy the mutable list/dict values so callers cannot alter the cache."""
+    return {
+        key: list(value) if isinstance(value, list) else dict(value) if isinstance(value, dict) else value
+        for key, value in result.items()
+    }
+
+
+class FeasibilityCache:
+    """Thread-safe bounded LRU cache of feasibility result dicts."""
+
+    def __init__(
+        self,
+        maxsize: int = 512,
+        compute: Callable[..., Dict[str, Any]] = calculate_open_store_feasibility,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = int(maxsize)
+        self._compute = compute
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(
+        self,
+        profile: Dict[str, Any],
+        site: Dict[str, Any],
+        launch: Dict[str, Any],
+        pricing: Dict[str, Any],
+        compute: Optional[Callable[..., Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """Return the cached result, or compute it with ``compute`` (default: the cache's own)."""
+        key = feasibility_fingerprint(profile, site, launch, pricing)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _copy_result(cached)
+            self.misses += 1
+
+        result = (compute or self._compute)(profile, site, launch, pricing)
+        with self._lock:
+            self._entries[key] = _copy_result(result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+SHARED_FEASIBILITY_CACHE = FeasibilityCache()
+
+
+def cached_open_store_feasibility(
+    profile: Dict[str, Any],
+    site: Dict[str, Any],
+    launch: Dict[str, Any],
+    pricing: Dict[str, Any],
+    cache: Optional[FeasibilityCache] = None,
+    compute: Optional[Callable[..., Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """Memoized :func:`calculate_open_store_feasibility` on the shared cache.
+
+    ``compute`` replaces the full calculation on a miss, e.g. with a
+    :class:`feasibility_graph.FeasibilityGraph` update that gives the same result.
+    """
+    return (cache or SHARED_FEASIBILITY_CACHE).get_or_compute(profile, site, launch, pricing, compute)
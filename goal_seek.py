@@ -0,0 +1,201 @@
+"""Goal-seek solver: what price, revenue or funding reaches a launch target.
+
+Targets are either the ``"GO"`` decision or a minimum ``overall_score``.
+Funding and revenue only move the score at known breakpoints (runway
+thresholds and break-even revenue), so they are solved in closed form by
+scoring those breakpoints. Planned price has no closed form because the
+product margin feeds both the margin tiers and the assumption-gap cap, so it
+is bracketed on a grid and refined by bisection. Every step evaluates all
+scenarios together through the batch feasibility path.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping, Union
+
+import numpy as np
+
+from business_logic import (
+    BATCH_INPUT_FIELDS,
+    _as_float_array,
+    _batch_size,
+    calculate_open_store_feasibility_batch,
+)
+
+
+SOLVABLE_INPUTS = ("planned_price", "expected_monthly_revenue", "funding_available")
+Target = Union[str, int, float]
+
+_NUDGE_ULPS = 4
+_MIN_POSITIVE_AMOUNT = 0.01
+
+
+def _columns_as_arrays(columns: Mapping[str, Any], size: int) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for name in BATCH_INPUT_FIELDS:
+        if name not in columns:
+            continue
+        values = columns[name]
+        if np.ndim(values) == 0:
+            out[name] = values
+        else:
+            out[name] = np.broadcast_to(np.asarray(values).reshape(-1), (size,))
+    return out
+
+
+def _current_values(columns: Dict[str, Any], variable: str, size: int) -> np.ndarray:
+    default = _as_float_array(columns, "budget", size) if variable == "funding_available" else 0.0
+    return _as_float_array(columns, variable, size, default)
+
+
+def _repeat_columns(columns: Dict[str, Any], repeats: int) -> Dict[str, Any]:
+    return {
+        name: values if np.ndim(values) == 0 else np.repeat(values, repeats)
+        for name, values in columns.items()
+    }
+
+
+def _meets_target(batch: Dict[str, np.ndarray], target: Target) -> np.ndarray:
+    if isinstance(target, str):
+        if target != "GO":
+            raise ValueError("Decision targets must be 'GO'.")
+        return batch["decision"] == "GO"
+    return batch["decision_ready"] & (batch["overall_score"] >= float(target))
+
+
+def _evaluate_candidates(
+    columns: Dict[str, Any],
+    variable: str,
+    candidates: np.ndarray,
+    target: Target,
+) -> np.ndarray:
+    """Score an (n, k) candidate matrix in one batch and return the hit mask."""
+    size, width = candidates.shape
+    trial = _repeat_columns(columns, width)
+    trial[variable] = candidates.reshape(-1)
+    batch = calculate_open_store_feasibility_batch(trial)
+    return _meets_target(batch, target).reshape(size, width)
+
+
+def _with_ulp_nudges(breakpoints: np.ndarray) -> np.ndarray:
+    """Add a few representable values above each breakpoint to absorb rounding."""
+    steps = [breakpoints]
+    for _ in range(_NUDGE_ULPS):
+        steps.append(np.nextafter(steps[-1], np.inf))
+    return np.concatenate(steps, axis=1)
+
+
+def _closed_form_breakpoints(columns: Dict[str, Any], variable: str, size: int) -> np.ndarray:
+    startup = _as_float_array(columns, "startup_cost_estimate", size)
+    fixed = _as_float_array(columns, "monthly_fixed_cost_estimate", size)
+    floor = np.full(size, _MIN_POSITIVE_AMOUNT)
+    if variable == "funding_available":
+        target_months = np.maximum(1.0, _as_float_array(columns, "cash_target_months", size, 3.0))
+        # Cash score changes when runway reaches 1 month, 2 months and the
+        # target; the funding gap closes at the target as well.
+        points = [floor, startup + fixed, startup + 2 * fixed, startup + fixed * target_months]
+    else:
+        gross_margin = _as_float_array(columns, "expected_gross_margin", size) / 100.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            breakeven = np.where(gross_margin > 0, fixed / gross_margin, np.inf)
+        points = [floor, breakeven]
+    stacked = np.stack(points, axis=1)
+    stacked = np.where(np.isfinite(stacked) & (stacked > 0), stacked, _MIN_POSITIVE_AMOUNT)
+    return _with_ulp_nudges(stacked)
+
+
+def _bisect_minimum(
+    columns: Dict[str, Any],
+    variable: str,
+    size: int,
+    target: Target,
+    grid_points: int,
+    iterations: int,
+) -> np.ndarray:
+    cost = _as_float_array(columns, "cost", size)
+    planned = _as_float_array(columns, "planned_price", size)
+    competitor = _as_float_array(columns, "competitor_price", size)
+    low = np.nextafter(np.maximum(cost, 0.0), np.inf)
+    high = np.maximum.reduce([cost * 10.0, planned * 3.0, competitor * 3.0, low + 1.0])
+
+    fractions = np.linspace(0.0, 1.0, grid_points)
+    grid = low[:, None] + (high - low)[:, None] * fractions[None, :]
+    hits = _evaluate_candidates(columns, variable, grid, target)
+    reachable = hits.any(axis=1)
+    first = np.where(reachable, hits.argmax(axis=1), 0)
+
+    rows = np.arange(size)
+    upper = grid[rows, first]
+    lower = np.where(first > 0, grid[rows, np.maximum(first - 1, 0)], upper)
+    for _ in range(iterations):
+        middle = (lower + upper) / 2.0
+        hit = _evaluate_candidates(columns, variable, middle[:, None], target)[:, 0]
+        upper = np.where(hit, middle, upper)
+        lower = np.where(hit, lower, middle)
+    return np.where(reachable, upper, np.nan)
+
+
+def solve_minimum_input(
+    columns: Mapping[str, Any],
+    variable: str,
+    target: Target = "GO",
+    grid_points: int = 64,
+    iterations: int = 40,
+) -> Dict[str, np.ndarray]:
+    """Find the smallest ``variable`` value that reaches ``target`` per scenario.
+
+    ``columns`` uses the same flat layout as
+    :func:`business_logic.calculate_open_store_feasibility_batch`. Returns
+    ``value`` (NaN where the target cannot be reached by changing this input
+    alone), ``reachable``, the ``method`` used, and the decision and score at
+    the solution.
+    """
+    if variable not in SOLVABLE_INPUTS:
+        raise ValueError(f"Cannot goal-seek {variable!r}; choose one of {', '.join(SOLVABLE_INPUTS)}.")
+    size = _batch_size(columns)
+    arrays = _columns_as_arrays(columns, size)
+
+    if variable == "planned_price":
+        method = "bisection"
+        value = _bisect_minimum(arrays, variable, size, target, max(2, grid_points), max(1, iterations))
+    else:
+        method = "closed_form"
+        candidates = _closed_form_breakpoints(arrays, variable, size)
+        hits = _evaluate_candidates(arrays, variable, candidates, target)
+        value = np.where(hits, candidates, np.inf).min(axis=1)
+        value = np.where(np.isfinite(value), value, np.nan)
+
+    reachable = ~np.isnan(value)
+    solved = dict(arrays)
+    solved[variable] = np.where(reachable, value, _current_values(arrays, variable, size))
+    at_solution = calculate_open_store_feasibility_batch(solved)
+    return {
+        "value": value,
+        "reachable": reachable,
+        "method": np.full(size, method, dtype=object),
+        "decision": at_solution["decision"],
+        "overall_score": at_solution["overall_score"],
+    }
+
+
+def goal_seek_open_store(
+    profile: Dict[str, Any],
+    site: Dict[str, Any],
+    launch: Dict[str, Any],
+    pricing: Dict[str, Any],
+    target: Target = "GO",
+) -> Dict[str, Dict[str, Any]]:
+    """Solve every goal-seek input for one scenario, for the decision page."""
+    columns = {**profile, **site, **launch, **pricing}
+    results: Dict[str, Dict[str, Any]] = {}
+    for variable in SOLVABLE_INPUTS:
+        solved = solve_minimum_input(columns, variable, target)
+        value = float(solved["value"][0])
+        results[variable] = {
+            "value": value,
+            "reachable": bool(solved["reachable"][0]),
+            "method": solved["method"][0],
+            "decision": solved["decision"][0],
+            "overall_score": int(solved["overall_score"][0]),
+        }
+    return results
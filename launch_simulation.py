@@ -0,0 +1,126 @@
+"""Monte Carlo launch-risk simulation for the Open a Store decision.
+
+Every draw is scored by the vectorized batch path in ``business_logic`` so the
+simulated decisions use exactly the same rules as the single-point estimate.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping, Optional
+
+import numpy as np
+
+from business_logic import _as_float, calculate_open_store_feasibility_batch
+
+
+RUNWAY_PERCENTILES = (5, 25, 50, 75, 95)
+SIMULATED_FIELDS = {
+    "expected_monthly_revenue",
+    "expected_gross_margin",
+    "monthly_fixed_cost_estimate",
+    "startup_cost_estimate",
+    "funding_available",
+    "cost",
+    "planned_price",
+    "competitor_price",
+    "traffic",
+    "competitors",
+}
+
+
+def _draw(rng: np.random.Generator, spec: Mapping[str, Any], samples: int) -> np.ndarray:
+    kind = str(spec.get("dist", "")).lower()
+    if kind == "triangular":
+        low, mode, high = float(spec["low"]), float(spec["mode"]), float(spec["high"])
+        if not low <= mode <= high:
+            raise ValueError("Triangular distributions need low <= mode <= high.")
+        values = np.full(samples, mode) if low == high else rng.triangular(low, mode, high, samples)
+    elif kind == "normal":
+        std = float(spec["std"])
+        if std < 0:
+            raise ValueError("Normal distributions need a non-negative std.")
+        values = rng.normal(float(spec["mean"]), std, samples)
+    elif kind == "uniform":
+        low, high = float(spec["low"]), float(spec["high"])
+        if low > high:
+            raise ValueError("Uniform distributions need low <= high.")
+        values = rng.uniform(low, high, samples)
+    else:
+        raise ValueError(f"Unsupported distribution: {spec.get('dist')!r}")
+
+    if "min" in spec or "max" in spec:
+        values = np.clip(values, spec.get("min", -np.inf), spec.get("max", np.inf))
+    return values
+
+
+def triangular_around(value: float, spread_pct: float, **bounds: float) -> Dict[str, Any]:
+    """Build a symmetric triangular spec of +/- ``spread_pct`` around ``value``."""
+    delta = abs(float(value)) * max(0.0, float(spread_pct)) / 100.0
+    return {"dist": "triangular", "low": value - delta, "mode": value, "high": value + delta, **bounds}
+
+
+def simulate_open_store_feasibility(
+    profile: Dict[str, Any],
+    site: Dict[str, Any],
+    launch: Dict[str, Any],
+    pricing: Dict[str, Any],
+    distributions: Mapping[str, Mapping[str, Any]],
+    samples: int = 100_000,
+    seed: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Draw uncertain inputs and summarize the resulting launch decisions.
+
+    ``distributions`` maps a flat input name (for example
+    ``expected_monthly_revenue``) to a spec such as
+    ``{"dist": "triangular", "low": 40000, "mode": 52000, "high": 60000}``,
+    ``{"dist": "normal", "mean": 62, "std": 4}`` or
+    ``{"dist": "uniform", "low": 24000, "high": 29000}``. Optional ``min`` and
+    ``max`` keys clip the draws. Inputs without a distribution stay fixed.
+    """
+    samples = int(samples)
+    if samples < 1:
+        raise ValueError("At least one sample is required.")
+    unknown = set(distributions) - SIMULATED_FIELDS
+    if unknown:
+        raise ValueError(f"Cannot simulate inputs: {', '.join(sorted(unknown))}")
+
+    rng = np.random.default_rng(seed)
+    columns: Dict[str, Any] = {**profile, **site, **launch, **pricing}
+    for name in sorted(distributions):
+        columns[name] = _draw(rng, distributions[name], samples)
+
+    batch = calculate_open_store_feasibility_batch(columns)
+    decisions = batch["decision"]
+    runway = batch["runway_months"]
+    funding_gap = batch["funding_gap"]
+
+    target_months = max(1.0, _as_float(launch.get("cash_target_months"), 3.0))
+    decision_shares = {
+        label: float(np.mean(decisions == label))
+        for label in ("GO", "CAUTION", "NO-GO", "REVIEW INPUTS")
+    }
+    return {
+        "samples": samples,
+        "p_go": decision_shares["GO"],
+        "p_caution": decision_shares["CAUTION"],
+        "p_no_go": decision_shares["NO-GO"],
+        "p_review_inputs": decision_shares["REVIEW INPUTS"],
+        "runway_percentiles": {
+            q: float(value)
+            for q, value in zip(
+                RUNWAY_PERCENTILES,
+                np.percentile(runway, RUNWAY_PERCENTILES, method="nearest"),
+            )
+        },
+        "p_runway_below_target": float(np.mean(runway < target_months)),
+        "p_funding_gap": float(np.mean(funding_gap > 0)),
+        "funding_gap_mean": float(funding_gap.mean()),
+        "funding_gap_percentiles": {
+            q: float(value)
+            for q, value in zip(
+                RUNWAY_PERCENTILES,
+                np.percentile(funding_gap, RUNWAY_PERCENTILES, method="nearest"),
+            )
+        },
+        "overall_score_mean": float(batch["overall_score"].mean()),
+    }
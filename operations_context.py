@@ -0,0 +1,149 @@
+"""Token-budgeted inventory context for operations AI prompts.
+
+Dumping every SKU into the prompt makes a 3,000-SKU inventory slow, expensive
+and liable to truncation. The builder always includes the aggregate summary,
+lists the highest-value critical, watchlist, overstock and perishable items,
+and collapses everything else into per-category totals. The item lists
+shrink until the estimated token count fits the budget, so prompt size stays
+flat as the inventory grows. Small inventories that fit are listed in full.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from prompt_tokens import estimate_tokens
+
+
+ITEM_COLUMNS = [
+    "Item", "Category", "Stock", "Monthly_Sales", "Cost", "Total_Value",
+    "Months_Of_Cover", "Lead_Time_Days", "MOQ", "Shelf_Life_Days",
+    "Reorder_Point", "Suggested_Order_Qty", "Suggested_Order_Value", "Status", "Perishable_Risk",
+]
+FULL_TABLE_COLUMNS = ITEM_COLUMNS + ["Suggested_Action"]
+
+# (heading, row filter, value column used to rank items), in priority order.
+CONTEXT_SECTIONS = (
+    ("Critical stockout risk", lambda df: df["Status"].eq("Critical Stockout Risk"), "Suggested_Order_Value"),
+    ("Watchlist", lambda df: df["Status"].eq("Watchlist"), "Suggested_Order_Value"),
+    (
+        "Overstock, dead and no-sales stock",
+        lambda df: df["Status"].isin(["Overstock", "Dead / Overstock", "No Sales / Review"]),
+        "Total_Value",
+    ),
+    ("Perishable waste risk", lambda df: df["Perishable_Risk"].ne(""), "Total_Value"),
+)
+
+
+def _table(df: pd.DataFrame, columns: List[str]) -> str:
+    """Pipe-separated rows: far fewer tokens than a space-padded to_string table."""
+    columns = [column for column in columns if column in df.columns]
+    return df[columns].to_csv(index=False, sep="|", float_format="%.2f", lineterminator="\n").strip()
+
+
+def _category_aggregates(df: pd.DataFrame, max_categories: Optional[int]) -> str:
+    grouped = df.groupby("Category", sort=False).agg(
+        SKUs=("Item", "size"),
+        Stock_Value=("Total_Value", "sum"),
+        Suggested_Order_Value=("Suggested_Order_Value", "sum"),
+        Critical=("Status", lambda status: int(status.eq("Critical Stockout Risk").sum())),
+        Watchlist=("Status", lambda status: int(status.eq("Watchlist").sum())),
+        Overstock=("Status", lambda status: int(status.isin(["Overstock", "Dead / Overstock", "No Sales / Review"]).sum())),
+        Perishable=("Perishable_Risk", lambda risk: int(risk.ne("").sum())),
+    ).sort_values("Stock_Value", ascending=False).reset_index()
+    shown = grouped if max_categories is None else grouped.head(max_categories)
+    text = _table(shown, list(grouped.columns))
+    hidden = grouped.iloc[len(shown):]
+    if len(hidden):
+        text += (
+            f"\n... {len(hidden)} smaller categories ({int(hidden['SKUs'].sum())} SKUs, "
+            f"USD {hidden['Stock_Value'].sum():,.0f} stock value) not listed."
+        )
+    return text
+
+
+def _compose(
+    df2: pd.DataFrame,
+    summary: str,
+    top_n: int,
+    max_categories: Optional[int],
+) -> Dict[str, Any]:
+    parts = [f"Operations inventory summary:\n{summary}"]
+    listed = pd.Series(False, index=df2.index)
+    for heading, row_filter, value_column in CONTEXT_SECTIONS:
+        matches = df2[row_filter(df2)]
+        if matches.empty:
+            continue
+        top = matches.sort_values(value_column, ascending=False).head(top_n)
+        listed.loc[top.index] = True
+        if top.empty:
+            parts.append(f"{heading}: {len(matches)} items (none listed individually).")
+        else:
+            parts.append(
+                f"{heading} - top {len(top)} of {len(matches)} by {value_column.replace('_', ' ').lower()}:\n"
+                f"{_table(top, ITEM_COLUMNS)}"
+            )
+    rest = df2[~listed]
+    if len(rest):
+        parts.append(
+            f"Remaining {len(rest)} SKUs aggregated by category:\n"
+            f"{_category_aggregates(rest, max_categories)}"
+        )
+    text = "\n\n".join(parts)
+    return {"text": text, "items_listed": int(listed.sum())}
+
+
+def build_inventory_context(
+    df2: pd.DataFrame,
+    summary: str,
+    token_budget: int = 3000,
+    top_n: int = 15,
+) -> Dict[str, Any]:
+    """Build the prompt context for diagnosed inventory within ``token_budget``.
+
+    ``df2`` is the diagnostics frame from ``operations_inventory_health``.
+    Returns the context ``text``, its ``estimated_tokens``, how many SKUs are
+    listed individually, the total SKU count, whether the full table was used
+    and whether the budget could be met.
+    """
+    # A full-table row costs well over 20 tokens, so skip rendering hopeless cases.
+    full_text = ""
+    if len(df2) <= token_budget // 20:
+        full_text = (
+            f"Operations inventory summary:\n{summary}\n\n"
+            f"Detailed inventory diagnostics:\n"
+            f"{df2[[column for column in FULL_TABLE_COLUMNS if column in df2.columns]].to_string(index=False)}"
+        )
+    if full_text and estimate_tokens(full_text) <= token_budget:
+        return {
+            "text": full_text,
+            "estimated_tokens": estimate_tokens(full_text),
+            "items_listed": len(df2),
+            "total_items": len(df2),
+            "full_table": True,
+            "within_budget": True,
+        }
+
+    max_categories: Optional[int] = None
+    while True:
+        context = _compose(df2, summary, top_n, max_categories)
+        tokens = estimate_tokens(context["text"])
+        if tokens <= token_budget:
+            break
+        if top_n > 0:
+            top_n //= 2
+        elif max_categories is None or max_categories > 1:
+            category_count = df2["Category"].nunique()
+            max_categories = max(1, (max_categories or category_count) // 2)
+        else:
+            break
+    return {
+        "text": context["text"],
+        "estimated_tokens": tokens,
+        "items_listed": context["items_listed"],
+        "total_items": len(df2),
+        "full_table": False,
+        "within_budget": tokens <= token_budget,
+    }
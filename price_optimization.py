@@ -0,0 +1,116 @@
+"""Price sweep for the representative product using the elasticity input.
+
+Demand follows a constant-elasticity curve anchored at the planned price and
+expected monthly revenue. Every price on the grid is scored in one batch call
+so the profit-maximizing and score-maximizing prices come from one pass.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+import numpy as np
+
+from business_logic import _as_float, calculate_open_store_feasibility_batch
+
+
+# Constant price elasticity of demand for the Price Sensitivity selector.
+PRICE_ELASTICITY = {"Low": -0.8, "Medium": -1.5, "High": -2.5}
+
+# Price window relative to the competitor price that each strategy targets.
+STRATEGY_PRICE_BANDS = {
+    "Penetration": (0.70, 1.00),
+    "Competitive": (0.90, 1.10),
+    "Value-based": (0.95, 1.30),
+    "Premium": (1.10, 1.50),
+}
+
+# Sweep range as multiples of the anchor. Anchored on the competitor (or
+# planned) price, it stays inside the range validate_pricing accepts without
+# a warning. Anchored on unit cost (competitor price at or below cost), the
+# swept prices above cost can exceed the competitor price by more than 50%,
+# which validate_pricing warns about.
+SWEEP_BAND = (0.50, 1.50)
+
+
+def optimize_price(
+    profile: Dict[str, Any],
+    site: Dict[str, Any],
+    launch: Dict[str, Any],
+    pricing: Dict[str, Any],
+    points: int = 401,
+) -> Dict[str, Any]:
+    """Sweep prices around the competitor price and pick the best ones.
+
+    Contribution profit is representative-product unit economics: demanded
+    units times (price - unit cost). It is not the business-level expected
+    gross margin the feasibility score uses; the score at each price uses the
+    demand-adjusted revenue with that margin. When the competitor price is so
+    low that the band would sit at or below unit cost, the sweep is anchored
+    on unit cost instead (``anchored_on_cost``). ``profit_max_at_boundary``
+    is set when profit is still rising at the edge of the sweep, i.e. there
+    is no interior optimum (always the case for inelastic demand). Raises
+    ``ValueError`` when the planned price, revenue or unit cost cannot anchor
+    the demand curve.
+    """
+    cost = _as_float(pricing.get("cost"))
+    planned_price = _as_float(pricing.get("planned_price"))
+    competitor_price = _as_float(pricing.get("competitor_price"))
+    base_revenue = _as_float(launch.get("expected_monthly_revenue"))
+    if cost <= 0 or planned_price <= 0 or base_revenue <= 0:
+        raise ValueError("Unit cost, planned price and expected revenue must be greater than USD 0.")
+
+    elasticity_label = str(pricing.get("elasticity", "Medium"))
+    elasticity = PRICE_ELASTICITY.get(elasticity_label, PRICE_ELASTICITY["Medium"])
+    reference = competitor_price if competitor_price > 0 else planned_price
+    anchored_on_cost = reference <= cost
+    anchor = cost if anchored_on_cost else reference
+
+    prices = np.linspace(anchor * SWEEP_BAND[0], anchor * SWEEP_BAND[1], max(3, int(points)))
+    # Non-empty: the top of the band is at least 1.5x unit cost.
+    prices = prices[prices > cost]
+
+    base_units = base_revenue / planned_price
+    units = base_units * (prices / planned_price) ** elasticity
+    revenue = units * prices
+    contribution_profit = units * (prices - cost)
+
+    columns = {**profile, **site, **launch, **pricing}
+    columns["planned_price"] = prices
+    columns["expected_monthly_revenue"] = revenue
+    batch = calculate_open_store_feasibility_batch(columns)
+    scores = batch["overall_score"]
+
+    profit_index = int(np.argmax(contribution_profit))
+    # Among prices tied on score, prefer the one that earns the most.
+    score_index = int(np.lexsort((contribution_profit, scores))[-1])
+
+    strategy = str(pricing.get("strategy", "Competitive"))
+    band_low, band_high = STRATEGY_PRICE_BANDS.get(strategy, STRATEGY_PRICE_BANDS["Competitive"])
+    in_band = (prices >= reference * band_low) & (prices <= reference * band_high)
+    strategy_index = (
+        int(np.flatnonzero(in_band)[np.argmax(contribution_profit[in_band])])
+        if in_band.any()
+        else profit_index
+    )
+
+    return {
+        "elasticity_label": elasticity_label,
+        "elasticity": elasticity,
+        "strategy": strategy,
+        "strategy_band": (reference * band_low, reference * band_high),
+        "sweep_range": (float(prices[0]), float(prices[-1])),
+        "anchored_on_cost": anchored_on_cost,
+        "prices": prices,
+        "units": units,
+        "revenue": revenue,
+        "contribution_profit": contribution_profit,
+        "overall_score": scores,
+        "decision": batch["decision"],
+        "profit_max_price": float(prices[profit_index]),
+        "profit_max_contribution": float(contribution_profit[profit_index]),
+        "profit_max_at_boundary": profit_index in (0, prices.size - 1),
+        "score_max_price": float(prices[score_index]),
+        "score_max_score": int(scores[score_index]),
+        "strategy_best_price": float(prices[strategy_index]),
+    }
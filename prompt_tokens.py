@@ -0,0 +1,10 @@
+"""Prompt size estimates shared by prompt builders and AI telemetry."""
+
+from __future__ import annotations
+
+import math
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for English prompt text (about four characters per token)."""
+    return math.ceil(len(text) / 4)
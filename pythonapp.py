@@ -4,17 +4,49 @@ import numpy as np
 import os
 import time
 import random
-import re
+import hmac
+import logging
+import sqlite3
 from datetime import datetime
 from google import genai
 from google.genai import types
-import requests
 
-from ai_reliability import AIServiceUnavailable, request_ai_text
+from ai_cache import AIResponseCache, ai_cache_key
+from ai_jobs import AIJobQueue, JobCancelled
+from ai_reliability import (
+    AIServiceUnavailable,
+    HedgePolicy,
+    ModelHealthRegistry,
+    ProviderCallLimit,
+    request_ai_text,
+    stream_ai_text,
+)
+from ai_telemetry import AITelemetry
 from business_logic import (
-    calculate_open_store_feasibility,
     score_from_inputs_site as calculate_site_score,
+    validate_pricing_catalog,
+)
+from cash_projection import project_open_store_cash, summarize_cash_projection
+from fake_ai_provider import FakeAIClient, FakeModelProfile, lognormal_latency
+from feasibility_cache import cached_open_store_feasibility
+from feasibility_graph import FeasibilityGraph
+from gazetteer import Gazetteer
+from geocode_queries import fuzzy_queries, normalize_query
+from geocode_store import GeocodeStore, geocode_query_key
+from goal_seek import goal_seek_open_store
+from http_sessions import HostSessionPool
+from launch_simulation import simulate_open_store_feasibility, triangular_around
+from markdown_sanitizer import (
+    MarkdownStreamSanitizer,
+    clean_currency_for_markdown,
+    sanitize_ai_markdown_output,
 )
+from operations_context import build_inventory_context
+from price_optimization import optimize_price
+from rate_limiter import HostRateLimiter, host_of, parse_retry_after
+from section_reports import ReportCancelled, generate_report_sections, section_prompt
+from sensitivity import analyze_feasibility_sensitivity
+from single_flight import SingleFlight
 
 # =========================================================
 # Page config
@@ -495,6 +527,17 @@ if not API_KEY:
 
 client = genai.Client(api_key=API_KEY) if API_KEY else None
 
+# AI_FAKE_PROVIDER=1 swaps in the offline stand-in so AI flows can be
+# exercised and benchmarked without the real provider.
+if os.getenv("AI_FAKE_PROVIDER", "") == "1":
+    API_KEY = API_KEY or "offline"
+    client = FakeAIClient(default=FakeModelProfile(
+        latency=lognormal_latency(float(os.getenv("AI_FAKE_MEDIAN_LATENCY_SECONDS", "1.5")), 0.6),
+        failure_rate=float(os.getenv("AI_FAKE_FAILURE_RATE", "0")),
+        timeout_rate=float(os.getenv("AI_FAKE_TIMEOUT_RATE", "0")),
+        timeout_seconds=max(5_000, min(int(os.getenv("AI_REQUEST_TIMEOUT_MS", "30000")), 60_000)) / 1000,
+    ))
+
 SYSTEM_POLICY = """
 You are the Small Business Decision Assistant built into this SME decision platform.
 
@@ -532,53 +575,92 @@ MODEL_CANDIDATES_FAST = [
 if "ai_quality" not in st.session_state:
     st.session_state.ai_quality = "pro"
 
-def sanitize_ai_markdown_output(text: str) -> str:
-    """
-    Clean AI Markdown before display/download.
-    Streamlit/Markdown treats dollar signs as math delimiters, which can make
-    finance outputs italic, faint, or broken. We use USD instead.
-    Also soften legal/accounting conclusions that require evidence beyond
-    the uploaded SME workbook.
-    """
-    if text is None:
-        return ""
-    out = str(text)
-
-    # Avoid Markdown math rendering caused by $ in currency amounts.
-    out = out.replace("$", "USD ")
-
-    # Clean common spacing glitches after replacing currency symbols.
-    out = re.sub(r"USD\s+(-?\d)", r"USD \1", out)
-    out = re.sub(r"USD\s+([A-Za-z])", r"USD \1", out)
-
-    # Avoid over-legal conclusions. Use liquidity language unless actual legal
-    # insolvency/balance-sheet evidence is provided and explicitly discussed.
-    replacements = {
-        r"\bInsolvency Crisis\b": "Severe Liquidity Risk",
-        r"\bInsolvency Risk\b": "Critical Liquidity Risk",
-        r"\binsolvency crisis\b": "severe liquidity risk",
-        r"\binsolvency risk\b": "critical liquidity risk",
-        r"\binsolvency\b": "severe liquidity risk",
-        r"\binsolvent\b": "under severe liquidity pressure",
-    }
-    for pat, repl in replacements.items():
-        out = re.sub(pat, repl, out, flags=re.IGNORECASE)
+# Operations and finance prompts carry parsed upload data, which the upload
+# notice promises is never written to disk; their answers stay in memory.
+AI_MEMORY_ONLY_CACHE_MODES = ("operations", "finance")
+
+@st.cache_resource(show_spinner=False)
+def ai_response_cache() -> AIResponseCache:
+    """Process-wide AI response cache, in memory unless AI_CACHE_PATH names a SQLite file."""
+    return AIResponseCache(
+        path=os.getenv("AI_CACHE_PATH", "").strip() or None,
+        ttl_seconds=max(60, int(os.getenv("AI_CACHE_TTL_SECONDS", str(24 * 3600)))),
+        max_entries=max(1, int(os.getenv("AI_CACHE_MAX_ENTRIES", "256"))),
+        max_disk_entries=max(1, int(os.getenv("AI_CACHE_MAX_DISK_ENTRIES", "5000"))),
+    )
 
-    return out
+@st.cache_resource(show_spinner=False)
+def ai_call_limit() -> ProviderCallLimit:
+    """Process-wide cap on concurrent provider calls (AI_MAX_CONCURRENT_REQUESTS)."""
+    return ProviderCallLimit(max(1, int(os.getenv("AI_MAX_CONCURRENT_REQUESTS", "4"))))
+
+@st.cache_resource(show_spinner=False)
+def ai_hedge_policy():
+    """Process-wide hedging policy; AI_HEDGE_PERCENTILE=0 turns hedging off."""
+    percentile = min(float(os.getenv("AI_HEDGE_PERCENTILE", "0.95")), 1.0)
+    if percentile <= 0:
+        return None
+    return HedgePolicy(
+        percentile=percentile,
+        default_delay=max(0.5, float(os.getenv("AI_HEDGE_DEFAULT_DELAY_SECONDS", "8"))),
+    )
 
+@st.cache_resource(show_spinner=False)
+def ai_stream_hedge_policy():
+    """Hedging policy for streamed answers, tracking time to the first chunk."""
+    percentile = min(float(os.getenv("AI_HEDGE_PERCENTILE", "0.95")), 1.0)
+    if percentile <= 0:
+        return None
+    return HedgePolicy(
+        percentile=percentile,
+        default_delay=max(0.5, float(os.getenv("AI_STREAM_HEDGE_DEFAULT_DELAY_SECONDS", "4"))),
+    )
 
-def ask_ai(user_prompt: str, mode: str = "general", raise_on_failure: bool = False) -> str:
+@st.cache_resource(show_spinner=False)
+def ai_model_health() -> ModelHealthRegistry:
+    """Process-wide model health shared by every session."""
+    return ModelHealthRegistry(
+        failure_threshold=max(1, int(os.getenv("AI_BREAKER_FAILURES", "3"))),
+        cooldown_seconds=max(5.0, float(os.getenv("AI_BREAKER_COOLDOWN_SECONDS", "60"))),
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def ai_telemetry() -> AITelemetry:
+    """Process-wide AI call telemetry; AI_TELEMETRY_PATH also writes it to a file."""
+    return AITelemetry(
+        capacity=max(1, int(os.getenv("AI_TELEMETRY_CAPACITY", "1000"))),
+        path=os.getenv("AI_TELEMETRY_PATH", "") or None,
+        file_format=os.getenv("AI_TELEMETRY_FORMAT", "jsonl"),
+        write_interval_seconds=float(os.getenv("AI_TELEMETRY_WRITE_INTERVAL_SECONDS", "15")),
+    )
+
+
+def is_admin_session() -> bool:
+    """True when the URL carries ?admin=<APP_ADMIN_TOKEN>; unset token means no admin."""
+    token = os.getenv("APP_ADMIN_TOKEN", "")
+    return bool(token) and hmac.compare_digest(str(st.query_params.get("admin", "")), token)
+
+
+def ai_model_diagnostics() -> dict:
+    """Per-model circuit state, success rate and latency for troubleshooting."""
+    return ai_model_health().diagnostics()
+
+def prepare_ai_call(user_prompt: str, mode: str = "general"):
+    """Capture everything an AI request needs so it can run off the script thread.
+
+    Returns ``run(on_chunk=None) -> str`` giving the raw response text. With
+    ``on_chunk`` the answer is streamed and each chunk is passed to it.
+    Raises AIServiceUnavailable when the AI service is not configured.
+    """
     if not API_KEY or not client:
-        error = AIServiceUnavailable(
+        raise AIServiceUnavailable(
             code="AI_NOT_CONFIGURED",
             user_message=t(
                 "AI 服务尚未配置。您的输入仍已保存，请稍后重试。",
                 "The AI service is not configured. Your inputs are still saved; please retry later.",
             ),
         )
-        if raise_on_failure:
-            raise error
-        return error.user_message
 
     mode_hint = {
         "general": "General Q&A. Be concise and practical.",
@@ -600,16 +682,97 @@ def ask_ai(user_prompt: str, mode: str = "general", raise_on_failure: bool = Fal
             retry_options=types.HttpRetryOptions(attempts=1),
         )
     )
+    cache = ai_response_cache()
+    hedge = ai_hedge_policy()
+    stream_hedge = ai_stream_hedge_policy()
+    health = ai_model_health()
+    telemetry = ai_telemetry()
+    call_limit = ai_call_limit()
+    key = ai_cache_key(mode, models, prompt)
+
+    def run(on_chunk=None) -> str:
+        began = time.monotonic()
+        attempts = []
+        chunks = []
+        response_text = cache.get(key)
+        cached = response_text is not None
+        outcome = "OK"
+        try:
+            if cached:
+                return response_text
+            if on_chunk is None:
+                response_text = request_ai_text(
+                    client.models.generate_content,
+                    models,
+                    prompt,
+                    request_config,
+                    max_attempts=max_attempts,
+                    hedge=hedge,
+                    health=health,
+                    attempts=attempts,
+                    limit=call_limit,
+                )
+            else:
+                for chunk in stream_ai_text(
+                    client.models.generate_content_stream,
+                    models,
+                    prompt,
+                    request_config,
+                    max_attempts=max_attempts,
+                    health=health,
+                    attempts=attempts,
+                    hedge=stream_hedge,
+                    limit=call_limit,
+                ):
+                    chunks.append(chunk)
+                    on_chunk(chunk)
+                response_text = "".join(chunks)
+            cache.put(key, response_text, persist=mode not in AI_MEMORY_ONLY_CACHE_MODES)
+            return response_text
+        except AIServiceUnavailable as error:
+            outcome = error.code
+            raise
+        except Exception as error:  # e.g. a cancelled background job
+            outcome = type(error).__name__
+            raise
+        finally:
+            telemetry.record(
+                mode=mode,
+                attempts=attempts,
+                latency_seconds=time.monotonic() - began,
+                prompt=prompt,
+                response_text=response_text if response_text is not None else "".join(chunks),
+                outcome=outcome,
+                streamed=on_chunk is not None,
+                cached=cached,
+            )
+
+    return run
 
+
+def ask_ai(
+    user_prompt: str,
+    mode: str = "general",
+    raise_on_failure: bool = False,
+    placeholder=None,
+) -> str:
+    """Return a sanitized AI answer; with a placeholder, render it while it streams."""
     try:
-        response_text = request_ai_text(
-            client.models.generate_content,
-            models,
-            prompt,
-            request_config,
-            max_attempts=max_attempts,
-        )
-        return sanitize_ai_markdown_output(response_text)
+        run = prepare_ai_call(user_prompt, mode)
+    except AIServiceUnavailable as error:
+        if raise_on_failure:
+            raise error
+        return error.user_message
+
+    sanitizer = MarkdownStreamSanitizer()
+    chunks = []
+
+    def render_chunk(chunk: str) -> None:
+        chunks.append(sanitizer.feed(chunk))
+        placeholder.markdown("".join(chunks) + " ▌")
+
+    try:
+        return sanitize_ai_markdown_output(run(render_chunk if placeholder is not None else None))
     except AIServiceUnavailable as error:
         error.user_message = t(
             "AI 服务未能及时完成请求。您的输入仍已保存，请稍后重试。",
@@ -617,7 +780,105 @@ def ask_ai(user_prompt: str, mode: str = "general", raise_on_failure: bool = Fal
         )
         if raise_on_failure:
             raise error
+        if chunks:
+            return "".join(chunks) + sanitizer.finish() + f"\n\n> {error.user_message}"
         return error.user_message
+    finally:
+        if placeholder is not None:
+            placeholder.empty()
+
+
+@st.cache_resource(show_spinner=False)
+def ai_job_queue() -> AIJobQueue:
+    """Process-wide report job queue; ai_call_limit caps the provider calls its jobs make."""
+    return AIJobQueue(max_workers=max(1, int(os.getenv("AI_MAX_CONCURRENT_REQUESTS", "4"))))
+
+
+if "ai_jobs" not in st.session_state:
+    st.session_state.ai_jobs = {}
+
+
+def submit_ai_report(
+    output_key: str,
+    user_prompt: str,
+    mode: str,
+    error_key: str,
+    clean_currency: bool = False,
+    sections=None,
+) -> None:
+    """Generate a report in the background; render_ai_report_job picks up the result.
+
+    ``sections`` is an optional ``(title, headings)`` pair: each heading is then
+    requested concurrently from the same prompt and the answers are assembled
+    in order. Every section call still takes an ai_call_limit slot.
+    """
+    st.session_state[error_key] = ""
+    try:
+        if sections:
+            title, headings = sections
+            section_runs = {
+                heading: prepare_ai_call(section_prompt(user_prompt, heading), mode) for heading in headings
+            }
+        else:
+            run = prepare_ai_call(user_prompt, mode)
+    except AIServiceUnavailable as error:
+        st.session_state[error_key] = error.user_message
+        return
+    section_workers = max(1, int(os.getenv("AI_REPORT_SECTION_CONCURRENCY", "8")))
+
+    def generate(job) -> str:
+        if sections:
+            try:
+                text = generate_report_sections(
+                    title,
+                    headings,
+                    lambda heading: sanitize_ai_markdown_output(section_runs[heading]()),
+                    max_workers=section_workers,
+                    on_progress=job.append_partial,
+                    cancelled=lambda: job.cancelled,
+                )["markdown"]
+            except ReportCancelled:
+                raise JobCancelled(job.job_id) from None
+        else:
+            sanitizer = MarkdownStreamSanitizer()
+            text = sanitize_ai_markdown_output(run(lambda chunk: job.append_partial(sanitizer.feed(chunk))))
+        return clean_currency_for_markdown(text) if clean_currency else text
+
+    previous = st.session_state.ai_jobs.get(output_key)
+    if previous:
+        ai_job_queue().cancel(previous)
+    st.session_state.ai_jobs[output_key] = ai_job_queue().submit(output_key, generate)
+
+
+@st.fragment(run_every=1.0)
+def render_ai_report_job(output_key: str, error_key: str) -> None:
+    """Show a background report's progress and move its result into outputs when done."""
+    job_id = st.session_state.ai_jobs.get(output_key)
+    job = ai_job_queue().get(job_id) if job_id else None
+    if job is None or job["status"] == "cancelled":
+        st.session_state.ai_jobs.pop(output_key, None)
+        return
+    if job["status"] in ("done", "failed"):
+        st.session_state.ai_jobs.pop(output_key, None)
+        if job["status"] == "done":
+            st.session_state.outputs[output_key] = job["result"]
+        else:
+            st.session_state[error_key] = t(
+                "AI 服务未能及时完成请求。您的输入仍已保存，请稍后重试。",
+                job["error_message"],
+            )
+        st.rerun()
+
+    st.info(t(
+        "报告正在后台生成，您可以继续使用其他功能。",
+        "The report is being generated in the background; you can keep working.",
+    ))
+    if job["partial_text"]:
+        st.markdown(job["partial_text"] + " ▌")
+    if st.button(t("取消生成", "Cancel"), key=f"{output_key}_cancel_job"):
+        ai_job_queue().cancel(job_id)
+        st.session_state.ai_jobs.pop(output_key, None)
+        st.rerun()
 
 # =========================================================
 # Geocoding (fuzzy + multi provider)
@@ -626,63 +887,105 @@ NOMINATIM_CONTACT_EMAIL = "yy17812367982@gmail.com"
 NOMINATIM_UA = f"ProjectB-SME-BI-Platform/1.0 (contact: {NOMINATIM_CONTACT_EMAIL})"
 MAPSCO_API_KEY = os.getenv("MAPSCO_API_KEY", "").strip()
 
-def _normalize_query(q: str) -> str:
-    q = (q or "").strip()
-    q = " ".join(q.split())
-    return q
-
-def _fuzzy_queries(q: str):
-    q0 = _normalize_query(q)
-    if not q0:
-        return []
-    variants = [q0]
-
-    q1 = q0.replace(",", " ").replace("  ", " ").strip()
-    if q1 != q0:
-        variants.append(q1)
-
-    if "usa" not in q0.lower() and "united states" not in q0.lower():
-        variants.append(q0 + " USA")
-        variants.append(q1 + " USA")
-
-    if ("watervliet" in q0.lower()) and ("ny" not in q0.lower()):
-        variants.append(q0 + " NY")
-        variants.append(q0 + " New York")
-
-    tokens = q1.split()
-    nums = [x for x in tokens if any(c.isdigit() for c in x)]
-    words = [x for x in tokens if x.isalpha() or x.lower() in ["ct", "st", "ave", "rd", "dr", "blvd", "ny"]]
-    loose = " ".join((nums + words)[:12]).strip()
-    if loose and loose.lower() != q1.lower():
-        variants.append(loose)
-        if "usa" not in loose.lower():
-            variants.append(loose + " USA")
-
-    seen = set()
-    out = []
-    for v in variants:
-        vv = _normalize_query(v)
-        if vv and vv.lower() not in seen:
-            seen.add(vv.lower())
-            out.append(vv)
-    return out
+# Requests per second and burst per upstream host. Nominatim's usage policy
+# allows at most one request per second; maps.co's free plan is the same.
+UPSTREAM_RATE_POLICIES = {
+    "nominatim.openstreetmap.org": (1.0, 1),
+    "geocode.maps.co": (1.0, 1),
+}
+UPSTREAM_MAX_WAIT_SECONDS = 10.0
+
+@st.cache_resource(show_spinner=False)
+def upstream_rate_limiter() -> HostRateLimiter:
+    """Process-wide pacing shared by every session; see UPSTREAM_RATE_POLICIES."""
+    return HostRateLimiter(
+        {**UPSTREAM_RATE_POLICIES, **{host_of(ep): (1.0, 2) for ep in OVERPASS_ENDPOINTS}},
+        default_policy=(1.0, 1),
+    )
+
+@st.cache_resource(show_spinner=False)
+def upstream_http() -> HostSessionPool:
+    """Keep-alive sessions per geocoding/Overpass host, shared by every session."""
+    return HostSessionPool(
+        pool_maxsize=max(1, int(os.getenv("UPSTREAM_HTTP_POOL_SIZE", "4"))),
+        connect_timeout=5.0,
+        headers={"User-Agent": NOMINATIM_UA},
+    )
+
+def _defer_after_rate_limit(host: str, resp) -> None:
+    retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+    upstream_rate_limiter().defer(host, retry_after if retry_after is not None else 1.2 + random.random())
 
 def _request_json(url: str, params: dict, headers: dict, timeout: int = 12):
-    r = requests.get(url, params=params, headers=headers, timeout=timeout)
+    host = host_of(url)
+    upstream_rate_limiter().acquire(host, max_wait=UPSTREAM_MAX_WAIT_SECONDS)
+    r = upstream_http().get(url, params=params, headers=headers, timeout=timeout)
     dbg = {"status": r.status_code, "final_url": r.url, "text_head": (r.text[:260] if isinstance(r.text, str) else "")}
+    if r.status_code == 429:
+        _defer_after_rate_limit(host, r)
     r.raise_for_status()
     return r.json(), dbg
 
+@st.cache_resource(show_spinner=False)
+def geocode_store():
+    """Process-shared persistent geocode store; GEOCODE_CACHE_PATH="" turns it off.
+
+    A database that cannot be opened (unwritable path, locked file) turns the
+    store off for this process instead of failing every address lookup.
+    """
+    path = os.getenv("GEOCODE_CACHE_PATH", ".geocode_cache.sqlite3")
+    if not path:
+        return None
+    try:
+        return GeocodeStore(
+            path,
+            ttl_seconds=max(60, int(os.getenv("GEOCODE_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))),
+            negative_ttl_seconds=max(60, int(os.getenv("GEOCODE_NEGATIVE_TTL_SECONDS", str(6 * 3600)))),
+        )
+    except (sqlite3.Error, OSError) as error:
+        logging.getLogger(__name__).warning("Geocode store %s is unavailable; lookups go upstream: %s", path, error)
+        return None
+
+@st.cache_resource(show_spinner=False)
+def location_lookups() -> SingleFlight:
+    """Coalesces identical geocode and Overpass lookups running in different sessions."""
+    return SingleFlight()
+
+@st.cache_resource(show_spinner=False)
+def local_gazetteer():
+    """Offline geocoder loaded from GEOCODE_GAZETTEER_PATH (a CSV); unset turns it off."""
+    path = os.getenv("GEOCODE_GAZETTEER_PATH", "").strip()
+    return Gazetteer.from_csv(path) if path else None
+
 @st.cache_data(show_spinner=False, ttl=24 * 3600)
 def geocode_candidates_multi_fuzzy(query: str, limit: int = 6):
-    q = _normalize_query(query)
+    q = normalize_query(query)
     if not q:
         return [], {"ok": False, "err": "empty query"}
+    gazetteer = local_gazetteer()
+    if gazetteer is not None:
+        # Only a full match is trusted over the online providers; an entry
+        # missing some query words may be in another city or state.
+        found = gazetteer.search(q, limit, partial=False)
+        if found:
+            return found, {"ok": True, "provider": "gazetteer", "query_used": q, "count": len(found)}
+    query_key = geocode_query_key(q, limit)
+    results, debug = location_lookups().do(("geocode", query_key), lambda: _geocode_candidates(q, limit, query_key))
+    if not results and gazetteer is not None:
+        found = gazetteer.search(q, limit)
+        if found:
+            return found, {"ok": True, "provider": "gazetteer", "match": "partial", "query_used": q, "count": len(found)}
+    return results, debug
+
+def _geocode_candidates(q: str, limit: int, query_key: str):
+    store = geocode_store()
+    if store is not None:
+        stored = store.get(query_key)
+        if stored is not None:
+            return stored["results"], {**stored["debug"], "cache": "disk"}
 
     headers = {"User-Agent": NOMINATIM_UA}
-    queries = _fuzzy_queries(q)
-
-    time.sleep(0.6)
+    queries = fuzzy_queries(q)
 
     providers = [{
         "name": "nominatim",
@@ -705,9 +1008,24 @@ def geocode_candidates_multi_fuzzy(query: str, limit: int = 6):
         })
 
     last_debug = {"ok": False, "err": "no attempt"}
+    had_error = False
+
+    def remember(variant: str, results: list, debug: dict) -> None:
+        # final_url can carry the maps.co API key, so it never goes to disk.
+        if store is not None:
+            store.put(query_key, variant, results, {k: v for k, v in debug.items() if k != "final_url"})
 
     for qq in queries:
         for p in providers:
+            variant = f"{p['name']}:{qq.lower()}"
+            if store is not None:
+                stored = store.get(query_key, variant)
+                if stored is not None:
+                    if stored["results"]:
+                        remember("", stored["results"], stored["debug"])
+                        return stored["results"], {**stored["debug"], "cache": "disk"}
+                    last_debug = stored["debug"]
+                    continue
             try:
                 params = p["build_params"](qq)
                 data, dbg = _request_json(p["url"], params=params, headers=headers, timeout=12)
@@ -736,15 +1054,19 @@ def geocode_candidates_multi_fuzzy(query: str, limit: int = 6):
                                 })
 
                 last_debug = {"ok": True, "provider": p["name"], "query_used": qq, "count": len(out), **dbg}
+                remember(variant, out, last_debug)
                 if out:
+                    remember("", out, last_debug)
                     return out, last_debug
 
             except Exception as e:
+                had_error = True
                 last_debug = {"ok": False, "provider": p["name"], "query_used": qq, "err": str(e)}
-                if "429" in str(e) or "Too Many Requests" in str(e):
-                    time.sleep(1.2 + random.random())
                 continue
 
+    # Only a clean "no results" from every provider is cached; errors are retried.
+    if not had_error and last_debug.get("ok"):
+        remember("", [], last_debug)
     return [], last_debug
 
 # =========================================================
@@ -808,9 +1130,11 @@ def _overpass_post(query: str, timeout: int = 35):
     body = query.encode("utf-8")
 
     for ep in OVERPASS_ENDPOINTS:
-        time.sleep(0.25 + random.random() * 0.25)
         try:
-            resp = requests.post(ep, data=body, headers=headers, timeout=timeout)
+            upstream_rate_limiter().acquire(host_of(ep), max_wait=UPSTREAM_MAX_WAIT_SECONDS)
+            resp = upstream_http().post(ep, data=body, headers=headers, timeout=timeout)
+            if resp.status_code == 429 or (resp.status_code == 503 and "Retry-After" in resp.headers):
+                _defer_after_rate_limit(host_of(ep), resp)
             if resp.status_code != 200:
                 last_dbg = {
                     "ok": False,
@@ -833,8 +1157,17 @@ def _overpass_post(query: str, timeout: int = 35):
 
     return None, last_dbg
 
+def _overpass_lookup_key(kind: str, lat: float, lon: float, radius_miles: float, *extra: str):
+    # Overpass queries use whole meters and the coordinates as formatted floats;
+    # 6 decimals (~0.1 m) only merges inputs that differ by float noise.
+    return (kind, round(float(lat), 6), round(float(lon), 6), int(_miles_to_meters(radius_miles)), *extra)
+
 @st.cache_data(show_spinner=False, ttl=6*3600)
 def estimate_competitors_overpass(lat: float, lon: float, radius_miles: float, business_type: str):
+    key = _overpass_lookup_key("competitors", lat, lon, radius_miles, (business_type or "").strip().lower())
+    return location_lookups().do(key, lambda: _estimate_competitors(lat, lon, radius_miles, business_type))
+
+def _estimate_competitors(lat: float, lon: float, radius_miles: float, business_type: str):
     r = int(_miles_to_meters(radius_miles))
     filters = _business_to_competitor_osm_filters(business_type)
 
@@ -872,6 +1205,10 @@ def estimate_competitors_overpass(lat: float, lon: float, radius_miles: float, b
 
 @st.cache_data(show_spinner=False, ttl=6*3600)
 def estimate_traffic_proxy_overpass(lat: float, lon: float, radius_miles: float):
+    key = _overpass_lookup_key("traffic", lat, lon, radius_miles)
+    return location_lookups().do(key, lambda: _estimate_traffic_proxy(lat, lon, radius_miles))
+
+def _estimate_traffic_proxy(lat: float, lon: float, radius_miles: float):
     r = int(_miles_to_meters(radius_miles))
 
     query = f"""
@@ -1082,62 +1419,52 @@ def inventory_health(df: pd.DataFrame) -> dict:
         "dead_value": dead_value
     }
 
+def open_store_feasibility_graph() -> FeasibilityGraph:
+    """This session's incremental feasibility calculator."""
+    if "open_feasibility_graph" not in st.session_state:
+        st.session_state.open_feasibility_graph = FeasibilityGraph()
+    return st.session_state.open_feasibility_graph
+
+
 def open_store_feasibility_metrics() -> dict:
-    """Compute pre-launch metrics from one tested source of truth."""
-    return calculate_open_store_feasibility(
+    """Compute pre-launch metrics from one tested source of truth.
+
+    Cache misses are computed by the session's dependency graph, which only
+    re-evaluates the components the last input change affected.
+    """
+    return cached_open_store_feasibility(
         st.session_state.profile,
         st.session_state.site,
         st.session_state.launch,
         st.session_state.pricing,
+        compute=open_store_feasibility_graph().update,
     )
 
 
+def open_store_changed_components() -> tuple:
+    """Return the feasibility components the last input change affected."""
+    graph = open_store_feasibility_graph()
+    sections = (
+        st.session_state.profile,
+        st.session_state.site,
+        st.session_state.launch,
+        st.session_state.pricing,
+    )
+    if not graph.is_current(*sections):
+        # The metrics were a shared-cache hit computed elsewhere; catching the
+        # graph up only evaluates the components those inputs touch.
+        graph.update(*sections)
+    return graph.changed if graph.updates > 1 else ()
 
 
-def clean_currency_for_markdown(text: str) -> str:
-    """
-    Normalize AI output so Streamlit Markdown does not interpret dollar amounts as LaTeX.
-    Also soften over-strong legal/accounting terms for SME demo use.
-    """
-    if text is None:
-        return ""
-    text = str(text)
-
-    # Convert common dollar patterns to USD-prefixed amounts.
-    # Examples: $803,500 -> USD 803,500; ($86,300) -> (USD 86,300)
-    text = re.sub(r"\$\s*([-+]?\d[\d,]*(?:\.\d+)?)", r"USD \1", text)
-    text = re.sub(r"USD\s+USD\s+", "USD ", text)
-
-    # Avoid unsupported hard legal/accounting labels in simple SME demo reports.
-    replacements = {
-        "Insolvency Crisis": "Critical Liquidity Risk",
-        "Insolvency Risk": "Severe Liquidity Risk",
-        "insolvency crisis": "critical liquidity risk",
-        "insolvency risk": "severe liquidity risk",
-        "bankruptcy": "severe liquidity pressure",
-        "Bankruptcy": "Severe Liquidity Pressure",
-    }
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-
-    return text
-
-def ai_report_open_store(user_question: str = "") -> str:
+def open_store_report_prompt(user_question: str = "") -> str:
     p = st.session_state.profile
     s = st.session_state.site
     launch = st.session_state.launch
     pr = st.session_state.pricing
     m = open_store_feasibility_metrics()
 
-    if not m.get("decision_ready", False):
-        issues = "\n".join(f"- {item}" for item in m.get("input_errors", []))
-        return (
-            "# Review Inputs Before Generating a Report\n\n"
-            "The application found blocking input errors:\n\n"
-            f"{issues}\n\nCorrect these values and generate the report again."
-        )
-
-    prompt = f"""
+    return f"""
 You are producing a professional pre-launch feasibility report for a U.S. small business owner.
 Output MUST be Markdown.
 
@@ -1182,10 +1509,8 @@ Location: {s}
 Launch Budget Inputs: {launch}
 Pricing Inputs: {pr}
 Computed Metrics: {m}
+Monthly Cash Projection: {summarize_cash_projection(project_open_store_cash(p, launch))}
 """
-    return clean_currency_for_markdown(
-        ask_ai(prompt, mode="open_store", raise_on_failure=True)
-    )
 
 
 def normalize_inventory_df(df: pd.DataFrame) -> pd.DataFrame:
@@ -1313,33 +1638,30 @@ def operations_inventory_health(df: pd.DataFrame) -> dict:
     }
 
 
-def build_operations_context() -> str:
-    inv = st.session_state.inventory
-    inv_df = inv.get("df")
+def operations_context_details() -> dict | None:
+    """Token-budgeted inventory context, or None when no inventory is loaded."""
+    inv_df = st.session_state.inventory.get("df")
     if not isinstance(inv_df, pd.DataFrame):
-        return "No inventory data has been uploaded or loaded."
+        return None
+    health = operations_inventory_health(inv_df)
+    return build_inventory_context(
+        health["df2"],
+        health["summary"],
+        token_budget=max(500, int(os.getenv("AI_OPERATIONS_CONTEXT_TOKENS", "3000"))),
+    )
 
-    try:
-        health = operations_inventory_health(inv_df)
-        df2 = health["df2"]
-        display_cols = [
-            "Item", "Category", "Stock", "Monthly_Sales", "Cost", "Total_Value",
-            "Months_Of_Cover", "Lead_Time_Days", "MOQ", "Shelf_Life_Days",
-            "Reorder_Point", "Suggested_Order_Qty", "Suggested_Order_Value", "Status", "Perishable_Risk", "Suggested_Action"
-        ]
-        display_cols = [c for c in display_cols if c in df2.columns]
-        return f"""
-Operations inventory summary:
-{health['summary']}
 
-Detailed inventory diagnostics:
-{df2[display_cols].to_string(index=False)}
-"""
+def build_operations_context() -> str:
+    try:
+        details = operations_context_details()
     except Exception as e:
         return f"Inventory data is present but could not be analyzed: {e}"
+    if details is None:
+        return "No inventory data has been uploaded or loaded."
+    return details["text"]
 
 
-def ai_operations_diagnosis(user_question: str = "") -> str:
+def ai_operations_diagnosis(user_question: str = "", placeholder=None) -> str:
     context = build_operations_context()
     prompt = f"""
 You are Yangyu's AI assistant for SME operations management.
@@ -1391,13 +1713,13 @@ List slow-moving or dead-stock items.
 ## 7) Follow-up Questions
 - 5 questions that would materially improve the analysis.
 """
-    return clean_currency_for_markdown(ask_ai(prompt, mode="operations"))
+    return clean_currency_for_markdown(ask_ai(prompt, mode="operations", placeholder=placeholder))
 
 
-def ai_report_operations() -> str:
+def operations_report_prompt() -> str:
     ops_ai = st.session_state.outputs.get("ops_ai_output", "")
     context = build_operations_context()
-    prompt = f"""
+    return f"""
 You are producing a professional Operations Report for a U.S. small business owner.
 Output MUST be Markdown.
 
@@ -1424,11 +1746,26 @@ Report structure:
 ## 7) KPIs to Track
 ## 8) Next 14 Days Action Plan
 """
-    return clean_currency_for_markdown(ask_ai(prompt, mode="operations"))
 
-def ai_report_finance(doc_text: str, focus: str, style: str, question: str) -> str:
+
+OPERATIONS_REPORT_SECTIONS = (
+    "# Operations Control Report",
+    (
+        "## 1) Current Inventory Snapshot",
+        "## 2) Critical Stockout Risks",
+        "## 3) Overstock and Cash-Tied Items",
+        "## 4) Replenishment Rules",
+        "## 5) Promotion and Liquidation Rules",
+        "## 6) Weekly SOP Checklist",
+        "## 7) KPIs to Track",
+        "## 8) Next 14 Days Action Plan",
+    ),
+)
+
+
+def finance_report_prompt(doc_text: str, focus: str, style: str, question: str) -> str:
     finance_ai = st.session_state.outputs.get("finance_ai_output", "")
-    prompt = f"""
+    return f"""
 You are producing a Finance Analysis Report for a U.S. small business owner.
 Output MUST be Markdown.
 
@@ -1491,7 +1828,19 @@ Use uploaded numbers, not vague language.
 ## 6) Follow-up Questions
 - 5 questions that would materially improve accuracy.
 """
-    return ask_ai(prompt, mode="finance")
+
+
+FINANCE_REPORT_SECTIONS = (
+    "# Finance Analysis Report",
+    (
+        "## 1) Executive Summary",
+        "## 2) Actual Data Summary",
+        "## 3) Diagnosis",
+        "## 4) Risks & Red Flags",
+        "## 5) Action Plan",
+        "## 6) Follow-up Questions",
+    ),
+)
 
 
 def _safe_numeric(series: pd.Series) -> pd.Series:
@@ -1797,6 +2146,49 @@ with st.sidebar:
         "Research prototype. Do not upload Social Security numbers, tax IDs, payment-card data, or passwords."
     ))
 
+    if is_admin_session():
+        st.markdown("---")
+        with st.expander(t("AI 调用遥测（管理员）", "AI call telemetry (admin)"), expanded=False):
+            call_slots = ai_call_limit().stats()
+            st.caption(t(
+                f"模型调用并发：{call_slots['active']}/{call_slots['max_calls']}，排队 {call_slots['waiting']}。",
+                f"Provider calls in flight: {call_slots['active']}/{call_slots['max_calls']}, {call_slots['waiting']} waiting.",
+            ))
+            latency_by_model = ai_telemetry().model_latency_percentiles()
+            if latency_by_model:
+                st.dataframe(pd.DataFrame.from_dict(latency_by_model, orient="index"), use_container_width=True)
+            else:
+                st.caption(t("暂无 AI 调用记录。", "No AI calls recorded yet."))
+            recent_calls = ai_telemetry().records(limit=20)
+            if recent_calls:
+                st.dataframe(pd.DataFrame([
+                    {
+                        "Time": datetime.fromtimestamp(call["timestamp"]).strftime("%H:%M:%S"),
+                        "Mode": call["mode"],
+                        "Models": " -> ".join(attempt["model"] for attempt in call["attempts"]),
+                        "Latency_s": round(call["latency_seconds"], 2),
+                        "Prompt_Tokens": call["prompt_tokens_estimate"],
+                        "Response_Chars": call["response_chars"],
+                        "Outcome": call["outcome"],
+                        "Cached": call["cached"],
+                    }
+                    for call in recent_calls
+                ]), use_container_width=True, hide_index=True)
+            model_health = ai_model_diagnostics()
+            if model_health:
+                st.dataframe(pd.DataFrame.from_dict(model_health, orient="index"), use_container_width=True)
+        with st.expander(t("位置查询（管理员）", "Location lookups (admin)"), expanded=False):
+            lookup_stats = location_lookups().stats()
+            st.caption(t(
+                f"上游请求 {lookup_stats['executed']} 次，合并 {lookup_stats['shared']} 次，失败 {lookup_stats['errors']} 次。",
+                f"{lookup_stats['executed']} upstream lookups, {lookup_stats['shared']} coalesced, {lookup_stats['errors']} failed.",
+            ))
+            if lookup_stats["in_flight"]:
+                st.dataframe(pd.DataFrame([
+                    {"Lookup": " | ".join(str(part) for part in key), "Waiters": waiters}
+                    for key, waiters in lookup_stats["in_flight"].items()
+                ]), use_container_width=True, hide_index=True)
+
 # =========================================================
 # Header + Top Ask AI
 # =========================================================
@@ -1869,8 +2261,7 @@ with st.expander(t("咨询小企业决策助手", "Ask the Small Business Decisi
         if q:
             st.session_state.chat_history.append({"role": "user", "text": q})
             mode = st.session_state.active_suite
-            with st.spinner(t("分析中…", "Analyzing...")):
-                ans = ask_ai(q, mode=mode)
+            ans = ask_ai(q, mode=mode, placeholder=st.empty())
             st.session_state.chat_history.append({"role": "ai", "text": ans})
             st.session_state.clear_top_ask_ai = True
             st.session_state.top_last_status = "ready"
@@ -2258,6 +2649,50 @@ def render_open_store():
             st.caption(t(f"隐含加成率：{pr['target_margin']}%", f"Implied markup: {pr['target_margin']}%"))
             launch["notes"] = st.text_area(t("备注（可选）", "Notes (optional)"), launch.get("notes", ""), placeholder=t("例如：免租期、供应商账期、设备租赁等", "Free-rent period, supplier credit terms, equipment lease, etc."))
 
+            with st.expander(t("整张菜单 / SKU 定价检查（可选）", "Whole menu / SKU pricing check (optional)"), expanded=False):
+                st.caption(t(
+                    "必需字段：Cost, Price。可选字段：SKU, Competitor_Price, Monthly_Units（销售结构）。",
+                    "Required columns: Cost, Price. Optional: SKU, Competitor_Price, Monthly_Units (sales mix).",
+                ))
+                catalog_file = st.file_uploader(
+                    t("上传产品表 CSV", "Upload product table CSV"),
+                    type=["csv"],
+                    key="open_catalog_csv",
+                )
+                catalog_check = None
+                if catalog_file is not None:
+                    try:
+                        catalog_check = validate_pricing_catalog(pd.read_csv(catalog_file))
+                    except Exception as e:
+                        st.error(t(f"产品表无法读取：{e}", f"Product table could not be read: {e}"))
+                if catalog_check is not None:
+                    st.dataframe(pd.DataFrame({
+                        "SKU": catalog_check["sku"],
+                        "Cost": catalog_check["cost"],
+                        "Price": catalog_check["price"],
+                        "Margin %": np.round(catalog_check["margin"] * 100, 1),
+                        "Markup %": np.round(catalog_check["markup"] * 100, 1),
+                        "Price / Competitor": np.round(catalog_check["competitor_ratio"], 2),
+                    }), use_container_width=True, hide_index=True)
+                    for error in catalog_check["errors"][:20]:
+                        st.error(error)
+                    for warning in catalog_check["warnings"][:20]:
+                        st.warning(warning)
+                    if np.isfinite(catalog_check["mix_weighted_margin"]):
+                        st.metric(t("销售结构加权毛利率", "Sales-Mix Product Margin"), f"{catalog_check['mix_weighted_margin']:.1%}")
+                use_catalog = bool(
+                    catalog_check is not None
+                    and np.isfinite(catalog_check["mix_weighted_margin"])
+                    and st.checkbox(
+                        t("在决策中使用销售结构加权毛利率", "Use the sales-mix margin in the decision"),
+                        key="open_use_catalog_margin",
+                    )
+                )
+                if use_catalog:
+                    pr["mix_weighted_margin"] = catalog_check["mix_weighted_margin"]
+                else:
+                    pr.pop("mix_weighted_margin", None)
+
         m = open_store_feasibility_metrics()
         c1, c2, c3, c4 = st.columns(4)
         c1.metric(t("启动成本", "Startup Cost"), f"USD {m['startup_cost']:,.0f}")
@@ -2270,11 +2705,70 @@ def render_open_store():
         c6.metric(t("计划售价", "Planned Price"), f"USD {m['recommended_price']:,.2f}")
         c7.metric(t("计划毛利率", "Product Margin"), f"{m['implied_margin_pct']:.1f}%")
 
+        changed = open_store_changed_components()
+        if changed:
+            component_labels = {
+                "pricing": t("定价", "Pricing"),
+                "site": t("选址评分", "Site score"),
+                "cash": t("现金评分", "Cash score"),
+                "competition": t("竞争评分", "Competition score"),
+                "margin": t("利润评分", "Margin score"),
+                "aggregate": t("总评分与结论", "Overall score and decision"),
+                "risks": t("风险清单", "Risks"),
+            }
+            st.caption(
+                t("本次修改影响：", "Updated by the last change: ")
+                + ", ".join(component_labels[name] for name in changed)
+            )
+
         if m.get("input_errors"):
             st.error(t("请先修正以下输入：", "Correct these inputs before continuing:") + "\n\n- " + "\n- ".join(m["input_errors"]))
         for warning in m.get("input_warnings", []):
             st.warning(warning)
 
+        if m.get("pricing_valid", False) and m["expected_revenue"] > 0:
+            with st.expander(t("价格优化（基于价格敏感度）", "Price optimization (uses Price Sensitivity)"), expanded=False):
+                try:
+                    opt = optimize_price(st.session_state.profile, st.session_state.site, launch, pr)
+                except ValueError as exc:
+                    opt = None
+                    st.warning(t("无法在当前输入下优化价格：", "Price optimization is unavailable for these inputs: ") + str(exc))
+                if opt is not None:
+                    o1, o2, o3 = st.columns(3)
+                    o1.metric(t("利润最大化价格", "Profit-Maximizing Price"), f"USD {opt['profit_max_price']:,.2f}")
+                    o2.metric(t("评分最大化价格", "Score-Maximizing Price"), f"USD {opt['score_max_price']:,.2f}")
+                    o3.metric(t("策略区间内最佳价格", "Best Price for Strategy"), f"USD {opt['strategy_best_price']:,.2f}")
+                    st.line_chart(pd.DataFrame(
+                        {"Contribution Profit (USD/month)": opt["contribution_profit"]},
+                        index=pd.Index(np.round(opt["prices"], 2), name="Price (USD)"),
+                    ))
+                    sweep_low, sweep_high = opt["sweep_range"]
+                    st.caption(t(
+                        f"需求按弹性 {opt['elasticity']} 随价格变化，以计划售价和预期月收入为基准；扫描范围为 USD {sweep_low:,.2f}–{sweep_high:,.2f}"
+                        + ("（竞品价格低于单位成本，改以单位成本为基准）。" if opt["anchored_on_cost"] else "（竞品价格的 50%–150%，仅保留高于单位成本的价格）。")
+                        + "贡献利润 = 销量 ×（售价 − 单位成本），即代表性产品的单位经济；可行性评分使用的是整体业务的预期毛利率。",
+                        f"Demand changes with price at elasticity {opt['elasticity']}, anchored at the planned price and expected revenue; the sweep covers USD {sweep_low:,.2f}–{sweep_high:,.2f}"
+                        + (" (the competitor price is below unit cost, so the sweep is anchored on unit cost)." if opt["anchored_on_cost"] else " (50%–150% of the competitor price, above unit cost only).")
+                        + " Contribution profit is units × (price − unit cost) for the representative product; the feasibility score uses the expected business gross margin instead.",
+                    ))
+
+                    if opt["profit_max_at_boundary"]:
+                        st.warning(t(
+                            f"利润在扫描范围边缘（USD {opt['profit_max_price']:,.2f}）仍在上升，范围内没有利润最优价格。"
+                            "价格敏感度较低时，模型会一直建议更高的价格；请结合竞品和顾客反馈判断。",
+                            f"Profit is still rising at the edge of the sweep (USD {opt['profit_max_price']:,.2f}), so there is no profit-maximizing price in range. "
+                            "With low price sensitivity the model keeps favouring higher prices; check competitors and customer feedback instead.",
+                        ))
+                    else:
+                        def _use_profit_max_price():
+                            st.session_state["open_planned_price_widget"] = round(opt["profit_max_price"], 2)
+
+                        st.button(
+                            t("采用利润最大化价格", "Use profit-maximizing price"),
+                            on_click=_use_profit_max_price,
+                            key="open_use_optimal_price_btn",
+                        )
+
         if m["funding_gap"] > 0 or m["runway_months"] < launch["cash_target_months"]:
             st.warning(t("现金跑道偏紧：先降低启动成本、谈免租期/账期，或补充启动资金。", "Cash runway is tight: reduce startup cost, negotiate free rent/payment terms, or secure additional funding."))
         else:
@@ -2317,6 +2811,25 @@ def render_open_store():
         ])
         st.dataframe(metric_df, use_container_width=True, hide_index=True)
 
+        st.markdown("### " + t("逐月现金预测", "Month-by-Month Cash Projection"))
+        projection = project_open_store_cash(st.session_state.profile, st.session_state.launch)
+        p1, p2, p3 = st.columns(3)
+        p1.metric(
+            t("现金耗尽月份", "Cash-Out Month"),
+            t(f"第 {projection['cash_out_month']} 月", f"Month {projection['cash_out_month']}")
+            if projection["cash_out_month"]
+            else t("预测期内未耗尽", "None in horizon"),
+        )
+        p2.metric(t("最低现金", "Lowest Cash"), f"USD {projection['min_cash']:,.0f}")
+        p3.metric(t("期末现金", "Ending Cash"), f"USD {projection['ending_cash']:,.0f}")
+        st.line_chart(
+            pd.DataFrame({"Cash Balance (USD)": projection["cash_balance"]}, index=pd.Index(projection["month"], name="Month")),
+        )
+        st.caption(t(
+            f"假设收入在前 {projection['ramp_months']} 个月从 {projection['ramp_start']:.0%} 逐步爬升至 100%，装修费用分摊到开业后的最初几个月。",
+            f"Assumes revenue ramps from {projection['ramp_start']:.0%} to 100% over the first {projection['ramp_months']} months and build-out spending is phased across the opening months.",
+        ))
+
         with st.expander(t("评分方法", "How the score is calculated"), expanded=False):
             score_df = pd.DataFrame([
                 {"Component": "Site", "Score": int(m["site_score"]), "Weight": "35%"},
@@ -2337,6 +2850,112 @@ def render_open_store():
                 "Overall = Site×35% + Cash×35% + Margin×20% + Competition×10%.",
             ) + " " + score_status)
 
+        if m.get("decision_ready", False):
+            with st.expander(t("开店风险模拟", "Launch risk simulation"), expanded=False):
+                spread = st.slider(
+                    t("收入、毛利率与固定成本的不确定性（±%）", "Uncertainty on revenue, gross margin, and fixed cost (±%)"),
+                    0, 50, 20, step=5, key="open_simulation_spread",
+                )
+                sim = simulate_open_store_feasibility(
+                    st.session_state.profile,
+                    st.session_state.site,
+                    st.session_state.launch,
+                    st.session_state.pricing,
+                    {
+                        "expected_monthly_revenue": triangular_around(m["expected_revenue"], spread, min=0.0),
+                        "expected_gross_margin": triangular_around(m["expected_gross_margin_pct"], spread, min=0.0, max=99.0),
+                        "monthly_fixed_cost_estimate": triangular_around(m["monthly_fixed_cost"], spread, min=0.0),
+                    },
+                    seed=7,
+                )
+                s1, s2, s3, s4 = st.columns(4)
+                s1.metric("P(GO)", f"{sim['p_go']:.1%}")
+                s2.metric("P(NO-GO)", f"{sim['p_no_go']:.1%}")
+                s3.metric(t("现金跑道中位数", "Median Runway"), f"{sim['runway_percentiles'][50]:.1f} mo")
+                s4.metric(t("出现资金缺口概率", "P(Funding Gap)"), f"{sim['p_funding_gap']:.1%}")
+                st.dataframe(pd.DataFrame([
+                    {
+                        "Percentile": f"P{q}",
+                        "Cash Runway (months)": round(sim["runway_percentiles"][q], 2),
+                        "Funding Gap (USD)": round(sim["funding_gap_percentiles"][q]),
+                    }
+                    for q in sim["runway_percentiles"]
+                ]), use_container_width=True, hide_index=True)
+                st.caption(t(
+                    f"基于 {sim['samples']:,} 次三角分布抽样，使用与上方相同的评分规则。",
+                    f"Based on {sim['samples']:,} triangular draws scored with the same rules as above.",
+                ))
+
+            if decision != "GO":
+                with st.expander(t("达到 GO 需要什么", "What it takes to reach GO"), expanded=False):
+                    seek = goal_seek_open_store(
+                        st.session_state.profile,
+                        st.session_state.site,
+                        st.session_state.launch,
+                        st.session_state.pricing,
+                    )
+                    current_values = {
+                        "planned_price": m["recommended_price"],
+                        "expected_monthly_revenue": m["expected_revenue"],
+                        "funding_available": float(st.session_state.launch.get("funding_available", 0) or 0),
+                    }
+                    seek_labels = {
+                        "planned_price": t("计划售价", "Planned Price"),
+                        "expected_monthly_revenue": t("预期月收入", "Expected Monthly Revenue"),
+                        "funding_available": t("可用启动资金", "Available Funding"),
+                    }
+                    st.dataframe(pd.DataFrame([
+                        {
+                            "Input": seek_labels[name],
+                            "Current": f"USD {current_values[name]:,.2f}",
+                            "Minimum for GO": f"USD {row['value']:,.2f}" if row["reachable"] else t(
+                                "仅调整此项无法达到", "Not reachable by this input alone"
+                            ),
+                        }
+                        for name, row in seek.items()
+                    ]), use_container_width=True, hide_index=True)
+                    st.caption(t(
+                        "每一行只改变一个输入，其余假设保持不变。",
+                        "Each row changes one input while every other assumption stays as entered.",
+                    ))
+
+            with st.expander(t("哪些输入最影响总分", "What moves the overall score"), expanded=False):
+                sens_spread = st.slider(
+                    t("每个输入的变动范围（±%）", "Range applied to each input (±%)"),
+                    10, 60, 30, step=10, key="open_sensitivity_spread",
+                )
+                sens = analyze_feasibility_sensitivity(
+                    st.session_state.profile,
+                    st.session_state.site,
+                    st.session_state.launch,
+                    st.session_state.pricing,
+                    spread_pct=sens_spread,
+                )
+                tornado_df = pd.DataFrame([
+                    {
+                        "Input": row["label"],
+                        "Low end": row["low_score"] - sens["base_score"],
+                        "High end": row["high_score"] - sens["base_score"],
+                    }
+                    for row in sens["tornado"]
+                ]).set_index("Input")
+                st.bar_chart(tornado_df, horizontal=True)
+                if sens["flips"]:
+                    st.dataframe(pd.DataFrame([
+                        {
+                            "Input": flip["label"],
+                            "Between": f"{flip['from_value']:,.2f} → {flip['to_value']:,.2f}"
+                            if isinstance(flip["from_value"], float)
+                            else f"{flip['from_value']:,} → {flip['to_value']:,}"
+                            if isinstance(flip["from_value"], int)
+                            else f"{flip['from_value']} → {flip['to_value']}",
+                            "Decision change": f"{flip['from_decision']} → {flip['to_decision']}",
+                        }
+                        for flip in sens["flips"]
+                    ]), use_container_width=True, hide_index=True)
+                else:
+                    st.caption(t("在该范围内，单一输入变化不会改变最终判断。", "No single input changes the decision within this range."))
+
         if m["risks"]:
             st.markdown("### " + t("主要风险", "Main Risks"))
             for r in m["risks"]:
@@ -2392,25 +3011,22 @@ def render_open_store():
                 use_container_width=True,
                 disabled=not report_ready,
             ):
-                st.session_state.open_store_report_error = ""
-                with st.spinner(t("生成报告中…", "Generating report...")):
-                    try:
-                        st.session_state.outputs["open_store_report_md"] = ai_report_open_store(open_store_question)
-                    except AIServiceUnavailable as error:
-                        st.session_state.open_store_report_error = error.user_message
-                        st.rerun()
-                    except Exception:
-                        st.session_state.open_store_report_error = t(
-                            "报告暂时无法生成。您的输入仍已保存，请稍后重试。",
-                            "The report could not be generated right now. Your inputs are still saved; please retry in a moment.",
-                        )
-                        st.rerun()
+                submit_ai_report(
+                    "open_store_report_md",
+                    open_store_report_prompt(open_store_question),
+                    mode="open_store",
+                    error_key="open_store_report_error",
+                    clean_currency=True,
+                )
+                st.rerun()
         with colB:
             if st.button(t("清空报告", "Clear Report"), use_container_width=True):
                 st.session_state.outputs["open_store_report_md"] = ""
                 st.session_state.outputs["final_open_store"] = None
                 st.session_state.open_store_report_error = ""
 
+        if "open_store_report_md" in st.session_state.ai_jobs:
+            render_ai_report_job("open_store_report_md", "open_store_report_error")
         if st.session_state.outputs.get("open_store_report_md", ""):
             st.markdown(st.session_state.outputs["open_store_report_md"])
             st.download_button(
@@ -2620,8 +3236,7 @@ def render_operations():
                 use_container_width=True,
                 disabled=not operations_consent,
             ):
-                with st.spinner(t("分析中…", "Analyzing...")):
-                    out = ai_operations_diagnosis(q)
+                out = ai_operations_diagnosis(q, placeholder=st.empty())
                 st.session_state.outputs["ops_ai_output"] = out
                 st.session_state.outputs["ops_diagnosis_md"] = out
                 # st.rerun() removed to avoid Streamlit Cloud SessionInfo race
@@ -2636,6 +3251,23 @@ def render_operations():
 
     st.divider()
     st.subheader(t("可交付物：运营报告", "Deliverable: Operations Report"))
+    try:
+        context_details = operations_context_details()
+    except Exception:
+        context_details = None
+    if context_details is not None and not context_details["full_table"]:
+        st.caption(t(
+            f"AI 上下文约 {context_details['estimated_tokens']:,} tokens：逐项列出 "
+            f"{context_details['items_listed']}/{context_details['total_items']} 个 SKU，其余按品类汇总。",
+            f"AI context is about {context_details['estimated_tokens']:,} tokens: "
+            f"{context_details['items_listed']} of {context_details['total_items']} SKUs are listed "
+            "individually and the rest are summarized by category.",
+        ))
+    ops_report_parallel = st.toggle(
+        t("分章节并行生成（更快）", "Generate sections in parallel (faster)"),
+        value=True,
+        key="ops_report_parallel",
+    )
     col1, col2 = st.columns([1, 1])
     with col1:
         if st.button(
@@ -2644,14 +3276,24 @@ def render_operations():
             use_container_width=True,
             disabled=not operations_consent,
         ):
-            with st.spinner(t("生成中…", "Generating...")):
-                st.session_state.outputs["ops_report_md"] = ai_report_operations()
+            submit_ai_report(
+                "ops_report_md",
+                operations_report_prompt(),
+                mode="operations",
+                error_key="ops_report_error",
+                clean_currency=True,
+                sections=OPERATIONS_REPORT_SECTIONS if ops_report_parallel else None,
+            )
             # st.rerun() removed to avoid Streamlit Cloud SessionInfo race
     with col2:
         if st.button(t("清空运营报告", "Clear Operations Report"), use_container_width=True):
             st.session_state.outputs["ops_report_md"] = ""
             # st.rerun() removed to avoid Streamlit Cloud SessionInfo race
 
+    if st.session_state.get("ops_report_error"):
+        st.error(st.session_state.ops_report_error)
+    if "ops_report_md" in st.session_state.ai_jobs:
+        render_ai_report_job("ops_report_md", "ops_report_error")
     if st.session_state.outputs.get("ops_report_md", ""):
         st.markdown(st.session_state.outputs["ops_report_md"])
         st.download_button(
@@ -2782,14 +3424,18 @@ Return:
 6) Follow-up Questions
 - 3 questions to improve accuracy.
 """
-        with st.spinner(t("分析中…", "Analyzing...")):
-            out = ask_ai(prompt, mode="finance")
+        out = ask_ai(prompt, mode="finance", placeholder=st.empty())
         st.session_state.outputs["finance_ai_output"] = out
         st.markdown(out)
 
     st.divider()
     st.subheader(t("可交付物：财务报告（AI）", "Deliverable: Finance Report (AI)"))
 
+    finance_report_parallel = st.toggle(
+        t("分章节并行生成（更快）", "Generate sections in parallel (faster)"),
+        value=True,
+        key="finance_report_parallel",
+    )
     colA, colB = st.columns([1, 1])
     with colA:
         if st.button(
@@ -2799,13 +3445,13 @@ Return:
             disabled=not finance_ready,
         ):
             doc_text = read_uploaded_to_text(files) if files else "[No files uploaded]"
-            with st.spinner(t("生成中…", "Generating...")):
-                st.session_state.outputs["finance_report_md"] = ai_report_finance(
-                    doc_text=doc_text,
-                    focus=focus,
-                    style=style,
-                    question=question
-                )
+            submit_ai_report(
+                "finance_report_md",
+                finance_report_prompt(doc_text, focus, style, question),
+                mode="finance",
+                error_key="finance_report_error",
+                sections=FINANCE_REPORT_SECTIONS if finance_report_parallel else None,
+            )
             # st.rerun() removed to avoid Streamlit Cloud SessionInfo race
 
     with colB:
@@ -2813,6 +3459,10 @@ Return:
             st.session_state.outputs["finance_report_md"] = ""
             # st.rerun() removed to avoid Streamlit Cloud SessionInfo race
 
+    if st.session_state.get("finance_report_error"):
+        st.error(st.session_state.finance_report_error)
+    if "finance_report_md" in st.session_state.ai_jobs:
+        render_ai_report_job("finance_report_md", "finance_report_error")
     if st.session_state.outputs.get("finance_report_md", ""):
         st.text_area(t("财务报告预览", "Finance Report Preview"), st.session_state.outputs["finance_report_md"], height=520)
         st.download_button(
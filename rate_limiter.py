@@ -0,0 +1,149 @@
+"""Process-wide request pacing per upstream host.
+
+Geocoding and Overpass calls used to sleep a fixed 0.25-0.6 s before every
+request and 1.2-2.2 s after a 429, whether or not anything else had been sent
+recently. :class:`HostRateLimiter` keeps a token bucket per host instead: a
+request waits only when that host's policy (rate and burst) would otherwise
+be exceeded, and a ``Retry-After`` from the provider blocks the host for
+exactly as long as it asks. Waits are reserved under a lock, so concurrent
+sessions queue up behind each other rather than all firing at once.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from email.utils import parsedate_to_datetime
+import threading
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+
+class RateLimitExceeded(RuntimeError):
+    """The host cannot be called within the caller's ``max_wait``."""
+
+    def __init__(self, host: str, wait_seconds: float) -> None:
+        super().__init__(f"{host} is rate limited for another {wait_seconds:.1f} s")
+        self.host = host
+        self.wait_seconds = wait_seconds
+
+
+def host_of(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+def parse_retry_after(value: str | None, now: Callable[[], float] = time.time) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - now())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class HostRateLimiter:
+    """Token bucket per host; ``policies`` maps host to (requests per second, burst).
+
+    Hosts without a policy use ``default_policy``.
+    """
+
+    def __init__(
+        self,
+        policies: Mapping[str, tuple[float, int]] | None = None,
+        default_policy: tuple[float, int] = (2.0, 2),
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.policies = {host.lower(): policy for host, policy in (policies or {}).items()}
+        for rate, burst in [*self.policies.values(), default_policy]:
+            if rate <= 0 or burst < 1:
+                raise ValueError("Rates must be positive and bursts at least 1.")
+        self.default_policy = default_policy
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host: str, now: float) -> dict[str, Any]:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate, burst = self.policies.get(host, self.default_policy)
+            bucket = self._buckets[host] = {
+                "rate": float(rate),
+                "burst": float(burst),
+                "tokens": float(burst),
+                "updated": now,
+                "blocked_until": 0.0,
+                "requests": 0,
+                "waits": 0,
+                "waited_seconds": 0.0,
+                "retry_after_events": 0,
+            }
+        else:
+            elapsed = max(0.0, now - bucket["updated"])
+            bucket["tokens"] = min(bucket["burst"], bucket["tokens"] + elapsed * bucket["rate"])
+            bucket["updated"] = now
+        return bucket
+
+    def reserve(self, host: str, max_wait: float | None = None) -> float:
+        """Reserve the next request slot for ``host`` and return how long to wait for it.
+
+        Raises :class:`RateLimitExceeded` without reserving if the wait would
+        exceed ``max_wait``.
+        """
+        host = host.lower()
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(host, now)
+            wait = 0.0 if bucket["tokens"] >= 1 else (1 - bucket["tokens"]) / bucket["rate"]
+            wait = max(wait, bucket["blocked_until"] - now)
+            if max_wait is not None and wait > max_wait:
+                raise RateLimitExceeded(host, wait)
+            # Tokens may go negative: later callers queue behind this reservation.
+            bucket["tokens"] -= 1
+            if bucket["blocked_until"] > now:
+                # Requests released after a Retry-After block are still paced.
+                bucket["blocked_until"] += 1 / bucket["rate"]
+            bucket["requests"] += 1
+            if wait > 0:
+                bucket["waits"] += 1
+                bucket["waited_seconds"] += wait
+            return wait
+
+    def acquire(self, host: str, max_wait: float | None = None) -> float:
+        """Block until ``host`` may be called; returns the seconds waited."""
+        wait = self.reserve(host, max_wait)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def defer(self, host: str, seconds: float) -> None:
+        """Block ``host`` for ``seconds``, e.g. after a 429 with Retry-After."""
+        host = host.lower()
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(host, now)
+            bucket["blocked_until"] = max(bucket["blocked_until"], now + max(0.0, seconds))
+            bucket["retry_after_events"] += 1
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            now = self._clock()
+            return {
+                host: {
+                    "rate_per_second": bucket["rate"],
+                    "burst": int(bucket["burst"]),
+                    "requests": bucket["requests"],
+                    "waits": bucket["waits"],
+                    "waited_seconds": bucket["waited_seconds"],
+                    "retry_after_events": bucket["retry_after_events"],
+                    "blocked_for_seconds": max(0.0, bucket["blocked_until"] - now),
+                }
+                for host, bucket in self._buckets.items()
+            }
@@ -0,0 +1,152 @@
+"""Section-wise parallel generation for long AI reports.
+
+Completion latency grows with output length, so a 6-8 section report
+generated as one answer takes roughly the sum of its sections. Here every
+section is requested concurrently from the same evidence block and the
+answers are stitched back together in order, so wall-clock time is close to
+the slowest section. Each section is retried on failure; a section that still
+fails is replaced by a short notice instead of failing the whole report.
+Finished sections are reported in order as they become available, and a
+cancelled report stops before any further provider call.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import time
+from typing import Any
+
+from ai_reliability import AIServiceUnavailable
+
+
+FAILED_SECTION_NOTICE = "> This section could not be generated. Please regenerate the report to retry it."
+
+
+class ReportCancelled(Exception):
+    """Raised when ``cancelled()`` reports that the report is no longer wanted."""
+
+
+def section_prompt(report_prompt: str, heading: str) -> str:
+    """Ask for one section of a report whose full prompt is ``report_prompt``."""
+    return (
+        f"{report_prompt}\n\n"
+        "Write ONLY the following section of the report structure above. Start with its exact "
+        "heading, follow the rules above, and do not write the report title or any other section.\n"
+        f"{heading}"
+    )
+
+
+def _clean_section(heading: str, text: str) -> str:
+    lines = str(text).strip().splitlines()
+    # Drop a repeated report title; each request is told not to write one.
+    while lines and lines[0].startswith("# "):
+        lines = lines[1:]
+    body = "\n".join(lines).strip()
+    if not body.startswith("#"):
+        body = f"{heading}\n{body}"
+    return body
+
+
+def _request_with_retries(
+    request_section: Callable[[str], str],
+    heading: str,
+    max_retries: int,
+    cancelled: Callable[[], bool],
+) -> dict[str, Any]:
+    started = time.monotonic()
+    error: Exception | None = None
+    for attempt in range(max_retries + 1):
+        if cancelled():
+            raise ReportCancelled(heading)
+        try:
+            text = request_section(heading)
+            if text and str(text).strip():
+                return {"text": _clean_section(heading, text), "error": None, "attempts": attempt + 1,
+                        "seconds": time.monotonic() - started}
+            error = AIServiceUnavailable(
+                code="AI_UNAVAILABLE",
+                user_message="The AI service returned an empty section.",
+                last_error=f"Empty section: {heading}",
+            )
+        except Exception as exc:  # provider and formatting errors vary
+            error = exc
+    return {"text": None, "error": error, "attempts": max_retries + 1, "seconds": time.monotonic() - started}
+
+
+def _section_text(heading: str, result: dict[str, Any]) -> str:
+    return result["text"] if result["text"] is not None else f"{heading}\n{FAILED_SECTION_NOTICE}"
+
+
+def generate_report_sections(
+    title: str,
+    headings: Sequence[str],
+    request_section: Callable[[str], str],
+    max_workers: int = 4,
+    max_retries: int = 1,
+    on_progress: Callable[[str], None] | None = None,
+    cancelled: Callable[[], bool] | None = None,
+) -> dict[str, Any]:
+    """Generate every section concurrently and assemble them in ``headings`` order.
+
+    ``request_section(heading)`` returns the Markdown for one section. Returns
+    the assembled ``markdown``, the ``failed_sections`` headings and per-section
+    ``section_seconds``. Raises the last error if every section failed.
+
+    ``on_progress(text)`` receives the report in order as it completes: the
+    title, then each section once it and every section before it are done.
+    ``cancelled()`` is checked before each provider attempt and after each
+    section; when it returns True, queued sections are dropped and
+    :class:`ReportCancelled` is raised. An exception from ``on_progress``
+    stops the report the same way.
+    """
+    if not headings:
+        raise ValueError("At least one section heading is required.")
+    cancelled = cancelled or (lambda: False)
+    results: list[dict[str, Any] | None] = [None] * len(headings)
+    reported = 0
+    if on_progress is not None:
+        on_progress(title.strip() + "\n\n")
+    pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(headings))), thread_name_prefix="ai-section")
+    try:
+        pending = {
+            pool.submit(_request_with_retries, request_section, heading, max_retries, cancelled): index
+            for index, heading in enumerate(headings)
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[pending.pop(future)] = future.result()
+            if cancelled():
+                raise ReportCancelled(title)
+            while reported < len(headings) and results[reported] is not None:
+                if on_progress is not None:
+                    on_progress(_section_text(headings[reported], results[reported]) + "\n\n")
+                reported += 1
+    finally:
+        # Sections that have not started are dropped; running provider calls
+        # cannot be interrupted and finish in the background.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    failed = [heading for heading, result in zip(headings, results) if result["text"] is None]
+    if len(failed) == len(headings):
+        error = results[-1]["error"]
+        if isinstance(error, AIServiceUnavailable):
+            raise error
+        raise AIServiceUnavailable(
+            code="AI_UNAVAILABLE",
+            user_message=(
+                "The AI service is temporarily unavailable. Your inputs are still saved; "
+                "please retry in a moment."
+            ),
+            last_error=str(error),
+        )
+
+    parts = [title.strip()]
+    for heading, result in zip(headings, results):
+        parts.append(_section_text(heading, result))
+    return {
+        "markdown": "\n\n".join(parts) + "\n",
+        "failed_sections": failed,
+        "section_seconds": {heading: result["seconds"] for heading, result in zip(headings, results)},
+    }
@@ -0,0 +1,140 @@
+"""One-at-a-time sensitivity (tornado) analysis for the launch decision.
+
+All perturbations are stacked into one column set and scored by a single call
+to the vectorized batch path, so a full tornado costs one NumPy pass.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from business_logic import (
+    _as_float,
+    calculate_open_store_feasibility,
+    calculate_open_store_feasibility_batch,
+)
+
+
+SENSITIVITY_INPUTS = {
+    "traffic": "Traffic",
+    "competitors": "Competitors",
+    "rent_level": "Rent Level",
+    "expected_monthly_revenue": "Expected Revenue",
+    "expected_gross_margin": "Gross Margin",
+    "monthly_fixed_cost_estimate": "Fixed Cost",
+    "planned_price": "Planned Price",
+}
+RENT_LEVELS = ["Low", "Medium", "High"]
+_INPUT_BOUNDS = {"expected_gross_margin": (1.0, 99.0)}
+# The scorer truncates these to whole numbers, so they are perturbed on an
+# integer grid: every reported value (and flip point) is one it evaluated.
+_COUNT_INPUTS = {"traffic", "competitors"}
+
+
+def _input_grid(name: str, base: Any, spread_pct: float, steps: int) -> np.ndarray:
+    if name == "rent_level":
+        return np.array(RENT_LEVELS, dtype=object)
+    value = _as_float(base)
+    delta = abs(value) * spread_pct / 100.0
+    low, high = _INPUT_BOUNDS.get(name, (0.0, np.inf))
+    grid = np.clip(np.linspace(value - delta, value + delta, steps), low, high)
+    if name in _COUNT_INPUTS:
+        return np.unique(np.round(grid)).astype(int)
+    return np.unique(grid)
+
+
+def analyze_feasibility_sensitivity(
+    profile: Dict[str, Any],
+    site: Dict[str, Any],
+    launch: Dict[str, Any],
+    pricing: Dict[str, Any],
+    spread_pct: float = 30.0,
+    steps: int = 41,
+    inputs: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """Perturb each input across +/- ``spread_pct`` and report score swings.
+
+    Returns the base result, tornado rows sorted by score swing, every point
+    where the decision flips between neighbouring grid values, and the full
+    per-input response curves for charting.
+    """
+    names = list(inputs) if inputs is not None else list(SENSITIVITY_INPUTS)
+    unknown = [name for name in names if name not in SENSITIVITY_INPUTS]
+    if unknown:
+        raise ValueError(f"Unsupported sensitivity inputs: {', '.join(unknown)}")
+    steps = max(3, int(steps))
+    spread_pct = max(0.0, float(spread_pct))
+
+    base_inputs: Dict[str, Any] = {**profile, **site, **launch, **pricing}
+    base = calculate_open_store_feasibility(profile, site, launch, pricing)
+
+    grids = {
+        name: _input_grid(name, base_inputs.get(name, "Medium"), spread_pct, steps)
+        for name in names
+    }
+    total = sum(len(grid) for grid in grids.values())
+    columns: Dict[str, Any] = {
+        key: np.full(total, value, dtype=object)
+        for key, value in base_inputs.items()
+        if np.ndim(value) == 0
+    }
+    offsets: Dict[str, slice] = {}
+    start = 0
+    for name, grid in grids.items():
+        offsets[name] = slice(start, start + len(grid))
+        if name not in columns:
+            columns[name] = np.full(total, base_inputs.get(name, "Medium"), dtype=object)
+        columns[name][offsets[name]] = grid
+        start += len(grid)
+
+    batch = calculate_open_store_feasibility_batch(columns)
+    scores = batch["overall_score"]
+    decisions = batch["decision"]
+
+    tornado: List[Dict[str, Any]] = []
+    flips: List[Dict[str, Any]] = []
+    curves: Dict[str, Dict[str, list]] = {}
+    for name, grid in grids.items():
+        window = offsets[name]
+        values = grid.tolist()
+        curve_scores = scores[window]
+        curve_decisions = decisions[window]
+        curves[name] = {
+            "values": values,
+            "overall_score": curve_scores.tolist(),
+            "decision": curve_decisions.tolist(),
+        }
+        tornado.append({
+            "input": name,
+            "label": SENSITIVITY_INPUTS[name],
+            "low_value": values[0],
+            "high_value": values[-1],
+            "low_score": int(curve_scores[0]),
+            "high_score": int(curve_scores[-1]),
+            "min_score": int(curve_scores.min()),
+            "max_score": int(curve_scores.max()),
+            "swing": int(curve_scores.max() - curve_scores.min()),
+        })
+        changed = np.flatnonzero(curve_decisions[1:] != curve_decisions[:-1])
+        for index in changed:
+            flips.append({
+                "input": name,
+                "label": SENSITIVITY_INPUTS[name],
+                "from_value": values[index],
+                "to_value": values[index + 1],
+                "from_decision": curve_decisions[index],
+                "to_decision": curve_decisions[index + 1],
+            })
+
+    tornado.sort(key=lambda row: row["swing"], reverse=True)
+    return {
+        "base_score": base["overall_score"],
+        "base_decision": base["decision"],
+        "spread_pct": spread_pct,
+        "evaluations": total,
+        "tornado": tornado,
+        "flips": flips,
+        "curves": curves,
+    }
@@ -0,0 +1,93 @@
+"""Coalesce concurrent identical calls into one in-flight request.
+
+``st.cache_data`` only helps once a value is cached, and it locks per exact
+argument tuple, so "Austin, TX" and "austin,  tx" from two sessions still
+both reach Nominatim. :class:`SingleFlight` runs one call per normalized key
+at a time: callers that arrive while it is in flight wait for it and receive
+the same result, or the same exception. Nothing is kept once the call
+finishes; caching stays with the layers above and below.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+import threading
+from typing import Any, TypeVar
+
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "finished", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.finished = False
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Per-key deduplication of concurrent calls.
+
+    ``stats()`` reports totals since start plus the number of callers
+    currently waiting on each in-flight key.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.shared = 0
+        self.errors = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Return ``fn()``, or the result of an identical call already in flight."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                call.waiters += 1
+                self.shared += 1
+        if leader:
+            try:
+                call.result = fn()
+                call.finished = True
+            except Exception as error:
+                call.error = error
+                call.finished = True
+                with self._lock:
+                    self.errors += 1
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        else:
+            call.done.wait()
+            if not call.finished:
+                # The leader was interrupted (e.g. a Streamlit rerun stopped its
+                # script); that is not this caller's error, so try again.
+                return self.do(key, fn)
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def waiters(self, key: Hashable) -> int:
+        """Callers currently waiting on ``key`` (not counting the one running it)."""
+        with self._lock:
+            call = self._calls.get(key)
+            return call.waiters if call is not None else 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "executed": self.executed,
+                "shared": self.shared,
+                "errors": self.errors,
+                "in_flight": {key: call.waiters for key, call in self._calls.items()},
+            }
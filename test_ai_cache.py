@@ -0,0 +1,138 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from ai_cache import AIResponseCache, ai_cache_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class AIResponseCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "ai.sqlite3")
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_key_depends_on_mode_models_and_prompt(self):
+        base = ai_cache_key("general", ["model-a", "model-b"], "prompt")
+
+        self.assertEqual(base, ai_cache_key("general", ("model-a", "model-b"), "prompt"))
+        self.assertNotEqual(base, ai_cache_key("finance", ["model-a", "model-b"], "prompt"))
+        self.assertNotEqual(base, ai_cache_key("general", ["model-b", "model-a"], "prompt"))
+        self.assertNotEqual(base, ai_cache_key("general", ["model-a", "model-b"], "prompt "))
+
+    def test_repeated_prompt_skips_the_provider(self):
+        cache = AIResponseCache(clock=self.clock)
+        calls = []
+
+        def request():
+            calls.append(1)
+            return "report"
+
+        first = cache.get_or_request("general", ["model-a"], "prompt", request)
+        second = cache.get_or_request("general", ["model-a"], "prompt", request)
+
+        self.assertEqual((first, second), ("report", "report"))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.stats()["memory_hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_disk_tier_survives_a_new_process_cache(self):
+        AIResponseCache(self.path, clock=self.clock).put("key", "saved answer")
+        restarted = AIResponseCache(self.path, clock=self.clock)
+
+        self.assertEqual(restarted.get("key"), "saved answer")
+        self.assertEqual(restarted.get("key"), "saved answer")
+        self.assertEqual(restarted.stats()["disk_hits"], 1)
+        self.assertEqual(restarted.stats()["memory_hits"], 1)
+
+    def test_entries_expire_after_ttl_in_both_tiers(self):
+        cache = AIResponseCache(self.path, ttl_seconds=60, clock=self.clock)
+        cache.put("key", "answer")
+        self.clock.now += 61
+
+        self.assertIsNone(cache.get("key"))
+        self.assertIsNone(AIResponseCache(self.path, ttl_seconds=60, clock=self.clock).get("key"))
+
+    def test_size_limits_evict_least_recently_used(self):
+        cache = AIResponseCache(self.path, max_entries=2, max_disk_entries=2, clock=self.clock)
+        for key in ("a", "b", "c"):
+            self.clock.now += 1
+            cache.put(key, key.upper())
+
+        restarted = AIResponseCache(self.path, clock=self.clock)
+        self.assertIsNone(restarted.get("a"))
+        self.assertEqual(restarted.get("c"), "C")
+        self.assertEqual(cache.stats()["size"], 2)
+        self.assertGreaterEqual(cache.stats()["evictions"], 2)
+
+    def test_unpersisted_answers_stay_in_memory(self):
+        cache = AIResponseCache(self.path, clock=self.clock)
+        cache.put("upload", "answer from uploaded data", persist=False)
+
+        self.assertEqual(cache.get("upload"), "answer from uploaded data")
+        self.assertIsNone(AIResponseCache(self.path, clock=self.clock).get("upload"))
+
+    def test_get_or_request_honours_persist(self):
+        cache = AIResponseCache(self.path, clock=self.clock)
+        cache.get_or_request("finance", ["model-a"], "prompt", lambda: "answer", persist=False)
+
+        self.assertEqual(cache.get_or_request("finance", ["model-a"], "prompt", lambda: "other"), "answer")
+        restarted = AIResponseCache(self.path, clock=self.clock)
+        self.assertEqual(restarted.get_or_request("finance", ["model-a"], "prompt", lambda: "fresh"), "fresh")
+
+    def test_memory_hits_do_not_wait_for_a_disk_read(self):
+        disk_entered = threading.Event()
+        release_disk = threading.Event()
+
+        class SlowDiskCache(AIResponseCache):
+            slow = False
+
+            def _connect(self):
+                if self.slow:
+                    disk_entered.set()
+                    release_disk.wait(5)
+                return super()._connect()
+
+        cache = SlowDiskCache(self.path, clock=self.clock)
+        cache.put("warm", "in memory")
+        cache.slow = True
+        reader = threading.Thread(target=cache.get, args=("cold",))
+        reader.start()
+        disk_entered.wait(5)
+
+        answers = []
+        warm_reader = threading.Thread(target=lambda: answers.append(cache.get("warm")))
+        warm_reader.start()
+        warm_reader.join(1)
+        try:
+            self.assertEqual(answers, ["in memory"])
+        finally:
+            release_disk.set()
+            reader.join()
+            warm_reader.join()
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_failed_requests_are_not_cached(self):
+        cache = AIResponseCache(clock=self.clock)
+
+        def failing():
+            raise RuntimeError("provider down")
+
+        with self.assertRaises(RuntimeError):
+            cache.get_or_request("general", ["model-a"], "prompt", failing)
+        self.assertEqual(cache.get_or_request("general", ["model-a"], "prompt", lambda: "ok"), "ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
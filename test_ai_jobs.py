@@ -0,0 +1,132 @@
+import threading
+import time
+import unittest
+
+from ai_jobs import AIJobQueue
+from ai_reliability import AIServiceUnavailable
+
+
+def wait_for(queue, job_id, states=("done", "failed", "cancelled"), timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if job["status"] in states:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not reach {states}")
+
+
+class AIJobQueueTests(unittest.TestCase):
+    def setUp(self):
+        self.queue = AIJobQueue(max_workers=1)
+
+    def tearDown(self):
+        self.queue.shutdown()
+
+    def test_submit_returns_immediately_and_stores_the_result(self):
+        release = threading.Event()
+
+        def generate(job):
+            release.wait(5)
+            job.append_partial("Report ")
+            return "Report ready"
+
+        job_id = self.queue.submit("ops_report_md", generate)
+        self.assertIn(self.queue.get(job_id)["status"], ("queued", "running"))
+
+        release.set()
+        job = wait_for(self.queue, job_id)
+        self.assertEqual(job["status"], "done")
+        self.assertEqual(job["result"], "Report ready")
+        self.assertEqual(job["partial_text"], "Report ")
+
+    def test_ai_failures_keep_their_public_code_and_message(self):
+        def generate(job):
+            raise AIServiceUnavailable(code="AI_TIMEOUT", user_message="Please retry.", last_error="secret")
+
+        job = wait_for(self.queue, self.queue.submit("report", generate))
+
+        self.assertEqual(job["status"], "failed")
+        self.assertEqual(job["error_code"], "AI_TIMEOUT")
+        self.assertEqual(job["error_message"], "Please retry.")
+        self.assertIsNone(job["result"])
+
+    def test_queued_job_can_be_cancelled_before_it_runs(self):
+        release = threading.Event()
+        ran = []
+        blocker = self.queue.submit("first", lambda job: release.wait(5) and "first")
+        queued = self.queue.submit("second", lambda job: ran.append(1) or "second")
+
+        self.assertTrue(self.queue.cancel(queued))
+        release.set()
+        wait_for(self.queue, blocker)
+
+        self.assertEqual(self.queue.get(queued)["status"], "cancelled")
+        self.assertEqual(ran, [])
+
+    def test_running_job_stops_at_its_next_chunk_after_cancel(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def generate(job):
+            job.append_partial("partial")
+            started.set()
+            release.wait(5)
+            job.append_partial(" more")
+            return "never stored"
+
+        job_id = self.queue.submit("report", generate)
+        started.wait(5)
+        self.assertTrue(self.queue.cancel(job_id))
+        release.set()
+
+        job = wait_for(self.queue, job_id)
+        self.assertEqual(job["status"], "cancelled")
+        self.assertIsNone(job["result"])
+        self.assertFalse(self.queue.cancel(job_id))
+
+    def test_running_job_can_poll_for_cancellation(self):
+        started = threading.Event()
+        release = threading.Event()
+        seen = []
+
+        def generate(job):
+            started.set()
+            release.wait(5)
+            seen.append(job.cancelled)
+            return "dropped"
+
+        job_id = self.queue.submit("report", generate)
+        started.wait(5)
+        self.queue.cancel(job_id)
+        release.set()
+
+        self.assertEqual(wait_for(self.queue, job_id)["status"], "cancelled")
+        self.assertEqual(seen, [True])
+
+    def test_pool_size_caps_concurrent_jobs(self):
+        queue = AIJobQueue(max_workers=2)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def generate(job):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+            return "ok"
+
+        job_ids = [queue.submit("report", generate) for _ in range(6)]
+        for job_id in job_ids:
+            wait_for(queue, job_id)
+        queue.shutdown()
+
+        self.assertLessEqual(max(peak), 2)
+        self.assertEqual(queue.stats()["done"], 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from ai_cache import AIResponseCache
+from ai_load_driver import run_load_test
+from ai_reliability import HedgePolicy
+from fake_ai_provider import FakeAIClient, FakeModelProfile, constant_latency
+
+
+class AILoadDriverTests(unittest.TestCase):
+    def test_reports_throughput_tail_latency_and_outcomes(self):
+        client = FakeAIClient(default=FakeModelProfile(latency=constant_latency(0.02), failure_rate=0.2), seed=4)
+
+        report = run_load_test(client.models.generate_content, ["a", "b"], requests=40, concurrency=8)
+
+        self.assertEqual(report["requests"], 40)
+        self.assertEqual(report["succeeded"] + report["failed"], 40)
+        self.assertEqual(sum(report["outcomes"].values()), 40)
+        self.assertGreater(report["throughput_rps"], 0)
+        self.assertLessEqual(report["p50_latency_seconds"], report["p99_latency_seconds"])
+        self.assertLessEqual(report["p99_latency_seconds"], report["max_latency_seconds"])
+
+    def test_concurrency_shortens_wall_time(self):
+        client = FakeAIClient(default=FakeModelProfile(latency=constant_latency(0.05)))
+
+        serial = run_load_test(client.models.generate_content, ["a"], requests=8, concurrency=1)
+        parallel = run_load_test(client.models.generate_content, ["a"], requests=8, concurrency=8)
+
+        self.assertLess(parallel["wall_seconds"], serial["wall_seconds"] / 2)
+
+    def test_hedging_cuts_the_tail_of_a_slow_model(self):
+        client = FakeAIClient({
+            "slow": FakeModelProfile(latency=constant_latency(0.5)),
+            "fast": FakeModelProfile(latency=constant_latency(0.01)),
+        })
+
+        report = run_load_test(
+            client.models.generate_content, ["slow", "fast"], requests=4, concurrency=4,
+            hedge=HedgePolicy(default_delay=0.05, min_delay=0.01),
+        )
+
+        self.assertEqual(report["succeeded"], 4)
+        self.assertLess(report["max_latency_seconds"], 0.4)
+
+    def test_cache_absorbs_repeated_prompts(self):
+        client = FakeAIClient()
+
+        report = run_load_test(
+            client.models.generate_content, ["a"], prompts=["one", "two"], requests=20, concurrency=1,
+            cache=AIResponseCache(),
+        )
+
+        self.assertEqual(client.models.calls["a"], 2)
+        self.assertEqual(report["cache"]["memory_hits"], 18)
+
+    def test_invalid_arguments_are_rejected(self):
+        with self.assertRaises(ValueError):
+            run_load_test(lambda **_: None, ["a"], requests=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,18 @@
 import ast
+import threading
+import time
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
 
-from ai_reliability import AIServiceUnavailable, request_ai_text
+from ai_reliability import (
+    AIServiceUnavailable,
+    HedgePolicy,
+    ModelHealthRegistry,
+    ProviderCallLimit,
+    request_ai_text,
+    stream_ai_text,
+)
 
 
 class AIRequestReliabilityTests(unittest.TestCase):
@@ -88,5 +97,489 @@ class AIRequestReliabilityTests(unittest.TestCase):
         self.assertIn(secret_detail, raised.exception.last_error)
 
 
+class AIStreamingTests(unittest.TestCase):
+    @staticmethod
+    def _chunks(*texts):
+        return [SimpleNamespace(text=text) for text in texts]
+
+    def test_yields_chunks_as_they_arrive(self):
+        calls = []
+
+        def generate_content_stream(**kwargs):
+            calls.append(kwargs["model"])
+            return iter(self._chunks("# Report", "", "\nbody"))
+
+        chunks = list(stream_ai_text(generate_content_stream, ["model-a", "model-b"], "prompt", object()))
+
+        self.assertEqual(chunks, ["# Report", "\nbody"])
+        self.assertEqual(calls, ["model-a"])
+
+    def test_empty_or_failed_stream_falls_back_before_first_chunk(self):
+        streams = iter([
+            lambda: iter(self._chunks("", "   ")),
+            lambda: (_ for _ in ()).throw(RuntimeError("503")),
+            lambda: iter(self._chunks("report")),
+        ])
+
+        chunks = list(stream_ai_text(
+            lambda **_: next(streams)(),
+            ["one", "two", "three"],
+            "prompt",
+            object(),
+        ))
+
+        self.assertEqual(chunks, ["report"])
+
+    def test_stream_respects_bounded_attempts_and_timeout_code(self):
+        calls = []
+
+        def generate_content_stream(**kwargs):
+            calls.append(kwargs["model"])
+            raise TimeoutError("deadline exceeded")
+
+        with self.assertRaises(AIServiceUnavailable) as raised:
+            list(stream_ai_text(generate_content_stream, ["one", "two", "three"], "prompt", object(), max_attempts=2))
+
+        self.assertEqual(calls, ["one", "two"])
+        self.assertEqual(raised.exception.code, "AI_TIMEOUT")
+
+    def test_failure_mid_stream_keeps_partial_text_and_does_not_restart(self):
+        calls = []
+
+        def generate_content_stream(**kwargs):
+            calls.append(kwargs["model"])
+            yield SimpleNamespace(text="partial ")
+            raise ConnectionError("stream reset by provider-internal-host")
+
+        received = []
+        with self.assertRaises(AIServiceUnavailable) as raised:
+            for chunk in stream_ai_text(generate_content_stream, ["one", "two"], "prompt", object()):
+                received.append(chunk)
+
+        self.assertEqual(received, ["partial "])
+        self.assertEqual(calls, ["one"])
+        self.assertEqual(raised.exception.code, "AI_STREAM_INTERRUPTED")
+        self.assertNotIn("provider-internal-host", raised.exception.user_message)
+
+
+class AIHedgingTests(unittest.TestCase):
+    def test_slow_first_model_is_hedged_by_the_next(self):
+        release = threading.Event()
+        calls = []
+
+        def generate_content(**kwargs):
+            calls.append(kwargs["model"])
+            if kwargs["model"] == "slow":
+                release.wait(5)
+                return SimpleNamespace(text="late answer")
+            return SimpleNamespace(text="fast answer")
+
+        started = time.monotonic()
+        result = request_ai_text(
+            generate_content,
+            ["slow", "fast"],
+            "prompt",
+            object(),
+            max_attempts=2,
+            hedge=HedgePolicy(default_delay=0.05, min_delay=0.01),
+        )
+        release.set()
+
+        self.assertEqual(result, "fast answer")
+        self.assertEqual(calls, ["slow", "fast"])
+        self.assertLess(time.monotonic() - started, 2)
+
+    def test_hedging_never_exceeds_max_attempts(self):
+        calls = []
+        lock = threading.Lock()
+
+        def generate_content(**kwargs):
+            with lock:
+                calls.append(kwargs["model"])
+            time.sleep(0.1)
+            raise TimeoutError("request timed out")
+
+        with self.assertRaises(AIServiceUnavailable) as raised:
+            request_ai_text(
+                generate_content,
+                ["one", "two", "three", "four"],
+                "prompt",
+                object(),
+                max_attempts=2,
+                hedge=HedgePolicy(default_delay=0.01, min_delay=0.01),
+            )
+
+        self.assertEqual(sorted(calls), ["one", "two"])
+        self.assertEqual(raised.exception.code, "AI_TIMEOUT")
+
+    def test_fast_failure_starts_the_next_model_without_waiting(self):
+        responses = {"one": SimpleNamespace(text=""), "two": SimpleNamespace(text="report")}
+
+        started = time.monotonic()
+        result = request_ai_text(
+            lambda **kwargs: responses[kwargs["model"]],
+            ["one", "two"],
+            "prompt",
+            object(),
+            hedge=HedgePolicy(default_delay=5),
+        )
+
+        self.assertEqual(result, "report")
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_hedge_delay_tracks_the_latency_percentile(self):
+        policy = HedgePolicy(percentile=0.9, default_delay=8.0, min_delay=0.1, min_samples=10)
+        self.assertEqual(policy.delay(), 8.0)
+
+        for latency in range(1, 11):
+            policy.record(latency / 10)
+
+        self.assertAlmostEqual(policy.delay(), 1.0)
+
+    def test_stream_with_slow_first_chunk_is_hedged_by_the_next(self):
+        release = threading.Event()
+        closed = threading.Event()
+        calls = []
+        attempts = []
+
+        def generate_content_stream(**kwargs):
+            calls.append(kwargs["model"])
+            if kwargs["model"] == "slow":
+                try:
+                    release.wait(5)
+                    yield SimpleNamespace(text="late ")
+                    yield SimpleNamespace(text="answer")
+                finally:
+                    closed.set()
+            else:
+                yield SimpleNamespace(text="fast ")
+                yield SimpleNamespace(text="answer")
+
+        started = time.monotonic()
+        chunks = list(stream_ai_text(
+            generate_content_stream,
+            ["slow", "fast"],
+            "prompt",
+            object(),
+            max_attempts=2,
+            attempts=attempts,
+            hedge=HedgePolicy(default_delay=0.05, min_delay=0.01),
+        ))
+        release.set()
+
+        self.assertEqual(chunks, ["fast ", "answer"])
+        self.assertEqual(calls, ["slow", "fast"])
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual(
+            sorted((attempt["model"], attempt["outcome"]) for attempt in attempts),
+            [("fast", "OK"), ("slow", "HEDGE_ABANDONED")],
+        )
+        self.assertTrue(closed.wait(2), "the losing stream should be closed")
+
+    def test_hedged_stream_falls_back_and_keeps_interruption_semantics(self):
+        def generate_content_stream(**kwargs):
+            if kwargs["model"] == "empty":
+                yield SimpleNamespace(text="  ")
+                return
+            yield SimpleNamespace(text="partial ")
+            raise ConnectionError("stream reset")
+
+        received = []
+        with self.assertRaises(AIServiceUnavailable) as raised:
+            for chunk in stream_ai_text(
+                generate_content_stream,
+                ["empty", "partial", "unused"],
+                "prompt",
+                object(),
+                hedge=HedgePolicy(default_delay=5),
+            ):
+                received.append(chunk)
+
+        self.assertEqual(received, ["partial "])
+        self.assertEqual(raised.exception.code, "AI_STREAM_INTERRUPTED")
+
+
+class ModelHealthTests(unittest.TestCase):
+    def setUp(self):
+        self.now = 100.0
+        self.health = ModelHealthRegistry(failure_threshold=2, cooldown_seconds=30, clock=lambda: self.now)
+
+    def test_repeated_failures_open_the_circuit_and_demote_the_model(self):
+        calls = []
+
+        def generate_content(**kwargs):
+            calls.append(kwargs["model"])
+            if kwargs["model"] == "flaky":
+                raise TimeoutError("request timed out")
+            return SimpleNamespace(text="ok")
+
+        for _ in range(2):
+            request_ai_text(generate_content, ["flaky", "stable"], "prompt", object(), health=self.health)
+        calls.clear()
+        request_ai_text(generate_content, ["flaky", "stable"], "prompt", object(), health=self.health)
+
+        self.assertEqual(calls, ["stable"])
+        report = self.health.diagnostics()
+        self.assertEqual(report["flaky"]["state"], "open")
+        self.assertEqual(report["flaky"]["last_error_code"], "AI_TIMEOUT")
+        self.assertEqual(report["stable"]["success_rate"], 1.0)
+
+    def test_cooldown_allows_a_trial_that_closes_the_circuit(self):
+        for _ in range(2):
+            self.health.record_failure("model-a", "AI_EMPTY_RESPONSE", 1.0)
+        self.assertEqual(self.health.order(["model-a", "model-b"]), ["model-b", "model-a"])
+
+        self.now += 31
+        self.assertEqual(self.health.order(["model-a", "model-b"]), ["model-a", "model-b"])
+        self.assertEqual(self.health.diagnostics()["model-a"]["state"], "half_open")
+
+        self.health.record_success("model-a", 0.5)
+        self.assertEqual(self.health.diagnostics()["model-a"]["state"], "closed")
+
+    def test_half_open_model_gets_a_single_probe(self):
+        for _ in range(2):
+            self.health.record_failure("model-a", "AI_TIMEOUT", 1.0)
+        self.now += 31
+
+        self.assertEqual(self.health.order(["model-a", "model-b"]), ["model-a", "model-b"])
+        self.assertTrue(self.health.diagnostics()["model-a"]["probe_in_flight"])
+        # Concurrent requests keep treating the model as open while the probe is out.
+        self.assertEqual(self.health.order(["model-a", "model-b"]), ["model-b", "model-a"])
+
+        self.health.record_failure("model-a", "AI_TIMEOUT", 1.0)
+        self.assertEqual(self.health.diagnostics()["model-a"]["state"], "open")
+        self.now += 31
+        self.assertEqual(self.health.order(["model-a", "model-b"]), ["model-a", "model-b"])
+
+    def test_unused_probe_expires(self):
+        health = ModelHealthRegistry(
+            failure_threshold=1, cooldown_seconds=30, probe_timeout_seconds=5, clock=lambda: self.now
+        )
+        health.record_failure("model-a", "AI_TIMEOUT", 1.0)
+        self.now += 31
+        self.assertEqual(health.order(["model-a", "model-b"])[0], "model-a")
+        self.assertEqual(health.order(["model-a", "model-b"])[0], "model-b")
+
+        self.now += 6
+        self.assertEqual(health.order(["model-a", "model-b"])[0], "model-a")
+
+    def test_open_models_are_still_tried_when_every_model_is_open(self):
+        for model_name in ("one", "two"):
+            for _ in range(2):
+                self.health.record_failure(model_name, "AI_UNAVAILABLE", 1.0)
+
+        result = request_ai_text(
+            lambda **_: SimpleNamespace(text="recovered"),
+            ["one", "two"],
+            "prompt",
+            object(),
+            health=self.health,
+        )
+
+        self.assertEqual(result, "recovered")
+
+    def test_latency_ewma_and_stream_outcomes_are_recorded(self):
+        self.health.record_success("model-a", 1.0)
+        self.health.record_success("model-a", 2.0)
+        self.assertAlmostEqual(self.health.diagnostics()["model-a"]["latency_ewma_seconds"], 1.2)
+
+        list(stream_ai_text(
+            lambda **_: iter([SimpleNamespace(text="chunk")]),
+            ["model-b"],
+            "prompt",
+            object(),
+            health=self.health,
+        ))
+        self.assertEqual(self.health.diagnostics()["model-b"]["successes"], 1)
+
+
+class AIAttemptTraceTests(unittest.TestCase):
+    def test_each_attempt_is_traced_with_model_and_outcome(self):
+        responses = iter([SimpleNamespace(text=""), SimpleNamespace(text="report")])
+        attempts = []
+
+        request_ai_text(lambda **_: next(responses), ["model-a", "model-b"], "prompt", object(), attempts=attempts)
+
+        self.assertEqual(
+            [(attempt["model"], attempt["outcome"]) for attempt in attempts],
+            [("model-a", "AI_EMPTY_RESPONSE"), ("model-b", "OK")],
+        )
+        self.assertTrue(all(attempt["latency_seconds"] >= 0 for attempt in attempts))
+
+    def test_abandoned_hedged_attempt_is_traced(self):
+        release = threading.Event()
+        attempts = []
+
+        def generate_content(**kwargs):
+            if kwargs["model"] == "slow":
+                release.wait(5)
+            return SimpleNamespace(text=kwargs["model"])
+
+        request_ai_text(
+            generate_content,
+            ["slow", "fast"],
+            "prompt",
+            object(),
+            max_attempts=2,
+            hedge=HedgePolicy(default_delay=0.05, min_delay=0.01),
+            attempts=attempts,
+        )
+        release.set()
+
+        self.assertEqual(
+            {attempt["model"]: attempt["outcome"] for attempt in attempts},
+            {"fast": "OK", "slow": "HEDGE_ABANDONED"},
+        )
+
+    def test_stream_failure_is_traced(self):
+        def generate_content_stream(**_):
+            raise TimeoutError("deadline exceeded")
+
+        attempts = []
+        with self.assertRaises(AIServiceUnavailable):
+            list(stream_ai_text(generate_content_stream, ["model-a"], "prompt", object(), attempts=attempts))
+
+        self.assertEqual(attempts[0]["outcome"], "AI_TIMEOUT")
+
+
+class ProviderCallLimitTests(unittest.TestCase):
+    def test_calls_beyond_the_limit_wait_for_a_slot(self):
+        limit = ProviderCallLimit(2)
+        lock = threading.Lock()
+        running = []
+        peak = []
+        release = threading.Event()
+
+        def generate_content(**_):
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            release.wait(2)
+            with lock:
+                running.pop()
+            return SimpleNamespace(text="ok")
+
+        gated = limit.wrap(generate_content)
+        threads = [threading.Thread(target=gated, kwargs={"model": "m"}) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for _ in range(200):
+            if limit.stats() == {"max_calls": 2, "active": 2, "waiting": 3}:
+                break
+            time.sleep(0.01)
+        self.assertEqual(limit.stats(), {"max_calls": 2, "active": 2, "waiting": 3})
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(max(peak), 2)
+        self.assertEqual(limit.stats()["active"], 0)
+
+    def test_stream_holds_its_slot_until_closed(self):
+        limit = ProviderCallLimit(1)
+        stream = limit.wrap_stream(lambda **_: iter([SimpleNamespace(text="a"), SimpleNamespace(text="b")]))
+
+        chunks = stream(model="m")
+        next(chunks)
+        self.assertEqual(limit.stats()["active"], 1)
+        chunks.close()
+        self.assertEqual(limit.stats()["active"], 0)
+
+    def test_hedged_attempts_share_the_limit(self):
+        limit = ProviderCallLimit(1)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def generate_content(model, **_):
+            with lock:
+                active.append(model)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(model)
+            return SimpleNamespace(text=f"answer from {model}")
+
+        request_ai_text(
+            generate_content,
+            ["slow", "fast"],
+            "prompt",
+            object(),
+            max_attempts=2,
+            hedge=HedgePolicy(default_delay=0.01, min_delay=0.01),
+            limit=limit,
+        )
+
+        self.assertEqual(max(peak), 1)
+
+    def test_hedge_queued_for_a_slot_is_skipped_once_the_request_finishes(self):
+        limit = ProviderCallLimit(1)
+        calls = []
+        attempts = []
+
+        def generate_content(model, **_):
+            calls.append(model)
+            time.sleep(0.2)
+            return SimpleNamespace(text=f"answer from {model}")
+
+        result = request_ai_text(
+            generate_content,
+            ["primary", "hedge"],
+            "prompt",
+            object(),
+            max_attempts=2,
+            hedge=HedgePolicy(default_delay=0.01, min_delay=0.01),
+            attempts=attempts,
+            limit=limit,
+        )
+        time.sleep(0.3)
+
+        self.assertEqual(result, "answer from primary")
+        self.assertEqual(calls, ["primary"])
+        self.assertEqual(limit.stats(), {"max_calls": 1, "active": 0, "waiting": 0})
+
+    def test_queued_stream_hedge_is_skipped_and_latency_excludes_the_wait(self):
+        limit = ProviderCallLimit(1)
+        calls = []
+        attempts = []
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold_the_only_slot():
+            limit.acquire()
+            held.set()
+            release.wait(2)
+            limit.release()
+
+        holder = threading.Thread(target=hold_the_only_slot)
+        holder.start()
+        held.wait(1)
+        threading.Timer(0.2, release.set).start()
+
+        def generate_content_stream(model, **_):
+            calls.append(model)
+            time.sleep(0.05)
+            yield SimpleNamespace(text=f"answer from {model}")
+
+        chunks = list(stream_ai_text(
+            generate_content_stream,
+            ["primary", "hedge"],
+            "prompt",
+            object(),
+            max_attempts=2,
+            attempts=attempts,
+            hedge=HedgePolicy(default_delay=0.1, min_delay=0.1),
+            limit=limit,
+        ))
+        holder.join()
+        time.sleep(0.2)
+
+        self.assertEqual(chunks, ["answer from primary"])
+        self.assertEqual(calls, ["primary"])
+        self.assertEqual([(attempt["model"], attempt["outcome"]) for attempt in attempts], [("primary", "OK")])
+        self.assertLess(attempts[0]["latency_seconds"], 0.15)
+        self.assertEqual(limit.stats()["active"], 0)
+
+
 if __name__ == "__main__":
     unittest.main()
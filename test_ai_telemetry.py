@@ -0,0 +1,153 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from ai_telemetry import AITelemetry, latency_percentile
+
+
+def attempt(model, latency, outcome="OK"):
+    return {"model": model, "latency_seconds": latency, "outcome": outcome}
+
+
+class AITelemetryTests(unittest.TestCase):
+    def test_record_captures_sizes_and_outcome(self):
+        telemetry = AITelemetry(clock=lambda: 1000.0)
+
+        entry = telemetry.record(
+            mode="finance",
+            attempts=[attempt("model-a", 2.0, "AI_TIMEOUT"), attempt("model-b", 1.5)],
+            latency_seconds=3.5,
+            prompt="x" * 400,
+            response_text="answer",
+            outcome="OK",
+            streamed=True,
+        )
+
+        self.assertEqual(entry["prompt_chars"], 400)
+        self.assertEqual(entry["prompt_tokens_estimate"], 100)
+        self.assertEqual(entry["response_chars"], 6)
+        self.assertEqual([item["model"] for item in entry["attempts"]], ["model-a", "model-b"])
+        self.assertEqual(telemetry.records(), [entry])
+
+    def test_ring_buffer_keeps_the_newest_records(self):
+        telemetry = AITelemetry(capacity=3)
+        for index in range(5):
+            telemetry.record("general", [], 0.1, f"prompt {index}", "", "OK")
+
+        self.assertEqual([entry["prompt_chars"] for entry in telemetry.records()], [8, 8, 8])
+        self.assertEqual(len(telemetry.records(limit=2)), 2)
+        self.assertIn('ai_calls_total{mode="general",outcome="OK"} 5', telemetry.prometheus_text())
+
+    def test_percentiles_per_model(self):
+        telemetry = AITelemetry()
+        for latency in range(1, 101):
+            telemetry.record("general", [attempt("model-a", latency / 100)], latency / 100, "p", "r", "OK")
+        telemetry.record(
+            "general",
+            [attempt("model-b", 9.0, "AI_TIMEOUT"), attempt("model-a", 0.5), attempt("model-c", 1.0, "HEDGE_ABANDONED")],
+            9.5,
+            "p",
+            "r",
+            "OK",
+        )
+
+        report = telemetry.model_latency_percentiles()
+
+        self.assertEqual(report["model-a"]["attempts"], 101)
+        self.assertAlmostEqual(report["model-a"]["p50_seconds"], 0.5)
+        self.assertAlmostEqual(report["model-a"]["p99_seconds"], 0.99)
+        self.assertEqual(report["model-b"]["failure_rate"], 1.0)
+        self.assertNotIn("model-c", report)
+
+    def test_jsonl_file_gets_one_line_per_call(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "ai_calls.jsonl")
+            telemetry = AITelemetry(path=path)
+            telemetry.record("operations", [attempt("model-a", 0.2)], 0.2, "p", "r", "OK")
+            telemetry.record("operations", [], 0.0, "p", "r", "OK", cached=True)
+
+            with open(path, encoding="utf-8") as handle:
+                lines = [json.loads(line) for line in handle]
+
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[1]["cached"])
+
+    def test_prometheus_file_is_rewritten_with_current_metrics(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "ai.prom")
+            telemetry = AITelemetry(path=path, file_format="prometheus", write_interval_seconds=0)
+            telemetry.record("finance", [attempt('model "a"', 0.25)], 0.25, "p", "r", "OK")
+            telemetry.record("finance", [], 0.0, "p", "", "AI_UNAVAILABLE")
+
+            with open(path, encoding="utf-8") as handle:
+                text = handle.read()
+
+        self.assertIn('ai_attempt_latency_seconds{model="model \\"a\\"",quantile="0.95"} 0.250000', text)
+        self.assertIn('ai_calls_total{mode="finance",outcome="AI_UNAVAILABLE"} 1', text)
+
+    def test_prometheus_rewrites_are_throttled_until_flush(self):
+        now = [1000.0]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "ai.prom")
+            telemetry = AITelemetry(path=path, file_format="prometheus", clock=lambda: now[0],
+                                    write_interval_seconds=15)
+
+            def total_in_file():
+                with open(path, encoding="utf-8") as handle:
+                    return [line for line in handle if line.startswith("ai_calls_total")][0].split()[-1]
+
+            telemetry.record("general", [], 0.0, "p", "r", "OK")
+            telemetry.record("general", [], 0.0, "p", "r", "OK")
+            self.assertEqual(total_in_file(), "1")
+            now[0] += 15
+            telemetry.record("general", [], 0.0, "p", "r", "OK")
+            self.assertEqual(total_in_file(), "3")
+            telemetry.record("general", [], 0.0, "p", "r", "OK")
+            telemetry.flush()
+            self.assertEqual(total_in_file(), "4")
+
+    def test_skipped_prometheus_rewrite_is_flushed_after_the_interval(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "ai.prom")
+            telemetry = AITelemetry(path=path, file_format="prometheus", write_interval_seconds=0.2)
+
+            def total_in_file():
+                with open(path, encoding="utf-8") as handle:
+                    return [line for line in handle if line.startswith("ai_calls_total")][0].split()[-1]
+
+            for _ in range(5):
+                telemetry.record("general", [attempt("model-a", 0.1)], 0.1, "p", "r", "OK")
+            self.assertEqual(total_in_file(), "1")
+            for _ in range(50):
+                if total_in_file() == "5":
+                    break
+                time.sleep(0.02)
+            self.assertEqual(total_in_file(), "5")
+
+    def test_prometheus_sum_and_count_survive_ring_buffer_eviction(self):
+        telemetry = AITelemetry(capacity=2)
+        for latency in (1.0, 2.0, 3.0):
+            telemetry.record("general", [attempt("model-a", latency)], latency, "p", "r", "OK")
+        telemetry.record("general", [attempt("model-a", 9.0, "HEDGE_ABANDONED")], 9.0, "p", "r", "OK")
+
+        text = telemetry.prometheus_text()
+
+        self.assertIn('ai_attempt_latency_seconds_sum{model="model-a"} 6.000000', text)
+        self.assertIn('ai_attempt_latency_seconds_count{model="model-a"} 3', text)
+        self.assertIn('ai_attempt_latency_seconds{model="model-a",quantile="0.5"} 3.000000', text)
+
+    def test_invalid_settings_are_rejected(self):
+        with self.assertRaises(ValueError):
+            AITelemetry(capacity=0)
+        with self.assertRaises(ValueError):
+            AITelemetry(file_format="csv")
+
+    def test_latency_percentile_uses_nearest_rank(self):
+        self.assertEqual(latency_percentile([1.0, 2.0, 3.0, 4.0], 0.5), 3.0)
+        self.assertEqual(latency_percentile([1.0], 0.99), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
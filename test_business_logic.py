@@ -1,7 +1,17 @@
 import copy
+import math
+import random
 import unittest
 
-from business_logic import calculate_open_store_feasibility, validate_pricing
+import numpy as np
+import pandas as pd
+
+from business_logic import (
+    calculate_open_store_feasibility,
+    calculate_open_store_feasibility_batch,
+    validate_pricing,
+    validate_pricing_catalog,
+)
 
 
 PROFILE = {"budget": 80000}
@@ -38,6 +48,54 @@ class PricingValidationTests(unittest.TestCase):
         self.assertTrue(any("must be higher" in error for error in result["errors"]))
 
 
+class CatalogPricingTests(unittest.TestCase):
+    CATALOG = pd.DataFrame({
+        "SKU": ["Latte", "Drip Coffee", "Muffin", "Mug"],
+        "Cost": [1.75, 0.60, 1.20, 9.00],
+        "Price": [5.25, 2.50, 1.25, 8.00],
+        "Competitor_Price": [5.50, 2.75, 3.50, 12.00],
+        "Monthly_Units": [4000, 6000, 1500, 20],
+    })
+
+    def test_per_sku_results_match_single_product_validation(self):
+        result = validate_pricing_catalog(self.CATALOG)
+        for index, row in self.CATALOG.iterrows():
+            single = validate_pricing({
+                "cost": row["Cost"],
+                "planned_price": row["Price"],
+                "competitor_price": row["Competitor_Price"],
+            })
+            self.assertEqual(bool(result["sku_valid"][index]), single["valid"])
+            self.assertAlmostEqual(result["margin"][index], single["implied_margin"])
+            self.assertAlmostEqual(result["markup"][index], single["implied_markup"])
+        self.assertFalse(result["valid"])
+        self.assertTrue(any(error.startswith("Mug:") for error in result["errors"]))
+        self.assertTrue(any(warning.startswith("Muffin:") for warning in result["warnings"]))
+
+    def test_mix_weighted_margin_uses_valid_skus_and_units(self):
+        result = validate_pricing_catalog(self.CATALOG)
+        valid = self.CATALOG.iloc[:3]
+        revenue = (valid["Monthly_Units"] * valid["Price"]).sum()
+        profit = (valid["Monthly_Units"] * (valid["Price"] - valid["Cost"])).sum()
+        self.assertAlmostEqual(result["mix_weighted_margin"], profit / revenue)
+        self.assertEqual(result["valid_sku_count"], 3)
+
+    def test_missing_required_columns_are_reported(self):
+        with self.assertRaises(ValueError):
+            validate_pricing_catalog({"SKU": ["A"], "Cost": [1.0]})
+
+    def test_catalog_margin_replaces_implied_margin_in_feasibility(self):
+        pricing = {**PRICING, "mix_weighted_margin": 0.30}
+        result = calculate_open_store_feasibility(PROFILE, SITE, LAUNCH, pricing)
+        self.assertAlmostEqual(result["implied_margin_pct"], 30.0)
+        self.assertEqual(result["product_margin_source"], "catalog sales-mix")
+        self.assertTrue(any("catalog sales-mix margin" in warning for warning in result["input_warnings"]))
+
+        batch = calculate_open_store_feasibility_batch(_flat_scenario(PROFILE, SITE, LAUNCH, pricing))
+        self.assertEqual(batch["margin_score"][0], result["margin_score"])
+        self.assertEqual(batch["input_warning_count"][0], len(result["input_warnings"]))
+
+
 class FeasibilityTests(unittest.TestCase):
     def test_default_scenario_is_internally_consistent(self):
         result = calculate_open_store_feasibility(PROFILE, SITE, LAUNCH, PRICING)
@@ -65,5 +123,72 @@ class FeasibilityTests(unittest.TestCase):
         self.assertLessEqual(result["margin_score"], 55)
 
 
+def _flat_scenario(profile, site, launch, pricing):
+    return {**profile, **site, **launch, **pricing}
+
+
+def _random_scenarios(count, seed=7):
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        rows.append({
+            "budget": rng.choice([0, 40000, 80000, 150000]),
+            "funding_available": rng.choice([None, -5, 0, 30000, 80000, 200000]),
+            "startup_cost_estimate": rng.choice([-1, 0, 20000, 62000, 120000]),
+            "monthly_fixed_cost_estimate": rng.choice([0, 5000, 26500, 60000]),
+            "expected_monthly_revenue": rng.choice([0, 15000, 52000, 140000]),
+            "expected_gross_margin": rng.choice([0, 15, 40, 62, 90, 100, "bad"]),
+            "cash_target_months": rng.choice([None, 0, 3, 6, 12]),
+            "traffic": rng.choice([0, 24999.9, 25000, 39999, 40000, 55000]),
+            "competitors": rng.choice([0, 6, 7, 12, 13, 20, 21, 40]),
+            "rent_level": rng.choice(["Low", "Medium", "High", None]),
+            "parking": rng.choice(["Low", "Medium", "High"]),
+            "cost": rng.choice([0, 0.5, 1.75, 4.5, 6, 100]),
+            "planned_price": rng.choice([0, 1.0, 5.25, 6, 12]),
+            "competitor_price": rng.choice([0, 2.0, 5.5, 20]),
+            "mix_weighted_margin": rng.choice([None, None, 0.3, 0.7]),
+        })
+    return rows
+
+
+class FeasibilityBatchTests(unittest.TestCase):
+    def _assert_row_matches(self, batch, index, expected):
+        for key, value in batch.items():
+            if key in ("input_error_count", "input_warning_count"):
+                continue
+            actual = batch[key][index]
+            if isinstance(expected[key], float) and math.isinf(expected[key]):
+                self.assertTrue(math.isinf(actual), key)
+            else:
+                self.assertEqual(actual, expected[key], key)
+        self.assertEqual(batch["input_error_count"][index], len(expected["input_errors"]))
+        self.assertEqual(batch["input_warning_count"][index], len(expected["input_warnings"]))
+
+    def test_batch_matches_scalar_row_for_row(self):
+        rows = _random_scenarios(400)
+        batch = calculate_open_store_feasibility_batch(pd.DataFrame(rows))
+        for index, row in enumerate(rows):
+            expected = calculate_open_store_feasibility(row, row, row, row)
+            self._assert_row_matches(batch, index, expected)
+        self.assertIn("REVIEW INPUTS", set(batch["decision"]))
+        self.assertGreater(len(set(batch["decision"])), 2)
+
+    def test_scalar_columns_broadcast_across_array_columns(self):
+        base = _flat_scenario(PROFILE, SITE, LAUNCH, PRICING)
+        revenues = np.linspace(20000, 90000, 8)
+        batch = calculate_open_store_feasibility_batch({**base, "expected_monthly_revenue": revenues})
+        self.assertEqual(len(batch["overall_score"]), 8)
+        for index, revenue in enumerate(revenues):
+            launch = {**LAUNCH, "expected_monthly_revenue": revenue}
+            expected = calculate_open_store_feasibility(PROFILE, SITE, launch, PRICING)
+            self._assert_row_matches(batch, index, expected)
+
+    def test_missing_columns_use_scalar_defaults(self):
+        batch = calculate_open_store_feasibility_batch({"budget": [50000.0]})
+        expected = calculate_open_store_feasibility({"budget": 50000.0}, {}, {}, {})
+        self._assert_row_matches(batch, 0, expected)
+        self.assertEqual(batch["decision"][0], "REVIEW INPUTS")
+
+
 if __name__ == "__main__":
     unittest.main()
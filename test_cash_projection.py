@@ -0,0 +1,75 @@
+import unittest
+
+import numpy as np
+
+from cash_projection import (
+    project_cash_flow_batch,
+    project_open_store_cash,
+    revenue_ramp,
+    summarize_cash_projection,
+)
+from test_business_logic import LAUNCH, PROFILE
+
+
+LEGACY_DETAIL = {
+    "buildout_cost": 22000.0,
+    "licenses_deposits": 8000.0,
+    "equipment_cost": 12000.0,
+    "initial_inventory_budget": 15000.0,
+    "launch_marketing_budget": 5000.0,
+}
+
+
+class CashProjectionTests(unittest.TestCase):
+    def test_flat_projection_matches_simple_runway(self):
+        launch = {**LAUNCH, "expected_monthly_revenue": 1.0}
+        projection = project_cash_flow_batch({**PROFILE, **launch}, months=24, ramp_months=1)
+        remaining = LAUNCH["funding_available"] - LAUNCH["startup_cost_estimate"]
+        burn = LAUNCH["monthly_fixed_cost_estimate"] - 0.62
+        expected_cash_out = int(np.floor(remaining / burn)) + 1
+        self.assertEqual(projection["cash_out_month"][0], expected_cash_out)
+
+    def test_startup_cost_is_phased_in_from_legacy_fields(self):
+        projection = project_cash_flow_batch({**PROFILE, **LAUNCH, **LEGACY_DETAIL}, buildout_months=2)
+        outflow = projection["startup_outflow"][0]
+        self.assertAlmostEqual(outflow.sum(), LAUNCH["startup_cost_estimate"])
+        self.assertAlmostEqual(outflow[1], LEGACY_DETAIL["buildout_cost"] / 2)
+        self.assertEqual(outflow[2:].sum(), 0.0)
+
+    def test_ramp_and_seasonality_shape_revenue(self):
+        ramp = revenue_ramp(12, 6, 0.5)
+        self.assertAlmostEqual(ramp[0], 0.5)
+        self.assertTrue(np.all(ramp[5:] == 1.0))
+
+        seasonality = [0.8] * 6 + [1.2] * 6
+        projection = project_cash_flow_batch(
+            {**PROFILE, **LAUNCH}, months=24, ramp_months=1, seasonality=seasonality, start_month=7
+        )
+        revenue = projection["revenue"][0]
+        self.assertAlmostEqual(revenue[0], LAUNCH["expected_monthly_revenue"] * 1.2)
+        self.assertAlmostEqual(revenue[6], LAUNCH["expected_monthly_revenue"] * 0.8)
+
+    def test_many_scenarios_project_together(self):
+        revenues = np.linspace(20000, 120000, 500)
+        projection = project_cash_flow_batch({**PROFILE, **LAUNCH, "expected_monthly_revenue": revenues}, months=60)
+        self.assertEqual(projection["cash_balance"].shape, (500, 60))
+        self.assertTrue(np.all(np.diff(projection["ending_cash"]) >= 0))
+        self.assertGreater(projection["cash_out_month"][0], 0)
+        self.assertEqual(projection["cash_out_month"][-1], 0)
+
+    def test_single_scenario_summary_for_reports(self):
+        projection = project_open_store_cash(PROFILE, {**LAUNCH, **LEGACY_DETAIL})
+        summary = summarize_cash_projection(projection)
+        self.assertIn("36-month projection", summary)
+        self.assertIn("USD", summary)
+        self.assertNotIn("$", summary)
+
+    def test_rejects_invalid_horizon_and_seasonality(self):
+        with self.assertRaises(ValueError):
+            project_cash_flow_batch({**PROFILE, **LAUNCH}, months=0)
+        with self.assertRaises(ValueError):
+            project_cash_flow_batch({**PROFILE, **LAUNCH}, seasonality=[1.0] * 11)
+
+
+if __name__ == "__main__":
+    unittest.main()
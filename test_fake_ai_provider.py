@@ -0,0 +1,79 @@
+import unittest
+
+from ai_reliability import AIServiceUnavailable, request_ai_text, stream_ai_text
+from fake_ai_provider import (
+    FakeAIClient,
+    FakeModelProfile,
+    constant_latency,
+    lognormal_latency,
+    uniform_latency,
+)
+
+
+class FakeAIProviderTests(unittest.TestCase):
+    def setUp(self):
+        self.slept = []
+
+    def client(self, profiles=None, default=None, seed=0):
+        return FakeAIClient(profiles, default, seed=seed, sleep=self.slept.append)
+
+    def test_generate_content_matches_the_client_surface(self):
+        client = self.client(default=FakeModelProfile(latency=constant_latency(1.5), response_chars=300))
+
+        text = request_ai_text(client.models.generate_content, ["model-a"], "prompt", object())
+
+        self.assertEqual(len(text), 300)
+        self.assertIn("model-a", text)
+        self.assertEqual(self.slept, [1.5])
+        self.assertEqual(client.models.calls["model-a"], 1)
+
+    def test_injected_timeouts_failures_and_empty_responses(self):
+        client = self.client({
+            "slow": FakeModelProfile(timeout_rate=1.0, timeout_seconds=30),
+            "broken": FakeModelProfile(failure_rate=1.0),
+            "blank": FakeModelProfile(empty_rate=1.0),
+        })
+
+        with self.assertRaises(AIServiceUnavailable) as raised:
+            request_ai_text(client.models.generate_content, ["slow", "broken", "blank"], "p", None, max_attempts=3)
+
+        self.assertEqual(raised.exception.code, "AI_TIMEOUT")
+        self.assertEqual(self.slept[0], 30)
+        self.assertEqual(dict(client.models.calls), {"slow": 1, "broken": 1, "blank": 1})
+
+    def test_rates_are_roughly_honoured_and_seeded(self):
+        outcomes = []
+        for seed in (1, 1):
+            client = self.client(default=FakeModelProfile(failure_rate=0.3, empty_rate=0.2), seed=seed)
+            results = []
+            for _ in range(1000):
+                try:
+                    results.append(bool(client.models.generate_content(model="m", contents="p").text))
+                except RuntimeError:
+                    results.append(None)
+            outcomes.append(results)
+
+        self.assertEqual(outcomes[0], outcomes[1])
+        self.assertAlmostEqual(outcomes[0].count(None) / 1000, 0.3, delta=0.05)
+        self.assertAlmostEqual(outcomes[0].count(False) / 1000, 0.2, delta=0.05)
+
+    def test_stream_yields_chunks_with_split_latency(self):
+        client = self.client(default=FakeModelProfile(latency=constant_latency(0.8), stream_chunks=4))
+
+        chunks = list(stream_ai_text(client.models.generate_content_stream, ["m"], "p", None))
+
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(self.slept, [0.2] * 4)
+
+    def test_latency_distributions(self):
+        import random
+
+        rng = random.Random(3)
+        draws = sorted(lognormal_latency(2.0, 0.5)(rng) for _ in range(2001))
+        self.assertAlmostEqual(draws[1000], 2.0, delta=0.2)
+        self.assertLessEqual(max(lognormal_latency(2.0, 2.0, cap=5.0)(rng) for _ in range(200)), 5.0)
+        self.assertTrue(all(1 <= uniform_latency(1, 2)(rng) <= 2 for _ in range(100)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import copy
+import threading
+import unittest
+
+from business_logic import calculate_open_store_feasibility
+from feasibility_cache import FeasibilityCache, feasibility_fingerprint
+from test_business_logic import LAUNCH, PRICING, PROFILE, SITE
+
+
+class FeasibilityCacheTests(unittest.TestCase):
+    def test_repeated_inputs_hit_the_cache(self):
+        cache = FeasibilityCache(maxsize=8)
+        first = cache.get_or_compute(PROFILE, SITE, LAUNCH, PRICING)
+        second = cache.get_or_compute(copy.deepcopy(PROFILE), dict(SITE), dict(LAUNCH), dict(PRICING))
+
+        self.assertEqual(first, second)
+        self.assertEqual(first, calculate_open_store_feasibility(PROFILE, SITE, LAUNCH, PRICING))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_fingerprint_ignores_unrelated_fields_and_equivalent_values(self):
+        base = feasibility_fingerprint(PROFILE, SITE, LAUNCH, PRICING)
+        noisy = feasibility_fingerprint(
+            {**PROFILE, "notes": "call landlord"},
+            {**SITE, "address": "elsewhere", "traffic": str(SITE["traffic"])},
+            {**LAUNCH, "cash_target_months": 3.0},
+            {**PRICING, "strategy": "Premium"},
+        )
+        changed = feasibility_fingerprint(PROFILE, {**SITE, "rent_level": "Low"}, LAUNCH, PRICING)
+
+        self.assertEqual(base, noisy)
+        self.assertNotEqual(base, changed)
+
+    def test_lru_eviction_is_bounded(self):
+        cache = FeasibilityCache(maxsize=2)
+        for revenue in (40000, 50000, 60000):
+            cache.get_or_compute(PROFILE, SITE, {**LAUNCH, "expected_monthly_revenue": revenue}, PRICING)
+        cache.get_or_compute(PROFILE, SITE, {**LAUNCH, "expected_monthly_revenue": 60000}, PRICING)
+        cache.get_or_compute(PROFILE, SITE, {**LAUNCH, "expected_monthly_revenue": 40000}, PRICING)
+
+        stats = cache.stats()
+        self.assertEqual(stats["size"], 2)
+        self.assertEqual(stats["evictions"], 2)
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 4)
+
+    def test_callers_cannot_mutate_cached_results(self):
+        cache = FeasibilityCache()
+        first = cache.get_or_compute(PROFILE, SITE, LAUNCH, PRICING)
+        first["risks"].append("mutated")
+        first["score_weights"]["site"] = 0
+        second = cache.get_or_compute(PROFILE, SITE, LAUNCH, PRICING)
+
+        self.assertNotIn("mutated", second["risks"])
+        self.assertEqual(second["score_weights"]["site"], 0.35)
+
+    def test_concurrent_sessions_share_one_entry(self):
+        cache = FeasibilityCache()
+        threads = [
+            threading.Thread(target=cache.get_or_compute, args=(PROFILE, SITE, LAUNCH, PRICING))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        self.assertEqual(stats["size"], 1)
+        self.assertEqual(stats["hits"] + stats["misses"], 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import random
+import unittest
+
+from business_logic import calculate_open_store_feasibility
+from feasibility_cache import FeasibilityCache
+from feasibility_graph import NODE_ORDER, FeasibilityGraph
+from test_business_logic import LAUNCH, PRICING, PROFILE, SITE
+
+
+class FeasibilityGraphTests(unittest.TestCase):
+    def test_first_update_computes_every_node(self):
+        graph = FeasibilityGraph()
+        result = graph.update(PROFILE, SITE, LAUNCH, PRICING)
+
+        self.assertEqual(result, calculate_open_store_feasibility(PROFILE, SITE, LAUNCH, PRICING))
+        self.assertEqual(graph.recomputed, NODE_ORDER)
+        self.assertEqual(graph.changed, NODE_ORDER)
+
+    def test_unchanged_inputs_recompute_nothing(self):
+        graph = FeasibilityGraph()
+        graph.update(PROFILE, SITE, LAUNCH, PRICING)
+        graph.update(PROFILE, {**SITE, "address": "elsewhere"}, LAUNCH, PRICING)
+
+        self.assertEqual(graph.recomputed, ())
+        self.assertEqual(graph.changed, ())
+
+    def test_rent_level_only_touches_site_and_downstream(self):
+        graph = FeasibilityGraph()
+        graph.update(PROFILE, SITE, LAUNCH, PRICING)
+        site = {**SITE, "rent_level": "Low"}
+        result = graph.update(PROFILE, site, LAUNCH, PRICING)
+
+        self.assertEqual(result, calculate_open_store_feasibility(PROFILE, site, LAUNCH, PRICING))
+        self.assertEqual(graph.recomputed, ("site", "aggregate", "risks"))
+        self.assertEqual(graph.changed, ("site", "aggregate", "risks"))
+
+    def test_unchanged_node_output_stops_propagation(self):
+        graph = FeasibilityGraph()
+        graph.update(PROFILE, SITE, LAUNCH, PRICING)
+        graph.update(PROFILE, {**SITE, "traffic": SITE["traffic"] + 1000}, LAUNCH, PRICING)
+
+        self.assertEqual(graph.recomputed, ("site",))
+        self.assertEqual(graph.changed, ())
+
+    def test_is_current_tracks_the_last_update(self):
+        graph = FeasibilityGraph()
+        self.assertFalse(graph.is_current(PROFILE, SITE, LAUNCH, PRICING))
+
+        graph.update(PROFILE, SITE, LAUNCH, PRICING)
+        self.assertTrue(graph.is_current(PROFILE, {**SITE, "address": "elsewhere"}, LAUNCH, PRICING))
+        self.assertFalse(graph.is_current(PROFILE, {**SITE, "rent_level": "Low"}, LAUNCH, PRICING))
+        self.assertEqual(graph.updates, 1)
+
+    def test_graph_computes_shared_cache_misses(self):
+        cache = FeasibilityCache(maxsize=8)
+        graph = FeasibilityGraph()
+        cache.get_or_compute(PROFILE, SITE, LAUNCH, PRICING, compute=graph.update)
+        site = {**SITE, "rent_level": "Low"}
+        result = cache.get_or_compute(PROFILE, site, LAUNCH, PRICING, compute=graph.update)
+
+        self.assertEqual(result, calculate_open_store_feasibility(PROFILE, site, LAUNCH, PRICING))
+        self.assertEqual(graph.recomputed, ("site", "aggregate", "risks"))
+        cache.get_or_compute(PROFILE, site, LAUNCH, PRICING, compute=graph.update)
+        self.assertEqual(graph.updates, 2)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_random_edit_sequence_matches_full_calculation(self):
+        rng = random.Random(9)
+        graph = FeasibilityGraph()
+        profile, site, launch, pricing = dict(PROFILE), dict(SITE), dict(LAUNCH), dict(PRICING)
+        edits = [
+            (site, "traffic", lambda: rng.choice([12000, 28000, 45000])),
+            (site, "competitors", lambda: rng.randint(0, 25)),
+            (site, "rent_level", lambda: rng.choice(["Low", "Medium", "High"])),
+            (launch, "expected_monthly_revenue", lambda: rng.uniform(10000, 90000)),
+            (launch, "funding_available", lambda: rng.uniform(40000, 150000)),
+            (pricing, "planned_price", lambda: rng.uniform(1.0, 9.0)),
+        ]
+        for _ in range(60):
+            section, field, value = rng.choice(edits)
+            section[field] = value()
+            self.assertEqual(
+                graph.update(profile, site, launch, pricing),
+                calculate_open_store_feasibility(profile, site, launch, pricing),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import dataclasses
+import unittest
+
+import numpy as np
+
+from business_logic import calculate_open_store_feasibility, calculate_open_store_feasibility_batch
+from feasibility_result import (
+    FeasibilityResult,
+    FeasibilityResultTable,
+    calculate_open_store_feasibility_result,
+    measure_result_memory,
+)
+from test_business_logic import LAUNCH, PRICING, PROFILE, SITE
+
+
+class FeasibilityResultTests(unittest.TestCase):
+    def test_to_dict_round_trips_the_scalar_result(self):
+        expected = calculate_open_store_feasibility(PROFILE, SITE, LAUNCH, PRICING)
+        result = calculate_open_store_feasibility_result(PROFILE, SITE, LAUNCH, PRICING)
+
+        self.assertEqual(result.to_dict(), expected)
+        self.assertIsInstance(result.risks, tuple)
+        self.assertFalse(hasattr(result, "__dict__"))
+
+    def test_from_dict_round_trips_through_to_dict(self):
+        expected = calculate_open_store_feasibility(PROFILE, SITE, LAUNCH, PRICING)
+        result = FeasibilityResult.from_dict(expected)
+
+        self.assertEqual(result.to_dict(), expected)
+        self.assertEqual(FeasibilityResult.from_dict(result.to_dict()), result)
+
+    def test_result_is_immutable(self):
+        result = calculate_open_store_feasibility_result(PROFILE, SITE, LAUNCH, PRICING)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            result.overall_score = 100
+
+    def test_table_matches_the_batch_engine(self):
+        columns = {
+            **PROFILE, **SITE, **LAUNCH, **PRICING,
+            "planned_price": np.array([1.5, 4.0, 5.25, 7.0]),
+            "competitors": np.array([3, 12, 18, 25]),
+        }
+        batch = calculate_open_store_feasibility_batch(columns)
+        table = FeasibilityResultTable.from_columns(columns)
+
+        self.assertEqual(len(table), 4)
+        self.assertEqual(table.column("overall_score").dtype, np.int8)
+        for name, values in table.to_dict().items():
+            np.testing.assert_array_equal(values, batch[name], err_msg=name)
+        self.assertEqual(table.row(0)["decision"], "REVIEW INPUTS")
+
+        go_or_caution = table.select(table.column("decision") != "REVIEW INPUTS")
+        self.assertEqual(len(go_or_caution), 3)
+        np.testing.assert_array_equal(go_or_caution.column("recommended_price"), [4.0, 5.25, 7.0])
+
+    def test_compact_forms_use_less_memory_than_dicts(self):
+        stats = measure_result_memory(PROFILE, SITE, LAUNCH, PRICING, count=500)
+
+        self.assertLess(stats["slotted_bytes_per_result"], stats["dict_bytes_per_result"])
+        self.assertLess(stats["table_bytes_per_result"], stats["slotted_bytes_per_result"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import os
+import tempfile
+import time
+import unittest
+
+from gazetteer import Gazetteer, gazetteer_tokens
+
+
+ENTRIES = [
+    ("1011 S Congress Ave, Austin, TX 78704", 30.2516, -97.7499),
+    ("1200 S Congress Ave, Austin, TX 78704", 30.2490, -97.7500),
+    ("Austin, Texas", 30.2672, -97.7431),
+    ("78704", 30.2430, -97.7650),
+    ("Watervliet, New York", 42.7301, -73.7012, "12189"),
+]
+
+
+class GazetteerTests(unittest.TestCase):
+    def setUp(self):
+        self.gazetteer = Gazetteer(ENTRIES)
+
+    def names(self, query, limit=6):
+        return [result["display_name"] for result in self.gazetteer.search(query, limit)]
+
+    def test_exact_address_comes_first_with_provider_shaped_results(self):
+        results = self.gazetteer.search("1011 S Congress Ave, Austin, TX 78704", limit=3)
+
+        self.assertEqual(results[0], {"display_name": ENTRIES[0][0], "lat": 30.2516, "lon": -97.7499})
+        self.assertEqual(len(results), 1)
+
+    def test_spelled_out_words_typos_and_prefixes_match(self):
+        for query in (
+            "1011 south congress avenue, austin texas usa",
+            "1011 S Congres Ave Austin",
+            "1011 S Cong",
+        ):
+            with self.subTest(query=query):
+                self.assertEqual(self.names(query)[0], ENTRIES[0][0])
+
+    def test_house_numbers_and_zip_codes_must_match_exactly(self):
+        self.assertEqual(self.names("1012 S Congress Ave Austin TX"), [])
+        self.assertEqual(self.names("12189"), ["Watervliet, New York"])
+
+    def test_places_rank_before_longer_entries_containing_them(self):
+        self.assertEqual(self.names("Austin", limit=2), ["Austin, Texas", ENTRIES[0][0]])
+        self.assertEqual(self.names("78704")[0], "78704")
+
+    def test_unknown_places_return_nothing(self):
+        self.assertEqual(self.names("Springfield, Illinois"), [])
+        self.assertEqual(self.names(""), [])
+
+    def test_wrong_city_or_state_is_not_a_full_match(self):
+        gazetteer = Gazetteer(ENTRIES + [
+            ("500 Oak Ave, Austin, TX", 30.26, -97.74),
+            ("123 Main St, Springfield, MO", 37.21, -93.29),
+        ])
+
+        for query in ("Oak Ave Dallas TX", "123 Main St, Springfield, IL"):
+            with self.subTest(query=query):
+                self.assertEqual(gazetteer.search(query, partial=False), [])
+        # Partial matches are still available as a fallback when asked for.
+        self.assertEqual(gazetteer.search("Oak Ave Dallas TX")[0]["display_name"], "500 Oak Ave, Austin, TX")
+
+    def test_full_matches_allow_prefixes_and_typos(self):
+        for query in ("1011 S Congres Ave Austin", "1011 S Cong"):
+            with self.subTest(query=query):
+                self.assertEqual(self.gazetteer.search(query, partial=False)[0]["display_name"], ENTRIES[0][0])
+
+    def test_from_csv_accepts_alternate_headers_and_skips_bad_rows(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "places.csv")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write("Name,Latitude,Longitude,ZIP\n")
+                handle.write("South Congress,30.2516,-97.7499,78704\n")
+                handle.write("Broken,not-a-number,-97.0,\n")
+                handle.write("Off the map,120,-97.0,\n")
+            gazetteer = Gazetteer.from_csv(path)
+
+            self.assertEqual(len(gazetteer), 1)
+            self.assertEqual(gazetteer.search("78704")[0]["display_name"], "South Congress")
+
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write("place,x,y\n")
+            with self.assertRaises(ValueError):
+                Gazetteer.from_csv(path)
+
+    def test_lookups_stay_fast_on_a_large_index(self):
+        entries = [(f"{number} Main St, Austin, TX {70000 + number % 9000}", 30.0, -97.0) for number in range(20_000)]
+        gazetteer = Gazetteer(entries + ENTRIES)
+        gazetteer.search("warm up")
+
+        began = time.perf_counter()
+        for _ in range(100):
+            results = gazetteer.search("1011 S Congress Ave, Austin, TX 78704", limit=3)
+            gazetteer.search("Main St Austin", limit=3)
+        self.assertLess((time.perf_counter() - began) / 200, 0.01)
+        self.assertEqual(results[0]["display_name"], ENTRIES[0][0])
+
+    def test_tokens_are_normalized(self):
+        self.assertEqual(gazetteer_tokens("1011 South Congress Avenue, USA"), ["1011", "s", "congress", "ave"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+
+from geocode_queries import fuzzy_queries, normalize_query
+
+
+class GeocodeQueryTests(unittest.TestCase):
+    def test_normalize_collapses_whitespace(self):
+        self.assertEqual(normalize_query("  1011  S Congress\tAve "), "1011 S Congress Ave")
+        self.assertEqual(normalize_query(None), "")
+
+    def test_fuzzy_variants_are_ordered_and_unique(self):
+        self.assertEqual(
+            fuzzy_queries("1011 S Congress Ave, Austin, TX"),
+            [
+                "1011 S Congress Ave, Austin, TX",
+                "1011 S Congress Ave Austin TX",
+                "1011 S Congress Ave, Austin, TX USA",
+                "1011 S Congress Ave Austin TX USA",
+            ],
+        )
+        self.assertEqual(fuzzy_queries("   "), [])
+
+    def test_watervliet_gets_a_state(self):
+        self.assertIn("Watervliet NY", fuzzy_queries("Watervliet"))
+
+
+if __name__ == "__main__":
+    unittest.main()
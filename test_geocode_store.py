@@ -0,0 +1,105 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from geocode_store import GeocodeStore, geocode_query_key
+
+
+AUSTIN = [{"display_name": "1011 S Congress Ave, Austin, TX", "lat": 30.2516, "lon": -97.7499}]
+
+
+class GeocodeStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "geocode.sqlite3")
+        self.now = 1000.0
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def store(self, **kwargs):
+        return GeocodeStore(self.path, clock=lambda: self.now, **kwargs)
+
+    def test_query_key_ignores_case_and_spacing(self):
+        self.assertEqual(
+            geocode_query_key("1011 S  Congress Ave", 6),
+            geocode_query_key(" 1011 s congress ave ", 6),
+        )
+        self.assertNotEqual(geocode_query_key("Austin", 6), geocode_query_key("Austin", 3))
+
+    def test_results_survive_a_new_store_on_the_same_file(self):
+        self.store().put("austin|6", "", AUSTIN, {"provider": "nominatim"})
+
+        stored = self.store().get("austin|6")
+
+        self.assertEqual(stored["results"], AUSTIN)
+        self.assertEqual(stored["debug"], {"provider": "nominatim"})
+
+    def test_variants_are_stored_separately(self):
+        store = self.store()
+        store.put("austin|6", "nominatim:austin usa", AUSTIN)
+
+        self.assertIsNone(store.get("austin|6"))
+        self.assertEqual(store.get("austin|6", "nominatim:austin usa")["results"], AUSTIN)
+
+    def test_negative_entries_use_the_shorter_ttl(self):
+        store = self.store(ttl_seconds=1000, negative_ttl_seconds=10)
+        store.put("nowhere|6", "", [])
+        store.put("austin|6", "", AUSTIN)
+
+        self.assertEqual(store.get("nowhere|6")["results"], [])
+        self.now += 11
+        self.assertIsNone(store.get("nowhere|6"))
+        self.assertEqual(store.get("austin|6")["results"], AUSTIN)
+        self.now += 1000
+        self.assertIsNone(store.get("austin|6"))
+        self.assertEqual(store.stats()["negative_hits"], 1)
+
+    def test_max_entries_keeps_the_newest(self):
+        store = self.store(max_entries=2)
+        for index in range(4):
+            self.now += 1
+            store.put(f"q{index}|6", "", AUSTIN)
+
+        self.assertEqual(store.stats()["size"], 2)
+        self.assertIsNone(store.get("q0|6"))
+        self.assertIsNotNone(store.get("q3|6"))
+
+    def test_concurrent_writers_and_readers(self):
+        stores = [self.store() for _ in range(4)]
+        errors = []
+
+        def work(store, worker):
+            try:
+                for index in range(25):
+                    store.put(f"q{worker}-{index}|6", "", AUSTIN)
+                    self.assertIsNotNone(store.get(f"q{worker}-{index}|6"))
+            except Exception as error:  # surfaced below
+                errors.append(error)
+
+        threads = [threading.Thread(target=work, args=(store, worker)) for worker, store in enumerate(stores)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(stores[0].stats()["size"], 100)
+
+    def test_unreadable_database_behaves_like_a_miss(self):
+        store = self.store()
+        store.path = os.path.join(self.directory.name, "missing", "geocode.sqlite3")
+
+        self.assertIsNone(store.get("austin|6"))
+        store.put("austin|6", "", AUSTIN)
+
+    def test_invalid_settings_are_rejected(self):
+        with self.assertRaises(ValueError):
+            self.store(ttl_seconds=0)
+        with self.assertRaises(ValueError):
+            self.store(max_entries=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+import numpy as np
+
+from business_logic import calculate_open_store_feasibility, calculate_open_store_feasibility_batch
+from goal_seek import goal_seek_open_store, solve_minimum_input
+from test_business_logic import LAUNCH, PRICING, PROFILE, SITE
+
+
+STRONG_SITE = {**SITE, "rent_level": "Low", "competitors": 5, "traffic": 45000}
+
+
+def _flat(**overrides):
+    return {**PROFILE, **STRONG_SITE, **LAUNCH, **PRICING, **overrides}
+
+
+class GoalSeekTests(unittest.TestCase):
+    def test_minimum_funding_for_go_is_exact(self):
+        result = goal_seek_open_store(PROFILE, STRONG_SITE, LAUNCH, PRICING)["funding_available"]
+        self.assertTrue(result["reachable"])
+        self.assertEqual(result["method"], "closed_form")
+        self.assertEqual(result["decision"], "GO")
+
+        funding = result["value"]
+        at_minimum = calculate_open_store_feasibility(
+            PROFILE, STRONG_SITE, {**LAUNCH, "funding_available": funding}, PRICING
+        )
+        just_below = calculate_open_store_feasibility(
+            PROFILE, STRONG_SITE, {**LAUNCH, "funding_available": funding - 0.01}, PRICING
+        )
+        self.assertEqual(at_minimum["decision"], "GO")
+        self.assertNotEqual(just_below["decision"], "GO")
+
+    def test_solves_many_scenarios_in_one_call(self):
+        rng = np.random.default_rng(4)
+        size = 300
+        columns = _flat(
+            funding_available=rng.uniform(150000, 300000, size),
+            expected_monthly_revenue=rng.uniform(20000, 120000, size),
+            cost=rng.uniform(0.5, 3.0, size),
+        )
+        for variable in ("planned_price", "expected_monthly_revenue", "funding_available"):
+            solved = solve_minimum_input(columns, variable, target=70)
+            self.assertEqual(len(solved["value"]), size)
+            reachable = solved["reachable"]
+            self.assertTrue(reachable.any(), variable)
+
+            values = solved["value"][reachable]
+            trial = {
+                name: (value[reachable] if np.ndim(value) else value)
+                for name, value in columns.items()
+            }
+            trial[variable] = values
+            self.assertTrue(np.all(calculate_open_store_feasibility_batch(trial)["overall_score"] >= 70))
+            trial[variable] = values * (1 - 1e-6)
+            below = calculate_open_store_feasibility_batch(trial)
+            floor_hit = values <= 0.011
+            self.assertTrue(np.all((below["overall_score"] < 70) | floor_hit), variable)
+
+    def test_unreachable_targets_are_nan(self):
+        solved = solve_minimum_input(_flat(), "expected_monthly_revenue", target=99)
+        self.assertFalse(solved["reachable"][0])
+        self.assertTrue(np.isnan(solved["value"][0]))
+
+    def test_rejects_unsupported_inputs(self):
+        with self.assertRaises(ValueError):
+            solve_minimum_input(_flat(), "traffic")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from http_sessions import HostSessionPool, benchmark_connection_reuse
+
+
+class HostSessionPoolTests(unittest.TestCase):
+    def test_one_session_per_host_with_bounded_pool(self):
+        pool = HostSessionPool(pool_maxsize=3, headers={"User-Agent": "test-agent"})
+        try:
+            first = pool.session("https://nominatim.openstreetmap.org/search")
+            again = pool.session("https://Nominatim.OpenStreetMap.org/reverse")
+            other = pool.session("https://overpass-api.de/api/interpreter")
+
+            self.assertIs(first, again)
+            self.assertIsNot(first, other)
+            self.assertEqual(first.get_adapter("https://nominatim.openstreetmap.org")._pool_maxsize, 3)
+            self.assertEqual(first.headers["User-Agent"], "test-agent")
+            self.assertIn("gzip", first.headers["Accept-Encoding"])
+            self.assertEqual(pool.stats(), {"nominatim.openstreetmap.org": 2, "overpass-api.de": 1})
+        finally:
+            pool.close()
+
+    def test_timeouts_share_the_connect_limit(self):
+        pool = HostSessionPool(connect_timeout=4, read_timeout=10)
+
+        self.assertEqual(pool.timeout(), (4.0, 10.0))
+        self.assertEqual(pool.timeout(40), (4.0, 40.0))
+
+    def test_invalid_settings_are_rejected(self):
+        with self.assertRaises(ValueError):
+            HostSessionPool(pool_maxsize=0)
+        with self.assertRaises(ValueError):
+            HostSessionPool(connect_timeout=0)
+
+
+class ConnectionReuseBenchmarkTests(unittest.TestCase):
+    def test_pooled_requests_reuse_one_connection(self):
+        result = benchmark_connection_reuse(requests_count=10, connect_delay_seconds=0.02)
+
+        self.assertEqual(result["bare_connections"], 10)
+        self.assertEqual(result["pooled_connections"], 1)
+        self.assertLess(result["pooled_seconds"], result["bare_seconds"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import time
+import unittest
+
+from business_logic import calculate_open_store_feasibility
+from launch_simulation import simulate_open_store_feasibility, triangular_around
+from test_business_logic import LAUNCH, PRICING, PROFILE, SITE
+
+
+class LaunchSimulationTests(unittest.TestCase):
+    def test_fixed_inputs_reproduce_the_point_estimate(self):
+        point = calculate_open_store_feasibility(PROFILE, SITE, LAUNCH, PRICING)
+        sim = simulate_open_store_feasibility(PROFILE, SITE, LAUNCH, PRICING, {}, samples=10)
+        shares = {"GO": sim["p_go"], "CAUTION": sim["p_caution"], "NO-GO": sim["p_no_go"]}
+        self.assertEqual(shares[point["decision"]], 1.0)
+        self.assertAlmostEqual(sim["runway_percentiles"][50], point["runway_months"])
+        self.assertAlmostEqual(sim["funding_gap_mean"], point["funding_gap"])
+
+    def test_hundred_thousand_draws_finish_quickly_and_are_seeded(self):
+        distributions = {
+            "expected_monthly_revenue": triangular_around(52000, 30, min=0.0),
+            "expected_gross_margin": {"dist": "normal", "mean": 62, "std": 5, "min": 1, "max": 99},
+            "monthly_fixed_cost_estimate": {"dist": "uniform", "low": 20000, "high": 30000},
+            "funding_available": {"dist": "uniform", "low": 60000, "high": 200000},
+        }
+        started = time.perf_counter()
+        first = simulate_open_store_feasibility(PROFILE, SITE, LAUNCH, PRICING, distributions, seed=3)
+        elapsed = time.perf_counter() - started
+        second = simulate_open_store_feasibility(PROFILE, SITE, LAUNCH, PRICING, distributions, seed=3)
+
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(first, second)
+        total = first["p_go"] + first["p_caution"] + first["p_no_go"] + first["p_review_inputs"]
+        self.assertAlmostEqual(total, 1.0)
+        self.assertGreater(first["p_go"], 0.0)
+        percentiles = list(first["runway_percentiles"].values())
+        self.assertEqual(percentiles, sorted(percentiles))
+
+    def test_rejects_unknown_inputs_and_distributions(self):
+        with self.assertRaises(ValueError):
+            simulate_open_store_feasibility(PROFILE, SITE, LAUNCH, PRICING, {"rent_level": {"dist": "uniform"}})
+        with self.assertRaises(ValueError):
+            simulate_open_store_feasibility(
+                PROFILE, SITE, LAUNCH, PRICING, {"cost": {"dist": "lognormal", "mean": 1}}
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
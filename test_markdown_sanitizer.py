@@ -0,0 +1,107 @@
+import random
+import unittest
+
+from markdown_sanitizer import (
+    MarkdownStreamSanitizer,
+    benchmark_sanitizer,
+    clean_currency_for_markdown,
+    sample_report,
+    sanitize_ai_markdown_output,
+    sanitize_markdown,
+    sanitize_stream,
+)
+
+
+FRAGMENTS = [
+    "USD", "US", "D", "$", " ", "  ", "\n", "\t", "5", "-", "-5", "x", "U", "(", ",", "_",
+    "insolvency", "Insolvency", "INSOLVENCY", " crisis", " risk", " Crisis", " Risk",
+    "insolvent", "bankruptcy", "Bankruptcy", "1,200.50", "ſ",
+]
+
+
+def reference(text, clean_currency=False):
+    text = sanitize_ai_markdown_output(text)
+    return clean_currency_for_markdown(text) if clean_currency else text
+
+
+class SinglePassSanitizerTests(unittest.TestCase):
+    def test_matches_multi_pass_functions_on_known_cases(self):
+        cases = [
+            "Revenue $803,500 and ($86,300) loss.",
+            "USD  USD  USD  x and USD\n\n-5",
+            "$$5 $ $ x $USD 7",
+            "The Insolvency Crisis and insolvency risk; insolvent, not insolvencyx.",
+            "preinsolvency risk and xInsolvency Risk; Bankruptcy or bankruptcy.",
+            sample_report(5000),
+            "",
+        ]
+        for text in cases:
+            for clean_currency in (False, True):
+                with self.subTest(text=text[:40], clean_currency=clean_currency):
+                    self.assertEqual(sanitize_markdown(text, clean_currency), reference(text, clean_currency))
+
+    def test_matches_multi_pass_functions_on_random_text(self):
+        rng = random.Random(7)
+        for _ in range(3000):
+            text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 12)))
+            for clean_currency in (False, True):
+                self.assertEqual(
+                    sanitize_markdown(text, clean_currency),
+                    reference(text, clean_currency),
+                    repr(text),
+                )
+
+    def test_none_becomes_empty_string(self):
+        self.assertEqual(sanitize_markdown(None), "")
+
+
+class StreamSanitizerTests(unittest.TestCase):
+    def test_every_split_of_a_rewritten_phrase_matches_batch_output(self):
+        text = "Costs of $ 1,200 signal an insolvency risk; USD  USD  9 owed."
+        expected = reference(text, clean_currency=True)
+        for cut in range(len(text) + 1):
+            with self.subTest(cut=cut):
+                self.assertEqual(sanitize_stream([text[:cut], text[cut:]], clean_currency=True), expected)
+
+    def test_single_character_chunks_match_batch_output(self):
+        text = sample_report(3000)
+        for clean_currency in (False, True):
+            self.assertEqual(sanitize_stream(list(text), clean_currency), reference(text, clean_currency))
+
+    def test_random_chunking_matches_batch_output(self):
+        rng = random.Random(11)
+        for _ in range(1000):
+            text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 12)))
+            cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(0, 5))))
+            chunks = [text[start:end] for start, end in zip([0] + cuts, cuts + [len(text)])]
+            self.assertEqual(sanitize_stream(chunks, clean_currency=True), reference(text, True), repr(chunks))
+
+    def test_feed_holds_back_only_a_short_tail(self):
+        sanitizer = MarkdownStreamSanitizer()
+        shown = sanitizer.feed("Cash is fine. " * 20 + "The insolvency r")
+
+        self.assertTrue(shown.startswith("Cash is fine."))
+        self.assertNotIn("insolvency", shown)
+        self.assertEqual(shown + sanitizer.feed("isk is low.") + sanitizer.finish(),
+                         "Cash is fine. " * 20 + "The Critical Liquidity Risk is low.")
+
+    def test_finish_resets_for_reuse(self):
+        sanitizer = MarkdownStreamSanitizer()
+        sanitizer.feed("$5 insolv")
+        sanitizer.finish()
+
+        self.assertEqual(sanitizer.feed("$7") + sanitizer.finish(), "USD 7")
+
+
+class SanitizerBenchmarkTests(unittest.TestCase):
+    def test_benchmark_reports_timings_and_identical_output(self):
+        result = benchmark_sanitizer(size=20_000, chunk_size=64, rescan_size=2_000, repeat=1)
+
+        self.assertTrue(result["identical"])
+        self.assertEqual(result["characters"], 20_000)
+        for key in ("multi_pass_seconds", "single_pass_seconds", "streamed_seconds", "rescan_seconds"):
+            self.assertGreaterEqual(result[key], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
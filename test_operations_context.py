@@ -0,0 +1,78 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from operations_context import build_inventory_context
+from prompt_tokens import estimate_tokens
+
+
+def diagnosed_inventory(count, seed=16):
+    rng = np.random.default_rng(seed)
+    statuses = np.array(["Critical Stockout Risk", "Watchlist", "Healthy", "Overstock", "Dead / Overstock"])
+    stock = rng.integers(0, 500, count).astype(float)
+    cost = rng.uniform(0.5, 40.0, count).round(2)
+    order_qty = rng.integers(0, 200, count).astype(float)
+    return pd.DataFrame({
+        "Item": [f"SKU-{index:05d}" for index in range(count)],
+        "Category": rng.choice(["Beverage", "Bakery", "Dairy", "Dry Goods", "Supplies", "Frozen"], count),
+        "Stock": stock,
+        "Monthly_Sales": rng.integers(1, 300, count).astype(float),
+        "Cost": cost,
+        "Total_Value": stock * cost,
+        "Months_Of_Cover": rng.uniform(0.1, 9.0, count).round(2),
+        "Lead_Time_Days": 7.0,
+        "MOQ": 1.0,
+        "Shelf_Life_Days": rng.choice([7.0, 14.0, 365.0], count),
+        "Reorder_Point": 20.0,
+        "Suggested_Order_Qty": order_qty,
+        "Suggested_Order_Value": order_qty * cost,
+        "Status": rng.choice(statuses, count),
+        "Perishable_Risk": rng.choice(["", "", "Perishable Waste Risk"], count),
+        "Suggested_Action": "Maintain normal replenishment rule.",
+    })
+
+
+class InventoryContextTests(unittest.TestCase):
+    def test_small_inventory_is_listed_in_full(self):
+        df2 = diagnosed_inventory(12)
+        context = build_inventory_context(df2, "Total inventory value: USD 1,000.", token_budget=3000)
+
+        self.assertTrue(context["full_table"])
+        self.assertEqual(context["items_listed"], 12)
+        self.assertIn("SKU-00011", context["text"])
+        self.assertIn("Suggested_Action", context["text"])
+
+    def test_large_inventory_stays_within_budget_and_keeps_the_summary(self):
+        df2 = diagnosed_inventory(3000)
+        summary = "Total inventory value: USD 1,234,567; critical stockout-risk items: 600."
+        context = build_inventory_context(df2, summary, token_budget=3000)
+
+        self.assertFalse(context["full_table"])
+        self.assertTrue(context["within_budget"])
+        self.assertLessEqual(context["estimated_tokens"], 3000)
+        self.assertEqual(context["estimated_tokens"], estimate_tokens(context["text"]))
+        self.assertIn(summary, context["text"])
+        self.assertIn("aggregated by category", context["text"])
+        self.assertLess(context["items_listed"], 3000)
+
+    def test_highest_value_critical_item_is_always_listed_first(self):
+        df2 = diagnosed_inventory(3000)
+        critical = df2[df2["Status"].eq("Critical Stockout Risk")]
+        top_item = critical.sort_values("Suggested_Order_Value", ascending=False)["Item"].iloc[0]
+
+        context = build_inventory_context(df2, "summary", token_budget=3000)
+
+        self.assertIn(top_item, context["text"])
+
+    def test_prompt_size_is_flat_as_inventory_grows(self):
+        sizes = [
+            build_inventory_context(diagnosed_inventory(count), "summary", token_budget=2000)["estimated_tokens"]
+            for count in (500, 2000, 8000)
+        ]
+
+        self.assertTrue(all(size <= 2000 for size in sizes))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+import numpy as np
+
+from business_logic import calculate_open_store_feasibility
+from price_optimization import optimize_price
+from test_business_logic import LAUNCH, PRICING, PROFILE, SITE
+
+
+class PriceOptimizationTests(unittest.TestCase):
+    def test_profit_maximum_follows_the_markup_rule(self):
+        # With constant elasticity e < -1 the optimum is cost * e / (1 + e).
+        pricing = {**PRICING, "elasticity": "Medium"}
+        result = optimize_price(PROFILE, SITE, LAUNCH, pricing, points=2001)
+        expected = PRICING["cost"] * -1.5 / (1 - 1.5)
+        self.assertAlmostEqual(result["profit_max_price"], expected, delta=0.01)
+
+    def test_higher_sensitivity_lowers_the_optimal_price(self):
+        prices = [
+            optimize_price(PROFILE, SITE, LAUNCH, {**PRICING, "elasticity": label})["profit_max_price"]
+            for label in ("Low", "Medium", "High")
+        ]
+        self.assertEqual(prices, sorted(prices, reverse=True))
+
+    def test_grid_stays_around_competitor_price_and_above_cost(self):
+        result = optimize_price(PROFILE, SITE, LAUNCH, PRICING)
+        self.assertGreater(result["prices"].min(), PRICING["cost"])
+        self.assertGreaterEqual(result["prices"].min(), PRICING["competitor_price"] * 0.5)
+        self.assertLessEqual(result["prices"].max(), PRICING["competitor_price"] * 1.5 + 1e-9)
+        low, high = result["strategy_band"]
+        self.assertTrue(low <= result["strategy_best_price"] <= high)
+
+    def test_scores_match_the_scalar_calculation(self):
+        result = optimize_price(PROFILE, SITE, LAUNCH, PRICING, points=11)
+        for index in range(len(result["prices"])):
+            expected = calculate_open_store_feasibility(
+                PROFILE,
+                SITE,
+                {**LAUNCH, "expected_monthly_revenue": result["revenue"][index]},
+                {**PRICING, "planned_price": result["prices"][index]},
+            )
+            self.assertEqual(result["overall_score"][index], expected["overall_score"])
+        self.assertEqual(result["score_max_score"], int(np.max(result["overall_score"])))
+
+    def test_competitor_price_below_cost_anchors_the_sweep_on_cost(self):
+        pricing = {**PRICING, "cost": 1.75, "planned_price": 5.25, "competitor_price": 1.0}
+        result = optimize_price(PROFILE, SITE, LAUNCH, pricing)
+        self.assertTrue(result["anchored_on_cost"])
+        self.assertGreater(result["prices"].min(), 1.75)
+        self.assertAlmostEqual(result["sweep_range"][1], 1.75 * 1.5)
+
+    def test_inelastic_demand_flags_a_boundary_maximum(self):
+        low = optimize_price(PROFILE, SITE, LAUNCH, {**PRICING, "elasticity": "Low"})
+        self.assertTrue(low["profit_max_at_boundary"])
+        self.assertAlmostEqual(low["profit_max_price"], low["sweep_range"][1])
+        medium = optimize_price(PROFILE, SITE, LAUNCH, {**PRICING, "elasticity": "Medium"})
+        self.assertFalse(medium["profit_max_at_boundary"])
+
+    def test_rejects_unusable_anchor(self):
+        with self.assertRaises(ValueError):
+            optimize_price(PROFILE, SITE, LAUNCH, {**PRICING, "planned_price": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
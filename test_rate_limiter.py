@@ -0,0 +1,105 @@
+import threading
+import unittest
+from email.utils import formatdate
+
+from rate_limiter import HostRateLimiter, RateLimitExceeded, host_of, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class HostRateLimiterTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.limiter = HostRateLimiter(
+            {"nominatim.openstreetmap.org": (1.0, 1), "overpass-api.de": (2.0, 2)},
+            clock=self.clock,
+            sleep=self.clock.sleep,
+        )
+
+    def test_first_request_to_an_idle_host_does_not_wait(self):
+        self.assertEqual(self.limiter.acquire("nominatim.openstreetmap.org"), 0.0)
+        self.clock.now += 5
+        self.assertEqual(self.limiter.acquire("nominatim.openstreetmap.org"), 0.0)
+        self.assertEqual(self.clock.slept, [])
+
+    def test_back_to_back_requests_are_paced_to_the_policy(self):
+        waits = [self.limiter.acquire("nominatim.openstreetmap.org") for _ in range(3)]
+
+        self.assertEqual(waits, [0.0, 1.0, 1.0])
+
+    def test_burst_is_allowed_before_pacing(self):
+        waits = [self.limiter.acquire("overpass-api.de") for _ in range(3)]
+
+        self.assertEqual(waits, [0.0, 0.0, 0.5])
+
+    def test_hosts_are_independent(self):
+        self.limiter.acquire("nominatim.openstreetmap.org")
+
+        self.assertEqual(self.limiter.acquire("geocode.maps.co"), 0.0)
+
+    def test_concurrent_reservations_queue_up(self):
+        waits = []
+        lock = threading.Lock()
+
+        def reserve():
+            wait = self.limiter.reserve("nominatim.openstreetmap.org")
+            with lock:
+                waits.append(wait)
+
+        threads = [threading.Thread(target=reserve) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(waits), [0.0, 1.0, 2.0, 3.0])
+
+    def test_retry_after_blocks_the_host_and_paces_release(self):
+        self.limiter.defer("overpass-api.de", 30)
+
+        self.assertEqual(self.limiter.reserve("overpass-api.de"), 30.0)
+        self.assertEqual(self.limiter.reserve("overpass-api.de"), 30.5)
+        self.assertEqual(self.limiter.stats()["overpass-api.de"]["retry_after_events"], 1)
+
+    def test_max_wait_raises_without_reserving(self):
+        self.limiter.defer("nominatim.openstreetmap.org", 60)
+
+        with self.assertRaises(RateLimitExceeded) as raised:
+            self.limiter.acquire("nominatim.openstreetmap.org", max_wait=10)
+        self.assertEqual(raised.exception.host, "nominatim.openstreetmap.org")
+        self.assertEqual(self.limiter.stats()["nominatim.openstreetmap.org"]["requests"], 0)
+
+    def test_unknown_hosts_use_the_default_policy(self):
+        limiter = HostRateLimiter(default_policy=(4.0, 1), clock=self.clock, sleep=self.clock.sleep)
+
+        self.assertEqual([limiter.reserve("example.com") for _ in range(2)], [0.0, 0.25])
+
+    def test_invalid_policies_are_rejected(self):
+        with self.assertRaises(ValueError):
+            HostRateLimiter({"example.com": (0.0, 1)})
+
+
+class RetryAfterTests(unittest.TestCase):
+    def test_delta_seconds_and_http_dates(self):
+        self.assertEqual(parse_retry_after("7"), 7.0)
+        self.assertAlmostEqual(parse_retry_after(formatdate(1_000_030, usegmt=True), now=lambda: 1_000_000), 30.0)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+
+    def test_host_of(self):
+        self.assertEqual(host_of("https://Overpass-API.de/api/interpreter"), "overpass-api.de")
+
+
+if __name__ == "__main__":
+    unittest.main()
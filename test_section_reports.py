@@ -0,0 +1,126 @@
+import threading
+import time
+import unittest
+
+from ai_reliability import AIServiceUnavailable
+from section_reports import FAILED_SECTION_NOTICE, ReportCancelled, generate_report_sections, section_prompt
+
+
+HEADINGS = ("## 1) Snapshot", "## 2) Critical Stockout Risks", "## 3) Replenishment Rules")
+
+
+class SectionReportTests(unittest.TestCase):
+    def test_sections_are_assembled_in_heading_order(self):
+        delays = {HEADINGS[0]: 0.06, HEADINGS[1]: 0.0, HEADINGS[2]: 0.03}
+
+        def request_section(heading):
+            time.sleep(delays[heading])
+            return f"{heading}\nBody for {heading}."
+
+        result = generate_report_sections("# Report", HEADINGS, request_section)
+
+        self.assertEqual(result["failed_sections"], [])
+        positions = [result["markdown"].index(heading) for heading in HEADINGS]
+        self.assertEqual(positions, sorted(positions))
+        self.assertTrue(result["markdown"].startswith("# Report\n\n## 1) Snapshot"))
+
+    def test_sections_run_concurrently(self):
+        barrier = threading.Barrier(len(HEADINGS), timeout=2)
+
+        def request_section(heading):
+            barrier.wait()
+            return f"{heading}\nok"
+
+        started = time.monotonic()
+        result = generate_report_sections("# Report", HEADINGS, request_section, max_workers=len(HEADINGS))
+
+        self.assertEqual(result["failed_sections"], [])
+        self.assertLess(time.monotonic() - started, 2)
+
+    def test_failed_section_is_retried_then_replaced_by_notice(self):
+        calls = {heading: 0 for heading in HEADINGS}
+        lock = threading.Lock()
+
+        def request_section(heading):
+            with lock:
+                calls[heading] += 1
+                attempt = calls[heading]
+            if heading == HEADINGS[1] and attempt == 1:
+                raise RuntimeError("transient")
+            if heading == HEADINGS[2]:
+                raise RuntimeError("down")
+            return f"{heading}\nok"
+
+        result = generate_report_sections("# Report", HEADINGS, request_section, max_retries=1)
+
+        self.assertEqual(calls[HEADINGS[1]], 2)
+        self.assertEqual(calls[HEADINGS[2]], 2)
+        self.assertEqual(result["failed_sections"], [HEADINGS[2]])
+        self.assertIn(f"{HEADINGS[2]}\n{FAILED_SECTION_NOTICE}", result["markdown"])
+
+    def test_missing_heading_is_added_and_repeated_title_dropped(self):
+        result = generate_report_sections(
+            "# Report",
+            HEADINGS[:1],
+            lambda heading: "# Report\nJust the body.",
+        )
+
+        self.assertEqual(result["markdown"], "# Report\n\n## 1) Snapshot\nJust the body.\n")
+
+    def test_all_sections_failing_raises_service_error(self):
+        def request_section(heading):
+            raise AIServiceUnavailable(code="AI_TIMEOUT", user_message="timed out")
+
+        with self.assertRaises(AIServiceUnavailable) as caught:
+            generate_report_sections("# Report", HEADINGS, request_section)
+        self.assertEqual(caught.exception.code, "AI_TIMEOUT")
+
+    def test_progress_is_reported_in_heading_order(self):
+        delays = {HEADINGS[0]: 0.06, HEADINGS[1]: 0.0, HEADINGS[2]: 0.03}
+        progress = []
+
+        def request_section(heading):
+            time.sleep(delays[heading])
+            return f"{heading}\nok"
+
+        result = generate_report_sections("# Report", HEADINGS, request_section, on_progress=progress.append)
+
+        self.assertEqual(progress[0], "# Report\n\n")
+        self.assertEqual([chunk.split("\n")[0] for chunk in progress[1:]], list(HEADINGS))
+        self.assertEqual("".join(progress).strip(), result["markdown"].strip())
+
+    def test_cancellation_stops_queued_sections(self):
+        requested = []
+        stop = threading.Event()
+
+        def request_section(heading):
+            requested.append(heading)
+            stop.set()
+            return f"{heading}\nok"
+
+        with self.assertRaises(ReportCancelled):
+            generate_report_sections(
+                "# Report", HEADINGS, request_section, max_workers=1, cancelled=stop.is_set,
+            )
+        self.assertEqual(requested, [HEADINGS[0]])
+
+    def test_progress_callback_can_stop_the_report(self):
+        class Stop(Exception):
+            pass
+
+        def on_progress(text):
+            if text.startswith("## "):
+                raise Stop()
+
+        with self.assertRaises(Stop):
+            generate_report_sections("# Report", HEADINGS, lambda heading: f"{heading}\nok", on_progress=on_progress)
+
+    def test_section_prompt_keeps_shared_evidence_and_names_one_section(self):
+        prompt = section_prompt("Evidence block", HEADINGS[1])
+
+        self.assertTrue(prompt.startswith("Evidence block"))
+        self.assertTrue(prompt.endswith(HEADINGS[1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
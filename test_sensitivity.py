@@ -0,0 +1,64 @@
+import unittest
+from unittest import mock
+
+import sensitivity
+from business_logic import calculate_open_store_feasibility
+from sensitivity import analyze_feasibility_sensitivity
+from test_business_logic import LAUNCH, PRICING, PROFILE, SITE
+
+
+class SensitivityTests(unittest.TestCase):
+    def test_all_perturbations_are_scored_in_one_batch(self):
+        with mock.patch.object(
+            sensitivity,
+            "calculate_open_store_feasibility_batch",
+            wraps=sensitivity.calculate_open_store_feasibility_batch,
+        ) as batch:
+            result = analyze_feasibility_sensitivity(PROFILE, SITE, LAUNCH, PRICING, steps=21)
+
+        self.assertEqual(batch.call_count, 1)
+        self.assertEqual(len(result["tornado"]), len(sensitivity.SENSITIVITY_INPUTS))
+        swings = [row["swing"] for row in result["tornado"]]
+        self.assertEqual(swings, sorted(swings, reverse=True))
+
+    def test_curves_match_the_scalar_calculation(self):
+        result = analyze_feasibility_sensitivity(
+            PROFILE, SITE, LAUNCH, PRICING, inputs=["monthly_fixed_cost_estimate"], steps=9
+        )
+        curve = result["curves"]["monthly_fixed_cost_estimate"]
+        for value, score, decision in zip(curve["values"], curve["overall_score"], curve["decision"]):
+            expected = calculate_open_store_feasibility(
+                PROFILE, SITE, {**LAUNCH, "monthly_fixed_cost_estimate": value}, PRICING
+            )
+            self.assertEqual(score, expected["overall_score"])
+            self.assertEqual(decision, expected["decision"])
+
+    def test_reports_decision_flip_thresholds(self):
+        result = analyze_feasibility_sensitivity(PROFILE, SITE, LAUNCH, PRICING, spread_pct=60)
+        fixed_cost_flips = [flip for flip in result["flips"] if flip["input"] == "monthly_fixed_cost_estimate"]
+        self.assertTrue(fixed_cost_flips)
+        flip = fixed_cost_flips[0]
+        self.assertLess(flip["from_value"], flip["to_value"])
+        self.assertNotEqual(flip["from_decision"], flip["to_decision"])
+
+    def test_count_inputs_use_an_integer_grid(self):
+        site = {**SITE, "traffic": 50000, "competitors": 9}
+        result = analyze_feasibility_sensitivity(
+            PROFILE, site, LAUNCH, PRICING, inputs=["competitors"], spread_pct=60, steps=41
+        )
+        values = result["curves"]["competitors"]["values"]
+
+        self.assertEqual(values, list(range(4, 15)))
+        self.assertTrue(all(type(value) is int for value in values))
+        flips = result["flips"]
+        self.assertEqual([(flip["from_value"], flip["to_value"]) for flip in flips], [(6, 7)])
+        expected = calculate_open_store_feasibility(PROFILE, {**site, "competitors": 7}, LAUNCH, PRICING)
+        self.assertEqual(flips[0]["to_decision"], expected["decision"])
+
+    def test_rejects_unknown_inputs(self):
+        with self.assertRaises(ValueError):
+            analyze_feasibility_sensitivity(PROFILE, SITE, LAUNCH, PRICING, inputs=["budget"])
+
+
+if __name__ == "__main__":
+    unittest.main()
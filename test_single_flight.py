@@ -0,0 +1,116 @@
+import threading
+import unittest
+
+from single_flight import SingleFlight
+
+
+class SingleFlightTests(unittest.TestCase):
+    def run_concurrently(self, flight, key, fn, callers):
+        results = [None] * callers
+        errors = [None] * callers
+
+        def call(index):
+            try:
+                results[index] = flight.do(key, fn)
+            except Exception as error:
+                errors[index] = error
+
+        threads = [threading.Thread(target=call, args=(index,)) for index in range(callers)]
+        for thread in threads:
+            thread.start()
+        return threads, results, errors
+
+    def wait_for_waiters(self, flight, key, count):
+        for _ in range(1000):
+            if flight.waiters(key) == count:
+                return
+            threading.Event().wait(0.005)
+        self.fail(f"expected {count} waiters, saw {flight.waiters(key)}")
+
+    def test_concurrent_identical_calls_share_one_execution(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def lookup():
+            calls.append(1)
+            release.wait(5)
+            return {"lat": 30.25}
+
+        threads, results, errors = self.run_concurrently(flight, ("geocode", "austin|6"), lookup, 5)
+        self.wait_for_waiters(flight, ("geocode", "austin|6"), 4)
+        self.assertEqual(flight.stats()["in_flight"], {("geocode", "austin|6"): 4})
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"lat": 30.25}] * 5)
+        self.assertEqual(errors, [None] * 5)
+        self.assertEqual(flight.stats(), {"executed": 1, "shared": 4, "errors": 0, "in_flight": {}})
+
+    def test_errors_are_shared_with_waiters(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def lookup():
+            release.wait(5)
+            raise TimeoutError("overpass timed out")
+
+        threads, results, errors = self.run_concurrently(flight, "traffic", lookup, 3)
+        self.wait_for_waiters(flight, "traffic", 2)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(all(isinstance(error, TimeoutError) for error in errors))
+        self.assertEqual(flight.stats()["errors"], 1)
+
+    def test_calls_after_completion_run_again(self):
+        flight = SingleFlight()
+        values = iter([1, 2])
+
+        self.assertEqual(flight.do("key", lambda: next(values)), 1)
+        self.assertEqual(flight.do("key", lambda: next(values)), 2)
+        self.assertEqual(flight.waiters("key"), 0)
+
+    def test_different_keys_do_not_wait_on_each_other(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        threads, _, _ = self.run_concurrently(flight, "slow", lambda: release.wait(5), 1)
+        self.wait_for_waiters(flight, "slow", 0)
+
+        self.assertEqual(flight.do("fast", lambda: "done"), "done")
+        release.set()
+        for thread in threads:
+            thread.join()
+
+    def test_interrupted_leader_makes_a_waiter_retry(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        class Interrupted(BaseException):
+            pass
+
+        def leader_fn():
+            calls.append("leader")
+            release.wait(5)
+            raise Interrupted()
+
+        leader = threading.Thread(target=lambda: self.assertRaises(Interrupted, flight.do, "key", leader_fn))
+        leader.start()
+        while not calls:
+            threading.Event().wait(0.005)
+        threads, results, _ = self.run_concurrently(flight, "key", lambda: calls.append("waiter") or "fresh", 1)
+        self.wait_for_waiters(flight, "key", 1)
+        release.set()
+        for thread in [leader, *threads]:
+            thread.join()
+
+        self.assertEqual(results, ["fresh"])
+        self.assertEqual(calls, ["leader", "waiter"])
+
+
+if __name__ == "__main__":
+    unittest.main()
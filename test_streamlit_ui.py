@@ -23,6 +23,31 @@ class DanielFollowUpUITests(unittest.TestCase):
             any("Fix the input errors" in caption.value for caption in self.app.caption)
         )
 
+    def test_price_optimization_handles_a_competitor_price_below_cost(self):
+        self._go_to_budget_page()
+        self.app.number_input(key="open_competitor_price_widget").set_value(1.0).run()
+
+        self.assertFalse(self.app.exception)
+        self.assertTrue(any("anchored on unit cost" in caption.value for caption in self.app.caption))
+
+    def test_boundary_profit_maximum_is_not_offered_as_a_price(self):
+        self._go_to_budget_page()
+        self.app.selectbox[[box.label for box in self.app.selectbox].index("Price Sensitivity")].set_value("Low").run()
+
+        self.assertFalse(self.app.exception)
+        self.assertFalse([button for button in self.app.button if button.key == "open_use_optimal_price_btn"])
+        self.assertTrue(any("no profit-maximizing price in range" in warning.value for warning in self.app.warning))
+
+    def test_pricing_change_reports_the_affected_components(self):
+        self._go_to_budget_page()
+        self.app.number_input(key="open_competitor_price_widget").set_value(30.0).run()
+
+        self.assertFalse(self.app.exception)
+        self.assertIn(
+            "Updated by the last change: Pricing, Overall score and decision, Risks",
+            [caption.value for caption in self.app.caption],
+        )
+
     def test_scoring_explanation_reports_no_errors_for_valid_inputs(self):
         self._go_to_budget_page()
         self.app.button(key="open_store_next_btn").click().run()